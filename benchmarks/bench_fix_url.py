@@ -0,0 +1,85 @@
+# Micro-benchmark for the href repair done by CovidNewsSpider.fix_url()
+#
+# Command (from the repository root) :
+#
+# `python -m benchmarks.bench_fix_url`
+#
+# Builds a synthetic listing-page workload (the same nav/footer hrefs repeated on every
+# page, plus unique article links and the typo'd hrefs fix_url() exists for), checks that
+# UrlRepair gives exactly the same output as the original chain of re.sub() calls, then
+# prints the throughput of both in hrefs per second.
+
+import random
+import time
+
+from benchmarks.legacy import fix_url
+from covidnews.url_repair import UrlRepair
+
+
+PAGES = 200
+UNIQUE_LINKS_PER_PAGE = 40
+
+NAV_LINKS = [
+    '/', '/singapore', '/asia', '/world', '/business', '/sport', '/lifestyle', '/about-us',
+    '/contact-us', '/terms-and-conditions', '/privacy-policy', '#', 'javascript:void(0)',
+    'https://www.facebook.com/channelnewsasia', 'https://twitter.com/channelnewsasia',
+    'https://www.straitstimes.com/singapore', 'https://www.straitstimes.com/asia',
+]
+
+TYPO_LINKS = [
+    'htps://www.straitstimes.com/singapore/health/covid-19-cases',
+    'ttps://newsinfo.inquirer.net/1456244/covid-vaccine',
+    '://www.thestar.com.my/news/nation',
+    'https://https://www.nst.com.my/news/nation',
+    'http://(https://www.bangkokpost.com/thailand/general',
+    'https://ww.channelnewsasia.com/singapore/covid-19',
+    'https://www..thejakartapost.com/indonesia',
+    'https://wwww.khmertimeskh.com/501234567/covid',
+    'https://taff.straitstimes.com/singapore/covid',
+    'https://usiness.inquirer.net/123456/pandemic',
+    'https://www.newsinfo.inquirer.net/1456244/vaccine',
+    'https://events@thestar.com.my/covid-forum',
+    'http://link%20to%20microsite%20https://www.straitstimes.com/multimedia',
+]
+
+
+def build_workload(seed=0):
+    rng = random.Random(seed)
+    hrefs = []
+
+    for page in range(PAGES):
+        hrefs.extend(NAV_LINKS)
+        hrefs.extend(f"/singapore/covid-19-article-{page}-{i}" for i in range(UNIQUE_LINKS_PER_PAGE))
+        hrefs.extend(rng.sample(TYPO_LINKS, 3))
+
+    default_url = 'https://www.channelnewsasia.com/'
+    return [(href, default_url) for href in hrefs]
+
+
+def throughput(function, workload):
+    start = time.perf_counter()
+    for href, default_url in workload:
+        function(href, default_url)
+    elapsed = time.perf_counter() - start
+
+    return len(workload) / elapsed
+
+
+def main():
+    workload = build_workload()
+
+    url_repair = UrlRepair()
+    mismatches = [(href, default_url) for href, default_url in workload
+                  if fix_url(href, default_url) != url_repair.repair(href, default_url)]
+
+    if mismatches:
+        raise SystemExit(f"UrlRepair differs from the original fix_url() for {len(mismatches)} hrefs, e.g. {mismatches[0]}")
+
+    print(f"{len(workload)} hrefs, {len(set(workload))} distinct")
+    print(f"original fix_url()  : {throughput(fix_url, workload):12,.0f} hrefs/s")
+    print(f"UrlRepair, no memo  : {throughput(UrlRepair(cache_size=0).repair, workload):12,.0f} hrefs/s")
+    print(f"UrlRepair, memoized : {throughput(UrlRepair().repair, workload):12,.0f} hrefs/s")
+
+
+if __name__ == '__main__':
+    main()
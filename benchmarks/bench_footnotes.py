@@ -0,0 +1,81 @@
+# Equivalence check and throughput benchmark for CovidNewsSpider.remove_footnote()
+#
+# Command (from the repository root) :
+#
+# `python -m benchmarks.bench_footnotes`
+#
+# Runs the original sliding-window implementation (benchmarks/legacy.py) and
+# covidnews.footnotes on every article body of the saved corpus, fails if any output
+# differs, then prints the throughput of both in KB per second. The "divergences" of the
+# corpus are the bodies where the output differs on purpose, each with its expected output.
+
+import json
+import os
+import time
+
+from benchmarks.legacy import remove_footnote as legacy_remove_footnote
+from covidnews.footnotes import remove_footnote
+
+
+CORPUS_FILENAME = os.path.join(os.path.dirname(__file__), 'data', 'footnote_corpus.json')
+
+REPEAT = 5
+
+
+def outcome(function, body):
+    # the original implementation can end in RecursionError, which has to be reproduced as well
+    try:
+        return function(body)
+    except RecursionError:
+        return RecursionError
+
+
+def load_corpus(filename=CORPUS_FILENAME):
+    # (bodies, divergences)
+    with open(filename, encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    return corpus['bodies'], corpus['divergences']
+
+
+def mismatches(corpus, divergences):
+    # Bodies where covidnews.footnotes does not give the same output as the original, or not the expected one
+    different = [body for body in corpus if outcome(legacy_remove_footnote, body) != outcome(remove_footnote, body)]
+
+    for divergence in divergences:
+        # 'original' is the exception the original implementation ends with
+        if getattr(outcome(legacy_remove_footnote, divergence['body']), '__name__', None) != divergence['original'] or \
+           outcome(remove_footnote, divergence['body']) != divergence['expected']:
+            different.append(divergence['body'])
+
+    return different
+
+
+def throughput(function, corpus):
+    size_kb = sum(len(body) for body in corpus) * REPEAT / 1024
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for body in corpus:
+            outcome(function, body)
+    elapsed = time.perf_counter() - start
+
+    return size_kb / elapsed
+
+
+def main():
+    corpus, divergences = load_corpus()
+
+    different = mismatches(corpus, divergences)
+    if different:
+        raise SystemExit(f"covidnews.footnotes differs from the original remove_footnote() for {len(different)} bodies, e.g. {different[0][:200]!r}")
+
+    changed = sum(outcome(remove_footnote, body) != body for body in corpus)
+    print(f"{len(corpus)} bodies, {changed} with a footnote removed, same output as the original, "
+          f"{len(divergences)} documented divergences")
+    print(f"original remove_footnote() : {throughput(legacy_remove_footnote, corpus):10,.0f} KB/s")
+    print(f"covidnews.footnotes        : {throughput(remove_footnote, corpus):10,.0f} KB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# Benchmark for the caption and media credit stripping done by CovidNewsSpider.remove_media_credit()
+#
+# Command (from the repository root) :
+#
+# `python -m benchmarks.bench_text_cleanup`
+#
+# archive.org full-text bodies are OCR output, up to several MB, often with very few
+# newlines. This prints the time per KB of the original chain of re.sub() and of
+# covidnews.text_cleanup on such bodies of growing size : the former grows with the
+# body size (quadratic), the latter should stay flat.
+
+import random
+import time
+
+from benchmarks.legacy import remove_media_credit as legacy_remove_media_credit
+from covidnews.text_cleanup import remove_media_credit
+
+
+# The original implementation is quadratic, do not wait for it on larger bodies
+LEGACY_MAX_KB = 8
+
+SIZES_KB = [1, 2, 4, 8, 64, 512, 4096]
+
+WORDS = (
+    "the ministry of health said on monday that the number of covid cases in the community "
+    "rose again as the pandemic entered its third year and vaccination centres extended hours "
+    "for booster shots while hospitals reported fewer patients in intensive care units"
+).split()
+
+CAPTIONS = [
+    "(Photo by a staff photographer)",
+    "A healthcare worker prepares a vaccine dose. INQUIRER PHOTO / JOHN DOE",
+    "(AP Photo/Jane Doe)",
+    "Commuters wearing face masks. REUTERS/Edgar Su",
+    "WATCH THE LIVESTREAM HERE:",
+]
+
+
+def build_body(size_kb, newline_every_words, seed=0):
+    rng = random.Random(seed)
+    words = []
+    length = 0
+
+    while length < size_kb * 1024:
+        if rng.random() < 0.005:
+            word = rng.choice(CAPTIONS)
+        else:
+            word = rng.choice(WORDS)
+
+        if newline_every_words and len(words) % newline_every_words == newline_every_words - 1:
+            word += '\n'
+
+        words.append(word)
+        length += len(word) + 1
+
+    return ' '.join(words)
+
+
+def time_per_kb(function, body, size_kb):
+    start = time.perf_counter()
+    function(body)
+    return (time.perf_counter() - start) / size_kb * 1e6
+
+
+def main():
+    for layout, newline_every_words in (('no newline', 0), ('paragraphs', 80)):
+        print(f"{layout} :")
+
+        for size_kb in SIZES_KB:
+            body = build_body(size_kb, newline_every_words)
+            line = f"  {size_kb:5d} KB : text_cleanup {time_per_kb(remove_media_credit, body, size_kb):10.1f} us/KB"
+
+            if size_kb <= LEGACY_MAX_KB:
+                line += f" , original {time_per_kb(legacy_remove_media_credit, body, size_kb):12.1f} us/KB"
+
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,457 @@
+# Reference copies of the spider helpers as they were before being optimized
+#
+# Only used by the scripts in this folder, to check that the optimized versions
+# still give exactly the same output.
+
+import re
+from urllib.parse import urljoin
+
+
+def fix_url(url, default_url='https://www.example.com/'):
+    # print(f"Before fix_url(), url : {url}")
+
+    # Remove repeated protocols
+    url = re.sub(r'^http://link%20to%20microsite%20', '', url)
+    url = re.sub(r"https?://https?://", "https://", url)
+    url = re.sub(r"https?://\(https?:?//?", "https://", url)
+    url = re.sub(r"https?://ttps?//?", "https://", url)
+    url = re.sub(r'^http://%22https/', 'https:/', url)
+    url = re.sub(r'^https?https?://', 'https://', url)
+    url = re.sub(r'^https?://www.https?/', 'https://', url)
+    url = re.sub(r'^https?://www.straitsthttps?/', 'https://', url)
+
+    # Fix common typo in domain name
+    url = re.sub(r"^htps?://", "https://", url)
+    url = re.sub(r"^tps?://", "https://", url)
+    url = re.sub(r"^ps?://", "https://", url)
+    url = re.sub(r"^s?://", "https://", url)
+    url = re.sub(r"^.*https?://", "https://", url)
+    url = re.sub(r"^ttps?://", "https://", url)
+    url = re.sub(r"https://ww\.", "https://www.", url)
+    url = re.sub(r"https?://www\.\.", "https://www.", url)
+    url = re.sub(r'^https?://wwww', 'https://www', url)
+    url = re.sub(r"https?://taff\.straitstimes\.com/", "https://www.straitstimes.com/", url)
+    url = re.sub(r"https?://wwwf\.straitstimes\.com/", "https://www.straitstimes.com/", url)
+    url = re.sub(r"https?://wwwstraitstimes\.com/", "https://www.straitstimes.com/", url)
+    url = re.sub(r"https?://lifestyle\.inq@inquirer\.net", "https://lifestyle.inquirer.net", url)
+    url = re.sub(r"https?://usiness\.inquirer\.net", "https://business.inquirer.net", url)
+    url = re.sub(r"https?://ebudailynews\.inquirer\.net", "https://cebudailynews.inquirer.net", url)
+    url = re.sub(r"https?://globnalnation\.inquirer\.net", "https://globalnation.inquirer.net", url)
+    url = re.sub(r"https?://www\.bandera\.inquirer\.net", "https://bandera.inquirer.net", url)
+    url = re.sub(r"https?://www\.newsinfo\.inquirer\.net", "https://newsinfo.inquirer.net", url)
+    url = re.sub(r"https?://nwsinfo\.inquirer\.net", "https://newsinfo.inquirer.net", url)
+    url = re.sub(r"https?://www\.cebudailynews\.inquirer\.net", "https://cebudailynews.inquirer.net", url)
+    url = re.sub(r"https?://events\@thestar\.com\.my/", "https://events.thestar.com.my/", url)
+
+    if not url.startswith("http"):
+        # print(f"default_url : {default_url}")
+        url = urljoin(default_url, url)
+
+    # Removes any whitespace characters
+    url = url.strip()
+
+    # print(f"After fix_url(), url : {url}")
+
+    # If the URL is fine, return it as is
+    return url
+
+
+def remove_media_credit(text):
+    text = re.sub(r"\([^()]*first of two parts[^()]*\)", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\([^()]*Second of two parts[^()]*\)", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\([^()]*pic[^()]*\)", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\(Image: .+?\)", "", text, flags=re.DOTALL)
+    text = re.sub(r"\(Photo.+?\)", "", text, flags=re.DOTALL)
+    text = re.sub(r".+?Photo from.+?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".+?Screenshot from.+?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".+?FIle photo.+?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r"\(AP Photo.+?\)", "", text, flags=re.DOTALL)
+    text = re.sub(r"\(File photo: .+?\)", "", text, flags=re.DOTALL)
+    text = re.sub(r"File photo of .+?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r"FILE-.+?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?file photo.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?File photo.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?FILE PHOTO.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?PHOTO:.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?PVL PHOTO.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?UAAP PHOTO.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?INQUIRER PHOTO.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?\/INQUIRER\.net.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?PHOTO FROM.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?REUTERS\/.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r".*?CONTRIBUTED PHOTO.*?\n", "", text, flags=re.DOTALL)
+    text = re.sub(r"FILE PHOTO-.+?", "", text, flags=re.DOTALL)
+    text = re.sub(r"FILE PHOTO: .+?File Photo", "", text, flags=re.DOTALL)
+
+    text = re.sub(r"WATCH THE LIVESTREAM HERE:", "", text, flags=re.DOTALL)
+    text = re.sub(r"Watch the full speech:", "", text, flags=re.DOTALL)
+    return text
+
+
+def remove_footnote(text, window_size=3, previous_search_footnote_phrase=None):
+    # cleans up some strange character
+    text = text.replace('\xa0', ' ')
+    text = text.replace('<200b>', ' ')
+
+    # splits into multiple tokens using newline characters
+    lines = text.split('\n')
+    lines = [l.strip() for l in lines]
+
+    # list of phrases to search for
+    search_phrases = [
+        "join st's telegram channel",
+        "join st's whatsapp channel",
+        "download our app",
+        "read this story in",
+        "is an editor at",
+        "is a journalist at",
+        "is a journalist based in",
+        "is a senior journalist at",
+        "is associate fellow",
+        "is a phd candidate",
+        "is a doctoral candidate",
+        "is Research Fellow",
+        "is Associate Professor",
+        "is an associate professor",
+        "is Professor",
+        "is a lecturer",
+        "is a senior lecturer",
+        "is Dean of",
+        "is the Dean of",
+        "Senior Research Associate",
+        "Note:",
+        "Editor's note",
+        "Editor’s Note:",
+        "Editorial note:",
+        "Correction note:",
+        "Clarification note:",
+        "Terence Fernandez is a",
+        "Brian Martin is the managing editor of The Star",
+        "About the author:",
+        "(Author:",
+        "(Author :",
+        "(Authors:",
+        "(Authors :",
+        "(Reporter:",
+        "(Reporter :",
+        "(Reporters:",
+        "(Reporters :",
+        "(Writer:",
+        "(Writer :",
+        "(Writers:",
+        "(Writers :",
+        "(Editor:",
+        "(Editor :",
+        "(Editors:",
+        "(Editors :",
+        "(Writer & Editor:",
+        "(Writer & Editor :",
+        "(Writers & Editors:",
+        "(Writers & Editors :",
+        "(Author/Editor:",
+        "(Author/Editor :",
+        "(Authors/Editors:",
+        "(Authors/Editors :",
+        "The article was edited",
+        "This article was first published",
+        "This story was produced",
+        "The story has been updated",
+        "This story has been updated",
+        "This article has been updated",
+        "this article originally appear",
+        "This story came from",
+        "© The New York Times",
+        "© 2023 the new york times",
+        "© The Financial Times",
+        "© 2021 The Financial Times",
+        "© 2022 The Financial Times",
+        "© 2023 The Financial Times",
+        "©2020 Bloomberg",
+        "©2021 Bloomberg",
+        "©2022 Bloomberg",
+        "©2020 Project Syndicate",
+        "©2021 Project Syndicate",
+        "©2022 project syndicate",
+        "©1995-2022 Project Syndicate",
+        "©Project Syndicate",
+        "Project Syndicate",
+        "©2022",
+        "© 2022",
+        "©2021",
+        "© 2021",
+        "©2020",
+        "© 2020",
+        "© 2016 - 2024 PT. Bina Media Tenggara",
+        "©CNN",
+        "TSB",
+        "lzb",
+        "/lzb",
+        "[atm]",
+        "/atm",
+        "Sources: Reuters",
+        "(Source: AP)",
+        "(Reporting by",
+        "(by Xinhua writer",
+        "(Additional reporting by",
+        "Additional reporting by",
+        "Edited by",  # Comment this out for manual scraping due to truncated words for "accrEdited by"
+        "Produced by:",
+        "Brought to you by",
+        "WITH REPORT FROM", "—REPORTS FROM",
+        "—With a report from", "—WITH REPORTS FROM",
+        "— By YEE XIANG YUN", "— By M. SIVANANTHA SHARMA", "— By FARID WAHAB", "— By ANDY CHUA",
+        "— By REBECCA RAJAENDRAM",
+        "— By GRACE CHEN", "— By PAUL GABRIEL", "— By JEREMY TAN", "— By IMRAN HILMY", "— By SANDHYA MENON",
+        "—Jerome",
+        "–Jaime Laude",
+        "—Julie",
+        "–Helen Flores",
+        "–Elizabeth Marcelo",
+        "—MA. APRIL MIER-MANJARES",
+        "—Jovic",
+        "—JOANNA",
+        "—JUN A. MALIG",
+        "—DONA",
+        "—Nikka",
+        "–Rudy Santos",
+        "—Leila B. Salaverria",
+        "—NESTLE SEMILLA",
+        "—NESTOR",
+        "—Patricia",
+        "—Tina",
+        "— Bella Perez-Rubio",
+        "— KHIRTHNADHEVI KUMAR",
+        "— Christian Deiparine",
+        "— Kaycee Valmonte with Agence France-Presse",
+        "- Jakarta Post",
+        "— Jakarta Post",
+        "– AP",
+        "- AFP",
+        "– AFP",
+        "— AFP",
+        "– dpa",
+        "- Reuters",
+        "— Reuters",
+        "– Reuters",
+        "- Bloomberg",
+        "– Bloomberg",
+        "— Bloomberg",
+        "- Bernama",
+        "– Bernama",
+        "— Bernama",
+        "-- Bernama",
+        "- Xinhua",
+        "— VNS", "VNS Copyrights 2012",
+        "-VNA", "./. VNA", "./.  VNA", "./.   VNA", "./.    VNA",
+        "- The Straits Times/ANN",
+        "– The Straits Times (Singapore)/Asia News Network",
+        "- The Nation Thailand/ANN",
+        "— The Nation Thailand/ANN",
+        "- Philippines Daily Inquirer/ANN",
+        "— Vietnam News",
+        "- Vietnam News/ANN",
+        "- Phnom Penh Post/ANN",
+        "– South China Morning Post",
+        "– Thomson Reuters Foundation",
+        "– Los Angeles Times/Tribune News Service",
+        "– Hartford Courant/Tribune News Service",
+        "– Bangkok Post, Thailand/Tribune News Service",
+        "– Khaleej Times, Dubai/Tribune News Service",
+        "C. Nika – AKP",
+        "C. Nika -AKP",
+        "Pheng Somany – AKP",
+        "Pheng Somany -AKP",
+        "Chea Vannak – AKP",
+        "Chea Vannak -AKP",
+        "Chea Vannak/AKP/KT",
+        "AKP-Lim Nary",
+        "bhf.org",
+        "Gavi.org",
+        "burs/",
+        "burs-",
+        "bangkok post/",
+        "CHINA DAILY/ANN",
+        "Khmer Times/Coventry Telegraph",
+        "Email karnjanak@bangkokpost.co.th",
+        "CONTACT: BANGKOK POST BUILDING",
+        "MCI (P)",
+        "[ac]",
+        "-- More to follow --",
+        "Click below to watch",
+        "Click here for more",
+        "Click here to read more",
+        "View More",
+        "READ:",
+        "READ MORE:",
+        "Read next",
+        "READ NEXT:",
+        "READ MORE HERE",
+        "Read more from",
+        "Read more stories",
+        "READ FULL STORY:",
+        "Read more Global Nation stories",
+        "More from South China Morning Post:",
+        ". Learn more about",
+        "For more news like this",
+        "For more information about",
+        "For the latest news from",
+        "Watch the full news",
+        "RELATED:",
+        "RELATED STORIES",
+        "RELATED STORY",
+        "RELATED VIDEO",
+        "TOPIC:",
+        "Reference:",
+        "Source:",
+        "Visit https://spoti.fi",
+        "catch the olympics games",
+        "cna women is a section on cna",
+        "Write to us at",
+        "Sign up for our daily",
+        "Subscribe now to",
+        ". Subscribe to",
+        "Already a subscriber?",
+        "Download the app and",
+        "We use cookies",
+        "Tags / Keywords:",
+        "By registering, you agree with",
+        "All letter writers must provide full name and address",
+        "All letter writers must provide a full name and address",
+        "To be updated with all the latest news and analyses daily.",
+        "For more news about the novel coronavirus click here",
+        "Follow INQUIRER.net",
+        "The Inquirer Foundation",
+        "The Cambodia Daily is",
+        "Philstar.com is one of the most ",
+        "Khmer Times is now available",
+        "ADVT",
+        "Best viewed on",
+        "Report it to us",
+        "COPYRIGHT ©",
+        "copyright© mediacorp 2023"
+    ]
+
+    # Initialize an empty buffer
+    buffer = []
+    """
+    all_buffer = []
+
+    for i, line in enumerate(lines):
+        all_buffer.append(line)
+        all_buffer_string = ' '.join(all_buffer).lower()
+    #print(f"inside remove_footnote(), all_buffer_string = {all_buffer_string}")
+    """
+
+    if previous_search_footnote_phrase:
+        search_phrases_in_lowercase = []
+        for search_phrase in search_phrases:
+            search_phrases_in_lowercase.append(search_phrase.lower())
+
+    for i, line in enumerate(lines):
+        # add line to buffer
+        buffer.append(line)
+
+        # ensure buffer doesn't exceed window size
+        if len(buffer) > window_size:
+            buffer.pop(0)
+
+        #print(f"inside remove_footnote(), buffer = {buffer}, i = {i}")
+
+        # Check if phrases are in the buffer
+        buffer_string = ' '.join(buffer).lower()
+        buffer_string_2 = ''.join(buffer).lower()
+        #print(f"inside remove_footnote(), buffer_string = {buffer_string}")
+
+        for phrase in search_phrases:
+            phrase = phrase.lower()
+
+            if previous_search_footnote_phrase:
+                previous_search_footnote_phrase_index = search_phrases_in_lowercase.index(previous_search_footnote_phrase)
+                current_search_footnote_phrase_index = search_phrases_in_lowercase.index(phrase)
+
+                if current_search_footnote_phrase_index < previous_search_footnote_phrase_index:
+                    continue
+
+            if phrase in buffer_string or phrase in buffer_string_2:
+                # Find the position of the phrase in the buffer string
+                if phrase in buffer_string:
+                    phrase_start = buffer_string.find(phrase)
+                elif phrase in buffer_string_2:
+                    phrase_start = buffer_string_2.find(phrase)
+
+                phrase_end = phrase_start + len(phrase)
+                #print(f"inside remove_footnote(), phrase = {phrase}, phrase_start = {phrase_start}, phrase_end = {phrase_end}")
+
+                # Determine which lines those positions correspond to in the buffer
+                line_lengths = [len(line) + 1 for line in buffer]  # +1 for '\n'
+                line_start_positions = [sum(line_lengths[:i]) for i in range(len(buffer))]
+                line_end_positions = [sum(line_lengths[:i+1]) for i in range(len(buffer))]
+                #print(f"inside remove_footnote(), line_lengths = {line_lengths}, line_start_positions = {line_start_positions}, line_end_positions = {line_end_positions}")
+
+                # Remove all lines that are part of the phrase
+                for start, end in list(zip(line_start_positions, line_end_positions)):
+                    #print(f"inside remove_footnote(), start = {start}, end = {end}")
+
+                    if start <= phrase_start < end or start < phrase_end <= end:
+                        phrase_is_located_at_this_buffer_index = line_start_positions.index(start)
+
+                        if buffer:  # Check if buffer is not empty before popping
+                            orig_buf_len = len(buffer)
+                            #print(f"inside remove_footnote(), before pop(), buffer = {buffer}")
+                            #print(f"inside remove_footnote(), before pop(), orig_buf_len = {orig_buf_len}, phrase_is_located_at_this_buffer_index = {phrase_is_located_at_this_buffer_index}")
+                            # pop() for 'line_with_the_footnote_phrase' only removes 1 single element, but not the subsequent elements
+                            line_with_the_footnote_phrase = buffer.pop(phrase_is_located_at_this_buffer_index)
+
+                            # removes subsequent element in 'buffer'
+                            for ws_i in range(phrase_is_located_at_this_buffer_index, len(buffer)):
+                                #print(f"inside remove_footnote(), before pop(), len(buffer) = {len(buffer)}, phrase_is_located_at_this_buffer_index = {phrase_is_located_at_this_buffer_index}, buffer = {buffer}")
+                                if phrase_is_located_at_this_buffer_index > 0:
+                                    removed_string_item = buffer.pop(ws_i)
+                                    #print(f"inside remove_footnote(), ws_i = {ws_i}, removed_string_item = {removed_string_item}")
+                                else:
+                                    #removed_string_item = buffer.pop(len(buffer)-ws_i-1)
+                                    buffer = []
+
+                            #print(f"inside remove_footnote(), after pop(), buffer = {buffer}")
+
+                            # Replace line in the original text with the modified line
+                            #print(f"inside remove_footnote(), line_with_the_footnote_phrase = {line_with_the_footnote_phrase}")
+                            line_without_the_footnote_phrase = line_with_the_footnote_phrase[:phrase_start-start]
+                            #print(f"inside remove_footnote(), line_without_the_footnote_phrase = {line_without_the_footnote_phrase}")
+
+                        else:
+                            break
+
+                        footnote_is_spread_across_multiple_buffer_items = \
+                            (len(phrase) > end - start) or \
+                            (phrase_end > end)
+
+                        #print(f"footnote_is_spread_across_multiple_buffer_items = {footnote_is_spread_across_multiple_buffer_items}, len({phrase}) = {len(phrase)}")
+
+                        # Remove the exact line containing footnote phrase as well as all other subsequent lines
+                        if phrase_is_located_at_this_buffer_index == 0:
+                            #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i-orig_buf_len+1}:] = {lines[i-orig_buf_len+1:]}")
+                            lines[i-orig_buf_len+1:] = ''
+                            #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i-orig_buf_len+1}:] = {lines[i-orig_buf_len+1:]}")
+                        else:
+                            if not footnote_is_spread_across_multiple_buffer_items:
+                                #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i}:] = {lines[i:]}")
+                                lines[i:] = ''
+                                #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i}:] = {lines[i:]}")
+                            else:
+                                #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i-len(buffer)}:] = {lines[i-len(buffer):]}")
+                                lines[i-len(buffer):] = ''
+                                #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i-len(buffer)}:] = {lines[i-len(buffer):]}")
+
+                        # Combines lines that have no footnote phrase
+                        lines.append(line_without_the_footnote_phrase)
+
+                        # Join the lines back into a single string
+                        cleaned_text = "\n".join(lines)
+                        #print(f"inside remove_footnote(), cleaned_text = {cleaned_text}")
+
+                        # to make sure ALL footnote phrases are removed completely
+                        return remove_footnote(cleaned_text, window_size=3, previous_search_footnote_phrase=phrase)
+
+    # return the original text if no footnote was found
+    return text
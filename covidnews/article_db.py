@@ -0,0 +1,167 @@
+# SQLite database of the scraped articles, with a full-text index over title and cleaned body
+#
+# Filled by covidnews.pipelines.SqlitePipeline. Articles are keyed by canonical url, so
+# a recrawl updates them in place, and articles_fts (FTS5, external content) is kept in
+# sync with the articles table by triggers.
+#
+# Command (from the repository root) :
+#
+# `python -m covidnews.article_db articles.sqlite3 vaccination --source CNA --year 2021`
+
+import argparse
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+from w3lib.url import canonicalize_url
+
+from covidnews.footnotes import remove_footnote
+from covidnews.text_cleanup import remove_media_credit
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        url TEXT PRIMARY KEY,
+        link TEXT,
+        title TEXT,
+        date TEXT,
+        published_timestamp INTEGER,
+        source TEXT,
+        body TEXT,
+        keyword_hit_count INTEGER,
+        title_keyword_counts TEXT,
+        body_keyword_counts TEXT,
+        scraped_at REAL NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS articles_by_source_and_time ON articles (source, published_timestamp);
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(title, body, content='articles', content_rowid='rowid');
+
+    CREATE TRIGGER IF NOT EXISTS articles_after_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts (rowid, title, body) VALUES (new.rowid, new.title, new.body);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_after_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_after_update AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+        INSERT INTO articles_fts (rowid, title, body) VALUES (new.rowid, new.title, new.body);
+    END;
+"""
+
+UPSERT = """
+    INSERT INTO articles (url, link, title, date, published_timestamp, source, body,
+                          keyword_hit_count, title_keyword_counts, body_keyword_counts, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (url) DO UPDATE SET
+        link = excluded.link,
+        title = excluded.title,
+        date = excluded.date,
+        published_timestamp = excluded.published_timestamp,
+        source = excluded.source,
+        body = excluded.body,
+        keyword_hit_count = excluded.keyword_hit_count,
+        title_keyword_counts = excluded.title_keyword_counts,
+        body_keyword_counts = excluded.body_keyword_counts,
+        scraped_at = excluded.scraped_at
+"""
+
+
+def connect(database):
+    # The shards of `scrapy shardcrawl` write to the same database, a batch waits for the others rather than failing
+    db = sqlite3.connect(database, timeout=30)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def body_text(item):
+    # The body without captions, credits and footnote, as written by write_to_local_data() ('clean_body'). Items
+    # without it (saved before, or not looked at) only carry the paragraphs as extracted, cleaned the same way here.
+    if 'clean_body' in item:
+        return item['clean_body']
+
+    body = item.get('body')
+
+    if isinstance(body, (list, tuple)):
+        body = '\n'.join(s.strip() for s in body).strip()
+
+    if body:
+        body = remove_footnote(remove_media_credit(body))
+
+    return body
+
+
+def item_row(item, scraped_at=None):
+    # Parameters of UPSERT for one item yielded by get_article_content()
+    return (
+        canonicalize_url(item['link']),
+        item['link'],
+        item.get('title'),
+        item.get('date'),
+        item.get('published_timestamp'),
+        item.get('source'),
+        body_text(item),
+        item.get('keyword_hit_count'),
+        json.dumps(item.get('title_keyword_counts')),
+        json.dumps(item.get('body_keyword_counts')),
+        scraped_at if scraped_at is not None else time.time(),
+    )
+
+
+def upsert_items(db, items):
+    scraped_at = time.time()
+    db.executemany(UPSERT, [item_row(item, scraped_at) for item in items])
+    db.commit()
+
+
+def search(db, query, source=None, year=None, limit=20):
+    # Best matching articles first, query uses the FTS5 syntax, e.g. 'vaccin*' or '"booster shot"'
+    sql = """
+        SELECT articles.link, articles.title, articles.date, articles.source
+        FROM articles_fts JOIN articles ON articles.rowid = articles_fts.rowid
+        WHERE articles_fts MATCH ?
+    """
+    parameters = [query]
+
+    if source is not None:
+        sql += " AND articles.source = ?"
+        parameters.append(source)
+
+    if year is not None:
+        sql += " AND articles.published_timestamp >= ? AND articles.published_timestamp < ?"
+        parameters.append(int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()))
+        parameters.append(int(datetime(year + 1, 1, 1, tzinfo=timezone.utc).timestamp()))
+
+    sql += " ORDER BY bm25(articles_fts) LIMIT ?"
+    parameters.append(limit)
+
+    return db.execute(sql, parameters).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over the articles database")
+    parser.add_argument('database')
+    parser.add_argument('query')
+    parser.add_argument('--source')
+    parser.add_argument('--year', type=int)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    db = connect(args.database)
+    started = time.perf_counter()
+    rows = search(db, args.query, args.source, args.year, args.limit)
+    elapsed = time.perf_counter() - started
+
+    for link, title, date, source in rows:
+        print(f"{source} | {date} | {title} | {link}")
+    print(f"{len(rows)} articles in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# Index of the articles already written to local files by write_to_local_data()
+#
+# Used by the incremental recrawl mode : parse_article() asks is_fresh() before scheduling
+# the Splash render of an article, so a nightly rerun only renders the new articles.
+#
+# Every written article gets one json line in the manifest (url, filename, date, body hash,
+# write time). Article files written before the manifest existed are picked up by scanning
+# the output directory, since their filename is derived from the url anyway.
+
+import hashlib
+import json
+import os
+import time
+
+
+MANIFEST_FILENAME = 'persisted_articles.jsonl'
+
+# Solution to OSError: [Errno 63] File name too long : Truncate the filename
+FILENAME_MAX_LENGTH = 255  # Adjust based on the filesystem's limits
+
+
+def article_filename(link, file_parent_directory=''):
+    # Create a unique filename for each URL by removing the 'http://', replacing '/' with '_', and adding '.html'
+    # Returns (filename, original_filename), they differ only when the latter had to be truncated
+    original_filename = file_parent_directory + link.replace('http://', '').replace('/', '_') + '.html'
+    return original_filename[:FILENAME_MAX_LENGTH], original_filename
+
+
+def body_hash(body):
+    return hashlib.sha1(body.encode('utf-8')).hexdigest()
+
+
+class ArticleIndex:
+    # filename -> {'link', 'filename', 'date', 'body_hash', 'written_at'}
+
+    def __init__(self, file_parent_directory='', force_refresh=False, max_age=None):
+        self.file_parent_directory = file_parent_directory
+        self.force_refresh = force_refresh
+        self.max_age = max_age
+
+        self.manifest_path = os.path.join(file_parent_directory or '.', MANIFEST_FILENAME)
+        self.entries = {}
+
+        self.load_manifest()
+        self.scan_directory()
+
+        print(f"ArticleIndex : {len(self.entries)} articles already persisted")
+
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return
+
+        with open(self.manifest_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # last line of a crawl that got killed while writing it
+                    continue
+
+                # later lines win, the file may have been rewritten by a forced refresh
+                if os.path.exists(entry['filename']):
+                    self.entries[entry['filename']] = entry
+
+    def scan_directory(self):
+        for directory_entry in os.scandir(self.file_parent_directory or '.'):
+            filename = self.file_parent_directory + directory_entry.name
+
+            if not directory_entry.name.endswith('.html') or filename in self.entries or not directory_entry.is_file():
+                continue
+
+            with open(filename, 'rb') as f:
+                content = f.read().decode('utf-8', 'replace')
+
+            self.entries[filename] = {
+                'link': None,
+                'filename': filename,
+                'date': None,
+                'body_hash': body_hash(content),
+                'written_at': directory_entry.stat().st_mtime,
+            }
+
+    def get(self, link):
+        return self.entries.get(article_filename(link, self.file_parent_directory)[0])
+
+    def is_fresh(self, link):
+        # True when the article is already on disk and the refresh policy does not ask for it again
+        if self.force_refresh:
+            return False
+
+        entry = self.get(link)
+        if entry is None:
+            return False
+
+        return self.max_age is None or time.time() - entry['written_at'] < self.max_age
+
+    def is_unchanged(self, link, body):
+        entry = self.get(link)
+        return entry is not None and entry['body_hash'] == body_hash(body)
+
+    def record(self, link, filename, date, body):
+        entry = {
+            'link': link,
+            'filename': filename,
+            'date': str(date) if date is not None else None,
+            'body_hash': body_hash(body),
+            'written_at': time.time(),
+        }
+        self.append(entry)
+
+    def touch(self, link):
+        # Fetched again and found unchanged, counts as written now so that max_age does not refetch it on every run
+        entry = self.get(link)
+        if entry is not None:
+            self.append(dict(entry, link=link, written_at=time.time()))
+
+    def append(self, entry):
+        self.entries[entry['filename']] = entry
+
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
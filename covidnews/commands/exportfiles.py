@@ -0,0 +1,68 @@
+# `scrapy exportfiles` : write the articles of the segment sink as one file per article
+#
+# Command (from the repository root) :
+#
+# `scrapy exportfiles --directory exported/`
+#
+# Same layout as ARTICLE_SINK = 'files' (see covidnews.sinks.FilePerArticleSink), from the
+# latest record of every article in ARTICLE_SEGMENT_DIRECTORY, one sub-directory per country.
+# The segments written by the shards of `scrapy shardcrawl` are found as well.
+
+import os
+import sys
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from covidnews.sinks import FilePerArticleSink, SegmentSink
+
+
+DEFAULT_SPIDER_NAME = 'covid_news_spider'
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+
+    def syntax(self):
+        return "[options] [spider]"
+
+    def short_desc(self):
+        return "Export the article segments as one file per article"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--segments", default=None,
+                            help="segment directory (default: ARTICLE_SEGMENT_DIRECTORY of the spider module)")
+        parser.add_argument("--directory", default='',
+                            help="directory receiving the article files (default: current directory)")
+
+    def run(self, args, opts):
+        if len(args) > 1:
+            raise UsageError()
+
+        spidercls = self.crawler_process.spider_loader.load(args[0] if args else DEFAULT_SPIDER_NAME)
+        segment_directory = opts.segments or getattr(sys.modules[spidercls.__module__], 'ARTICLE_SEGMENT_DIRECTORY', 'articles')
+
+        # articles/<country>/ or articles/shard-<i>-of-<N>/<country>/ after `scrapy shardcrawl`, the shards of a
+        # country are exported to the same directory. The segments of a single country directory can be exported as well.
+        partitions = sorted(directory for directory, _, filenames in os.walk(segment_directory) if 'index.sqlite3' in filenames)
+
+        for partition in partitions:
+            country = '' if os.path.samefile(partition, segment_directory) else os.path.basename(partition)
+            output_directory = os.path.join(opts.directory, country, '')
+            if output_directory:
+                os.makedirs(output_directory, exist_ok=True)
+
+            segments = SegmentSink(partition)
+            files = FilePerArticleSink(output_directory)
+            exported = 0
+
+            try:
+                for record in segments.records():
+                    if record['body'] is not None:
+                        files.write(record['link'], record['title'], record['date'], record['body'])
+                        exported += 1
+            finally:
+                segments.close()
+
+            print(f"exportfiles : {exported} articles exported from {partition}")
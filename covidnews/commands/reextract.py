@@ -0,0 +1,150 @@
+# `scrapy reextract` : run the article extraction again over the raw page store
+#
+# Command (from the repository root) :
+#
+# `scrapy reextract -o reextracted_articles.jsonl`
+#
+# Every page kept by the spider in RAW_PAGE_STORE_DIRECTORY (see covidnews.raw_store) goes
+# through get_article_content() again, so remove_media_credit(), remove_footnote(), the
+# date normalization and the relevance filter of write_to_local_data() all run with the
+# current code. Pages are spread over a multiprocessing pool, nothing is downloaded.
+# The stores of the shards of `scrapy shardcrawl` (raw_pages/shard-<i>-of-<N>/) are read as well.
+# The relevant articles are written as json lines to the output file, with the cleaned body
+# of write_to_local_data() as 'body' (see output_item()).
+
+import json
+import os
+import sys
+import time
+from email.utils import formatdate
+from multiprocessing import Pool
+
+from scrapy import Request
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.http import HtmlResponse
+
+from covidnews.raw_store import PAGES_FILENAME, RawPageStore
+
+
+DEFAULT_SPIDER_NAME = 'covid_news_spider'
+
+# Pages handed to a worker at a time
+CHUNK_SIZE = 64
+
+PROGRESS_EVERY = 10000
+
+
+# One spider per worker process, built by init_worker(), and one store per store directory
+worker_spider = None
+worker_stores = {}
+
+
+def store_directories(directory):
+    # The store itself, or the stores of every shard below it
+    return sorted(path for path, _, filenames in os.walk(directory) if PAGES_FILENAME in filenames)
+
+
+def init_worker(spidercls, verbose):
+    global worker_spider
+
+    if not verbose:
+        # the spider prints every title, date and body it looks at
+        sys.stdout = open(os.devnull, 'w')
+
+    # every country, the store keeps the pages of all the countries crawled so far
+    worker_spider = spidercls(offline=True, countries='all')
+
+
+def reextract_page(page):
+    # Returns (url, relevant items, all items, error)
+    try:
+        if page['store'] not in worker_stores:
+            worker_stores[page['store']] = RawPageStore(page['store'])
+
+        body = worker_stores[page['store']].get(page['content_hash'])
+
+        # fetch_time() reads the Date header, for dates like '5 hours ago'
+        request = Request(page['url'], meta=dict(page['meta']))
+        response = HtmlResponse(
+            page['url'],
+            body=body,
+            headers={'Date': formatdate(page['fetched_at'], usegmt=True)},
+            encoding=page.get('encoding') or 'utf-8',
+            request=request
+        )
+
+        items = [result for result in worker_spider.get_article_content(response) if isinstance(result, dict)]
+
+    except Exception as e:
+        return page['url'], [], 0, f"{type(e).__name__}: {e}"
+
+    relevant_items = [
+        item for item in items
+        if item.get('keyword_hit_count') and worker_spider.is_within_covid_period(item.get('published_timestamp'), item.get('link'))
+    ]
+
+    return page['url'], relevant_items, len(items), None
+
+
+def output_item(item):
+    # The item as written to the output file, the offline workers have no sink to write the cleaned body to
+    output = {key: value for key, value in item.items() if key != 'clean_body'}
+    output['body'] = item.get('clean_body')
+    return output
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+
+    def syntax(self):
+        return "[options] [spider]"
+
+    def short_desc(self):
+        return "Run the article extraction again over the raw page store, without crawling"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("-o", "--output", default="reextracted_articles.jsonl",
+                            help="json lines file receiving the relevant articles")
+        parser.add_argument("--store", default=None,
+                            help="raw page store directory (default: RAW_PAGE_STORE_DIRECTORY of the spider module)")
+        parser.add_argument("--processes", type=int, default=os.cpu_count(),
+                            help="number of worker processes (default: number of cores)")
+        parser.add_argument("--verbose", action="store_true",
+                            help="keep the print() output of the workers")
+
+    def run(self, args, opts):
+        if len(args) > 1:
+            raise UsageError()
+
+        spidercls = self.crawler_process.spider_loader.load(args[0] if args else DEFAULT_SPIDER_NAME)
+        store_directory = opts.store or getattr(sys.modules[spidercls.__module__], 'RAW_PAGE_STORE_DIRECTORY', 'raw_pages')
+
+        pages = [dict(page, store=directory) for directory in store_directories(store_directory)
+                 for page in RawPageStore(directory).pages()]
+        print(f"reextract : {len(pages)} pages in {store_directory}, {opts.processes} processes")
+
+        started = time.perf_counter()
+        extracted = relevant = errors = 0
+
+        with open(opts.output, 'w', encoding='utf-8') as output, \
+            Pool(opts.processes, initializer=init_worker, initargs=(spidercls, opts.verbose)) as pool:
+
+            for done, (url, relevant_items, num_items, error) in enumerate(pool.imap_unordered(reextract_page, pages, CHUNK_SIZE), 1):
+                if error:
+                    errors += 1
+                    print(f"reextract : {url} failed with {error}")
+
+                extracted += num_items
+                relevant += len(relevant_items)
+
+                for item in relevant_items:
+                    output.write(json.dumps(output_item(item), ensure_ascii=False) + '\n')
+
+                if done % PROGRESS_EVERY == 0:
+                    print(f"reextract : {done} / {len(pages)} pages, {done / (time.perf_counter() - started):.0f} pages/s")
+
+        elapsed = time.perf_counter() - started
+        print(f"reextract : {len(pages)} pages, {extracted} articles extracted, {relevant} relevant written to {opts.output}, "
+              f"{errors} errors, {elapsed:.1f}s ({len(pages) / elapsed if elapsed else 0:.0f} pages/s)")
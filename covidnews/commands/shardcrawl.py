@@ -0,0 +1,180 @@
+# `scrapy shardcrawl` : run the spider as several processes on one host
+#
+# Command (from the repository root) :
+#
+# `scrapy shardcrawl --shards 4 -a countries=sg,my,ph`
+#
+# Starts one `scrapy crawl` process per shard with `-a shard=i -a shards=N`, each crawling
+# its hash partition of the urls and handing the others over (see covidnews.sharding),
+# waits for all of them and prints one stats report merged from the stats of every
+# shard. The output of shard i goes to SHARD_STATS_DIRECTORY/shard-i.log.
+#
+# The shards of a run share a random token, given through the environment (not -a, which
+# any local user can read in the process list). When a shard stops before the others
+# (port already in use, crash), the others would wait for it forever, so they are
+# interrupted and close gracefully.
+
+import json
+import os
+import secrets
+import signal
+import subprocess
+import sys
+import time
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.utils.conf import arglist_to_dict
+
+from covidnews.sharding import SHARD_BASE_PORT, SHARD_BY, SHARD_STATS_DIRECTORY, SHARD_TOKEN_VARIABLE, finish_reason, \
+    merge_stats, stats_filename
+
+
+DEFAULT_SPIDER_NAME = 'covid_news_spider'
+
+# Stats printed first in the merged report
+REPORT_STATS = ('item_scraped_count', 'downloader/request_count', 'response_received_count',
+                'shard/handed_over', 'shard/received', 'elapsed_time_seconds', 'finish_reason')
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+
+    def syntax(self):
+        return "[options] [spider]"
+
+    def short_desc(self):
+        return "Run the spider as several processes, each crawling a hash partition of the urls"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--shards", type=int, default=os.cpu_count(),
+                            help="number of crawler processes (default: number of cores)")
+        parser.add_argument("--by", choices=('host', 'url'), default=None,
+                            help="partition the urls by domain name or by url (default: SHARD_BY setting)")
+        parser.add_argument("-a", dest="spargs", action="append", default=[], metavar="NAME=VALUE",
+                            help="set spider argument, passed on to every shard (may be repeated)")
+
+    def process_options(self, args, opts):
+        super().process_options(args, opts)
+        try:
+            opts.spargs = arglist_to_dict(opts.spargs)
+        except ValueError:
+            raise UsageError("Invalid -a value, use -a NAME=VALUE", print_help=False)
+
+    def shard_command(self, spider_name, shard, opts, shard_by, stats_directory):
+        command = [sys.executable, '-m', 'scrapy', 'crawl', spider_name,
+                   '-a', f"shard={shard}", '-a', f"shards={opts.shards}"]
+
+        for name, value in opts.spargs.items():
+            command += ['-a', f"{name}={value}"]
+
+        # -s of this command first, so that they reach every shard
+        for setting in opts.set:
+            command += ['-s', setting]
+
+        command += ['-s', f"SHARD_BY={shard_by}",
+                    '-s', f"SHARD_STATS_DIRECTORY={stats_directory}",
+                    '-s', f"HTTPCACHE_DIR={os.path.join(self.settings.get('HTTPCACHE_DIR'), f'shard-{shard}-of-{opts.shards}')}"]
+
+        # Partitioned by url, every shard downloads from every outlet, the per domain concurrency is split between them
+        if shard_by == 'url':
+            per_domain = max(1, self.settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN') // opts.shards)
+            command += ['-s', f"CONCURRENT_REQUESTS_PER_DOMAIN={per_domain}"]
+
+        return command
+
+    def wait(self, processes, stats_directory):
+        # Exit codes of the shards, once they have all exited
+        stopping = False
+
+        while True:
+            try:
+                exit_codes = [process.poll() for process in processes]
+                if None not in exit_codes:
+                    return exit_codes
+
+                stopped_early = [shard for shard, exit_code in enumerate(exit_codes)
+                                 if exit_code is not None and finish_reason(stats_directory, shard) != 'finished']
+
+                if stopped_early and not stopping:
+                    print(f"shardcrawl : shard {stopped_early[0]} stopped early ({finish_reason(stats_directory, stopped_early[0])}), "
+                          f"interrupting the others")
+                    for process in processes:
+                        if process.poll() is None:
+                            process.send_signal(signal.SIGINT)
+                    stopping = True
+
+                time.sleep(1)
+
+            except KeyboardInterrupt:
+                # Ctrl-C reaches the shards as well, they close gracefully, wait for them anyway
+                if not stopping:
+                    print("shardcrawl : interrupted, waiting for the shards to close")
+                stopping = True
+
+    def run(self, args, opts):
+        if len(args) > 1 or opts.shards < 1:
+            raise UsageError()
+
+        spider_name = args[0] if args else DEFAULT_SPIDER_NAME
+        shard_by = opts.by or self.settings.get('SHARD_BY', SHARD_BY)
+        stats_directory = self.settings.get('SHARD_STATS_DIRECTORY', SHARD_STATS_DIRECTORY)
+        base_port = self.settings.getint('SHARD_BASE_PORT', SHARD_BASE_PORT)
+
+        os.makedirs(stats_directory, exist_ok=True)
+        for shard in range(opts.shards):
+            if os.path.exists(stats_filename(stats_directory, shard)):
+                os.remove(stats_filename(stats_directory, shard))
+
+        print(f"shardcrawl : {opts.shards} shards of {spider_name}, by {shard_by}, ports {base_port} to {base_port + opts.shards - 1}")
+
+        started = time.perf_counter()
+        environment = dict(os.environ, **{SHARD_TOKEN_VARIABLE: secrets.token_hex(16)})
+        processes, logs = [], []
+
+        for shard in range(opts.shards):
+            logs.append(open(os.path.join(stats_directory, f"shard-{shard}.log"), 'w', encoding='utf-8'))
+            processes.append(subprocess.Popen(self.shard_command(spider_name, shard, opts, shard_by, stats_directory),
+                                              stdout=logs[-1], stderr=subprocess.STDOUT, env=environment))
+
+        exit_codes = self.wait(processes, stats_directory)
+
+        for log in logs:
+            log.close()
+
+        elapsed = time.perf_counter() - started
+        shard_stats = []
+
+        for shard, exit_code in enumerate(exit_codes):
+            filename = stats_filename(stats_directory, shard)
+
+            if not os.path.exists(filename):
+                print(f"shardcrawl : shard {shard} exited with {exit_code} without any stats, see {stats_directory}/shard-{shard}.log")
+                continue
+
+            with open(filename, encoding='utf-8') as f:
+                stats = json.load(f)
+            shard_stats.append(stats)
+
+            print(f"shardcrawl : shard {shard} exited with {exit_code}, {stats.get('item_scraped_count', 0)} items, "
+                  f"{stats.get('downloader/request_count', 0)} requests, {stats.get('shard/handed_over', 0)} handed over")
+
+        merged = merge_stats(shard_stats)
+
+        with open(os.path.join(stats_directory, 'stats.json'), 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+
+        print(f"shardcrawl : merged stats of {len(shard_stats)} shards, {elapsed:.0f}s, "
+              f"{merged.get('item_scraped_count', 0) / elapsed if elapsed else 0:.1f} items/s")
+
+        for key in REPORT_STATS:
+            if key in merged:
+                print(f"  {key} : {merged[key]}")
+
+        for key in sorted(merged):
+            if key not in REPORT_STATS:
+                print(f"  {key} : {merged[key]}")
+
+        if any(exit_codes):
+            self.exitcode = 1
@@ -0,0 +1,81 @@
+# Country profiles, one crawl covering several countries
+#
+# search_country, allowed_domain_names, start_urls and the covid periods used to be
+# module globals of the spider, chosen by editing the file, so covering the seven
+# countries meant seven runs one after the other, each paying its own startup. They are
+# now read from countries.yaml into one CountryProfile per country, and the spider
+# crawls every country selected with `-a countries=sg,my,ph` in the same process (one
+# reactor, one connection pool, one render backend). Every url is routed to its country
+# by the allowed domain names, which never overlap between countries, and each country
+# keeps its own date parsing, covid period, article output and stats.
+
+import os
+
+import yaml
+
+from covidnews.dates import COUNTRY_UTC_OFFSETS, DateNormalizer, period_bounds
+
+
+COUNTRY_PROFILES_FILENAME = os.path.join(os.path.dirname(__file__), 'countries.yaml')
+
+
+class CountryProfile:
+
+    def __init__(self, name, code, covid_period, allowed_domains, start_urls, search_start_urls=None):
+        self.name = name
+        self.code = code
+        self.covid_period = tuple(covid_period)
+        self.allowed_domains = list(allowed_domains)
+        self.start_urls = list(start_urls)
+        self.search_start_urls = list(search_start_urls or [])
+
+        self.date_normalizer = DateNormalizer(name)
+        self.set_covid_period(*self.covid_period)
+
+        # Set by the spider, per country output and pruning state
+        self.article_sink = None
+        self.prefetch_scorer = None
+        self.discovery = None
+
+    def set_covid_period(self, first_year, last_year):
+        # [start, end) timestamps, so that the covid period check is a plain integer comparison
+        self.covid_period_start, self.covid_period_end = period_bounds(first_year, last_year, COUNTRY_UTC_OFFSETS[self.name])
+
+    def is_within_covid_period(self, published_timestamp):
+        return published_timestamp is not None and self.covid_period_start <= published_timestamp < self.covid_period_end
+
+    def crawl_start_urls(self, search_entire_website):
+        if not search_entire_website and self.search_start_urls:
+            return self.search_start_urls
+        return self.start_urls
+
+
+def load_profiles(filename=COUNTRY_PROFILES_FILENAME):
+    # country name -> CountryProfile, in the order of the file
+    with open(filename, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    return {name: CountryProfile(name, **fields) for name, fields in config.items()}
+
+
+def select_profiles(profiles, countries):
+    # countries is 'sg,my,ph', or names, or a list of either, 'all' for every profile
+    if isinstance(countries, str):
+        countries = [country.strip() for country in countries.split(',') if country.strip()]
+
+    if countries == ['all']:
+        return list(profiles.values())
+
+    by_code = {profile.code: profile for profile in profiles.values()}
+    selected = []
+
+    for country in countries:
+        profile = profiles.get(country.lower()) or by_code.get(country.lower())
+
+        if profile is None:
+            raise ValueError(f"unknown country {country!r}, expected one of {', '.join(by_code)} or {', '.join(profiles)}")
+
+        if profile not in selected:
+            selected.append(profile)
+
+    return selected
@@ -0,0 +1,124 @@
+# Request priorities, listing depth budgets and scheduler backpressure
+#
+# In SEARCH_ENTIRE_WEBSITE mode parse() queues every `a::attr(href)` of a page as another
+# listing request, next to the article requests of parse_article(), all with the default
+# priority. The scheduler kept growing with nav, section and tag pages while the articles
+# already found waited behind them. CrawlPolicy gives every request a priority class :
+#   - PRIORITY_ARTICLE, article pages, what the crawl is for
+#   - PRIORITY_AMBIGUOUS_ARTICLE, article pages without any keyword known before the
+#     fetch, see covidnews.prefetch
+#   - PRIORITY_PAGINATION, the next page of a listing, which leads to more articles
+#   - PRIORITY_SECTION, any other link of a listing page, only explores the site
+# and decides which listing links are followed at all :
+#   - section links are followed at most max_listing_depth levels away from the start
+#     urls (DOMAIN_MAX_LISTING_DEPTHS per domain), following pagination does not count
+#   - at most max_pagination_links pagination links of one listing page are followed, a
+#     numbered pager ('1 2 3 ... 250') would otherwise queue every page of the listing
+#   - once the scheduler holds max_pending_requests requests, section and pagination links
+#     are dropped, articles still go through, so memory stays flat. The spider counts the
+#     requests it queues from a page on top of the scheduler size sampled for that page.
+#     Dropped links are not recorded by the url frontier, a later run finds them again.
+
+import re
+import time
+from collections import Counter
+
+
+PRIORITY_ARTICLE = 200
+PRIORITY_AMBIGUOUS_ARTICLE = 150
+PRIORITY_PAGINATION = 100
+PRIORITY_SECTION = 0
+
+LINK_CLASS_ARTICLE = 'article'
+LINK_CLASS_AMBIGUOUS_ARTICLE = 'ambiguous_article'
+LINK_CLASS_PAGINATION = 'pagination'
+LINK_CLASS_SECTION = 'section'
+
+LINK_CLASS_PRIORITIES = {
+    LINK_CLASS_ARTICLE: PRIORITY_ARTICLE,
+    LINK_CLASS_AMBIGUOUS_ARTICLE: PRIORITY_AMBIGUOUS_ARTICLE,
+    LINK_CLASS_PAGINATION: PRIORITY_PAGINATION,
+    LINK_CLASS_SECTION: PRIORITY_SECTION,
+}
+
+MAX_LISTING_DEPTH = 5
+
+# Outlets whose site hierarchy is shallower or deeper than MAX_LISTING_DEPTH
+DOMAIN_MAX_LISTING_DEPTHS = {
+}
+
+MAX_PENDING_REQUESTS = 20000
+
+# Pagination links followed per listing page
+MAX_PAGINATION_LINKS = 10
+
+# ?page=3, &p=3, /page/3, /page3, ?start=40 ...
+PAGINATION_PATTERN = re.compile(r'[?&](page|pg|p|paged|start|offset)=\d+|/page/?\d+/?$', re.IGNORECASE)
+
+
+class CrawlPolicy:
+
+    def __init__(self, max_listing_depth=MAX_LISTING_DEPTH, domain_max_listing_depths=None,
+                 max_pending_requests=MAX_PENDING_REQUESTS, max_pagination_links=MAX_PAGINATION_LINKS):
+        self.max_listing_depth = max_listing_depth
+        self.domain_max_listing_depths = DOMAIN_MAX_LISTING_DEPTHS if domain_max_listing_depths is None else domain_max_listing_depths
+        self.max_pending_requests = max_pending_requests
+        self.max_pagination_links = max_pagination_links
+
+        self.started_at = time.monotonic()
+        self.scheduled = Counter()
+        self.dropped = Counter()
+        self.articles = 0
+        self.renders = 0
+
+    def link_class(self, url, pagination_links=()):
+        # pagination_links are the hrefs matched by the pagination_selector of the outlet, if it has one
+        if url in pagination_links or PAGINATION_PATTERN.search(url):
+            return LINK_CLASS_PAGINATION
+        return LINK_CLASS_SECTION
+
+    def priority(self, link_class):
+        return LINK_CLASS_PRIORITIES[link_class]
+
+    def child_depth(self, link_class, depth):
+        return depth if link_class == LINK_CLASS_PAGINATION else depth + 1
+
+    def skip_reason(self, domain_name, link_class, depth, pending_requests, pagination_links_followed=0):
+        # Why a listing link of the given class, at the given depth, should not be followed, None to follow it.
+        # pagination_links_followed counts the pagination links already followed from the same listing page.
+        if link_class == LINK_CLASS_PAGINATION:
+            if pagination_links_followed >= self.max_pagination_links:
+                self.dropped['pagination_cap'] += 1
+                return 'pagination_cap'
+
+        elif depth > self.domain_max_listing_depths.get(domain_name, self.max_listing_depth):
+            self.dropped['depth_budget'] += 1
+            return 'depth_budget'
+
+        if pending_requests is not None and pending_requests >= self.max_pending_requests:
+            self.dropped['backpressure'] += 1
+            return 'backpressure'
+
+        return None
+
+    def record_scheduled(self, link_class):
+        self.scheduled[link_class] += 1
+
+    def record_render(self):
+        self.renders += 1
+
+    def record_article(self):
+        self.articles += 1
+
+    def summary(self):
+        hours = (time.monotonic() - self.started_at) / 3600
+        scheduled = ', '.join(f"{link_class} {count}" for link_class, count in self.scheduled.most_common())
+        dropped = ', '.join(f"{reason} {count}" for reason, count in self.dropped.most_common()) or 'none'
+
+        lines = [f"scheduled : {scheduled}", f"listing links dropped : {dropped}"]
+        if self.renders:
+            lines.append(f"{self.articles} articles for {self.renders} Splash renders, {self.articles / self.renders:.2f} per render")
+        if hours > 0:
+            lines.append(f"{self.articles / hours:.0f} articles per hour")
+
+        return '\n'.join(lines)
@@ -0,0 +1,150 @@
+# Date normalization behind CovidNewsSpider.write_to_local_data()
+#
+# Every scraped date string used to go through dateutil.parser.parse(), after about
+# 20 `"... ago" in date.lower()` checks that pinned every relative date to the year
+# 2023. DateNormalizer turns a raw date string into a UTC timestamp (seconds) :
+#   - relative dates ("5 hours ago", "2d ago") are resolved against the fetch time
+#   - absolute dates try ISO 8601, then the outlet's own strptime formats, then a few
+#     common formats, and only then dateutil
+#   - dates without a timezone are taken in the local time of the crawled country
+#   - results are memoized per raw string, since listing cards repeat the same dates
+# so the covid period check becomes a comparison between integers.
+
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+from dateutil.parser import parse
+
+
+# Local time of the outlets of each country, for dates that do not carry a timezone
+COUNTRY_UTC_OFFSETS = {
+    'singapore': 8,
+    'philippines': 8,
+    'malaysia': 8,
+    'vietnam': 7,
+    'thailand': 7,
+    'indonesia': 7,
+    'cambodia': 7,
+}
+
+# Tried for every outlet, after the outlet's own Extractor.date_formats
+COMMON_DATE_FORMATS = (
+    '%d %B %Y',
+    '%d %b %Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%B %d, %Y %I:%M %p',
+    '%b %d, %Y %I:%M %p',
+    '%d %B %Y %H:%M',
+    '%d %b %Y %H:%M',
+)
+
+RELATIVE_DATE_UNITS = {
+    's': 1, 'sec': 1, 'secs': 1, 'second': 1, 'seconds': 1,
+    'm': 60, 'min': 60, 'mins': 60, 'minute': 60, 'minutes': 60,
+    'h': 3600, 'hr': 3600, 'hrs': 3600, 'hour': 3600, 'hours': 3600,
+    'd': 86400, 'day': 86400, 'days': 86400,
+    'w': 7 * 86400, 'week': 7 * 86400, 'weeks': 7 * 86400,
+    'month': 30 * 86400, 'months': 30 * 86400,
+    'y': 365 * 86400, 'year': 365 * 86400, 'years': 365 * 86400,
+}
+
+RELATIVE_DATE_PATTERN = re.compile(
+    r"\b(\d+|an?|one)\s*(" + '|'.join(sorted(RELATIVE_DATE_UNITS, key=len, reverse=True)) + r")\s+ago\b",
+    re.IGNORECASE
+)
+
+# Anything that looks like "... ago" but has no amount we can read, e.g. "moments ago", counts as just published
+RELATIVE_DATE_MARKER = re.compile(r"\bago\b", re.IGNORECASE)
+
+
+def fetch_time(response):
+    # When the page was fetched, from the Date response header if there is one
+    http_date = response.headers.get('Date')
+
+    if http_date:
+        try:
+            return parsedate_to_datetime(http_date.decode('latin-1')).timestamp()
+        except (TypeError, ValueError):
+            pass
+
+    return datetime.now(timezone.utc).timestamp()
+
+
+def period_bounds(first_year, last_year, utc_offset):
+    # [start, end) timestamps of the years first_year to last_year in the given local time,
+    # last_year None means no upper bound
+    tz = timezone(timedelta(hours=utc_offset))
+    start = int(datetime(first_year, 1, 1, tzinfo=tz).timestamp())
+
+    if last_year is None:
+        return start, float('inf')
+
+    return start, int(datetime(last_year + 1, 1, 1, tzinfo=tz).timestamp())
+
+
+class DateNormalizer:
+    # timestamp() returns the UTC timestamp of a raw date string, or None if it cannot be read
+
+    def __init__(self, country, cache_size=65536):
+        self.local_timezone = timezone(timedelta(hours=COUNTRY_UTC_OFFSETS.get(country, 0)))
+
+        self.relative_seconds = lru_cache(maxsize=cache_size)(self._relative_seconds)
+        self.absolute_timestamp = lru_cache(maxsize=cache_size)(self._absolute_timestamp)
+
+    def _relative_seconds(self, raw_date):
+        # How long ago a relative date string is, or None if it is not relative
+        match = RELATIVE_DATE_PATTERN.search(raw_date)
+
+        if match:
+            amount, unit = match.groups()
+            amount = int(amount) if amount.isdigit() else 1
+            return amount * RELATIVE_DATE_UNITS[unit.lower()]
+
+        if RELATIVE_DATE_MARKER.search(raw_date):
+            return 0
+
+        return None
+
+    def _absolute_timestamp(self, raw_date, date_formats):
+        date = None
+
+        try:
+            date = datetime.fromisoformat(raw_date)
+        except ValueError:
+            pass
+
+        if date is None:
+            for date_format in date_formats + COMMON_DATE_FORMATS:
+                try:
+                    date = datetime.strptime(raw_date, date_format)
+                    break
+                except ValueError:
+                    continue
+
+        if date is None:
+            try:
+                date = parse(raw_date)
+            except (ValueError, OverflowError):
+                return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=self.local_timezone)
+
+        return int(date.timestamp())
+
+    def timestamp(self, raw_date, date_formats=(), fetched_at=None):
+        if not raw_date:
+            return None
+
+        raw_date = ' '.join(raw_date.split())
+
+        relative_seconds = self.relative_seconds(raw_date)
+        if relative_seconds is not None:
+            if fetched_at is None:
+                fetched_at = datetime.now(timezone.utc).timestamp()
+            return int(fetched_at) - relative_seconds
+
+        return self.absolute_timestamp(raw_date, tuple(date_formats))
@@ -0,0 +1,189 @@
+# Near-duplicate detection of article bodies across outlets
+#
+# Wire-service stories (Reuters, AFP, Bernama ...) are republished by several outlets of
+# the same country, and straitstimes serves some articles under more than one url, so the
+# same text used to be written (and later processed) once per copy. Every cleaned body now
+# gets a 64-bit SimHash of its word 3-grams, similar texts have fingerprints differing in a
+# few bits only. NearDuplicateIndex finds an earlier fingerprint within MAX_HAMMING_DISTANCE
+# bits without comparing against all of them :
+#   - the 64 bits are split into MAX_HAMMING_DISTANCE + 1 bands, two fingerprints this close
+#     have at least one identical band (pigeonhole), so only the fingerprints sharing a band
+#     value are compared
+#   - the bands are kept in memory, and rebuilt at startup from an sqlite table of
+#     (url, fingerprint), so duplicates of articles written by previous runs are found too
+
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from hashlib import blake2b
+
+
+NEAR_DUPLICATE_FILENAME = 'near_duplicates.sqlite3'
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# Republished copies differ by a dateline, an edited sentence or a footnote, which for a few hundred words
+# moves up to 6 bits or so, while unrelated texts differ by about 32 bits
+MAX_HAMMING_DISTANCE = 6
+
+# Bodies shorter than this have too few shingles for a meaningful fingerprint, they are never flagged
+MIN_WORDS = 50
+
+COMMIT_EVERY = 200
+
+WORD_PATTERN = re.compile(r'\w+')
+
+SIGN_BIT = 1 << (SIMHASH_BITS - 1)
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return [' '.join(words)] if words else []
+    return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text):
+    # Every shingle votes, with its number of occurrences, for or against each bit of its own hash
+    votes = [0] * SIMHASH_BITS
+
+    for shingle, count in Counter(shingles(text)).items():
+        h = int.from_bytes(blake2b(shingle.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), 'little')
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                votes[bit] += count
+            else:
+                votes[bit] -= count
+
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if votes[bit] > 0:
+            fingerprint |= 1 << bit
+
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+def word_count(text):
+    return len(WORD_PATTERN.findall(text))
+
+
+# sqlite integers are signed 64-bit
+
+def to_signed(fingerprint):
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint & SIGN_BIT else fingerprint
+
+
+def from_signed(value):
+    return value + (1 << SIMHASH_BITS) if value < 0 else value
+
+
+class NearDuplicateIndex:
+
+    def __init__(self, directory=None, max_distance=MAX_HAMMING_DISTANCE):
+        self.max_distance = max_distance
+        self.num_bands = max_distance + 1
+
+        # (shift, mask) of every band, as even as possible, e.g. 9 or 10 bits for 7 bands
+        boundaries = [round(band * SIMHASH_BITS / self.num_bands) for band in range(self.num_bands + 1)]
+        self.band_slices = [(start, (1 << (end - start)) - 1) for start, end in zip(boundaries, boundaries[1:])]
+
+        # one {band value: [url, ...]} per band, and the fingerprint of every url
+        self.bands = [{} for _ in range(self.num_bands)]
+        self.fingerprints = {}
+
+        self.pending_writes = 0
+        self.duplicates_found = 0
+
+        if directory is None:
+            self.db = None
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(directory, NEAR_DUPLICATE_FILENAME))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                url TEXT PRIMARY KEY,
+                simhash INTEGER NOT NULL,
+                added_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        for url, value in self.db.execute("SELECT url, simhash FROM fingerprints"):
+            self.index(url, from_signed(value))
+
+        print(f"NearDuplicateIndex : {len(self.fingerprints)} fingerprints loaded")
+
+    def band_values(self, fingerprint):
+        return [(fingerprint >> shift) & mask for shift, mask in self.band_slices]
+
+    def index(self, url, fingerprint):
+        self.fingerprints[url] = fingerprint
+        for band, value in enumerate(self.band_values(fingerprint)):
+            self.bands[band].setdefault(value, []).append(url)
+
+    def unindex(self, url):
+        fingerprint = self.fingerprints.pop(url)
+        for band, value in enumerate(self.band_values(fingerprint)):
+            urls = self.bands[band][value]
+            urls.remove(url)
+            if not urls:
+                del self.bands[band][value]
+
+    def find(self, fingerprint, exclude_url=None):
+        # url of the closest indexed fingerprint within max_distance bits, None if there is none
+        best_url, best_distance = None, self.max_distance + 1
+
+        for band, value in enumerate(self.band_values(fingerprint)):
+            for url in self.bands[band].get(value, ()):
+                if url == exclude_url:
+                    continue
+
+                distance = hamming_distance(fingerprint, self.fingerprints[url])
+                if distance < best_distance:
+                    best_url, best_distance = url, distance
+
+        return best_url
+
+    def add(self, url, fingerprint):
+        if url in self.fingerprints:
+            # the article changed since it was last written
+            self.unindex(url)
+        self.index(url, fingerprint)
+
+        if self.db is not None:
+            self.db.execute(
+                "INSERT OR REPLACE INTO fingerprints (url, simhash, added_at) VALUES (?, ?, ?)",
+                (url, to_signed(fingerprint), time.time())
+            )
+
+            self.pending_writes += 1
+            if self.pending_writes >= COMMIT_EVERY:
+                self.db.commit()
+                self.pending_writes = 0
+
+    def check(self, url, fingerprint):
+        # url of the article this one is a near-duplicate of, or None after adding it to the index
+        duplicate_of = self.find(fingerprint, exclude_url=url)
+
+        if duplicate_of is not None:
+            self.duplicates_found += 1
+            return duplicate_of
+
+        self.add(url, fingerprint)
+        return None
+
+    def close(self):
+        print(f"NearDuplicateIndex : {self.duplicates_found} near-duplicates found, {len(self.fingerprints)} fingerprints")
+
+        if self.db is not None:
+            self.db.commit()
+            self.db.close()
+            self.db = None
@@ -0,0 +1,137 @@
+# Sitemap and RSS discovery of article urls
+#
+# Search pages are forbidden by robots.txt on most outlets, so articles used to be found
+# by rendering the homepage and then every listing page reachable from it
+# (SEARCH_ENTIRE_WEBSITE), which takes days for the larger outlets. With
+# DISCOVERY_MODE = 'sitemaps' the spider instead downloads, without any Splash render :
+#   - robots.txt of every start url, for its `Sitemap:` entries
+#   - those sitemaps, sitemap indexes included, gzipped or not, one response at a time
+#   - the RSS / Atom feeds linked from the homepage <head>, and DOMAIN_FEED_URLS
+# and sends the article urls straight to get_article_content(). SitemapDiscovery keeps
+# out what the covid period rules out before any request is made :
+#   - a child sitemap last modified before the period, or named after a month or year
+#     outside it (sitemap-2019-05.xml, /sitemap/2018/)
+#   - an article url last modified before the period (lastmod is never earlier than the
+#     publication), or with a date in its path outside it
+
+import re
+from collections import Counter
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import feedparser
+from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils.sitemap import Sitemap, sitemap_urls_from_robots
+
+from covidnews.prefetch import PRUNE_MARGIN, url_path_date
+
+
+# Feeds not linked from the homepage, per domain name
+DOMAIN_FEED_URLS = {
+}
+
+FEED_LINK_SELECTOR = 'link[rel="alternate"][type="application/rss+xml"]::attr(href), ' \
+                     'link[rel="alternate"][type="application/atom+xml"]::attr(href)'
+
+# sitemap-2019-05.xml, sitemap_2019.xml, /sitemap/2019/05/ ...
+SITEMAP_DATE_PATTERN = re.compile(r'(?<!\d)((?:19|20)\d\d)(?:[-_/]?(0[1-9]|1[0-2]))?(?!\d)')
+
+
+def sitemap_period(url, tzinfo):
+    # [start, end) timestamps of the month or year a sitemap is named after, None if it is not
+    parts = urlsplit(url)
+    match = SITEMAP_DATE_PATTERN.search(parts.path + '?' + parts.query)
+    if match is None:
+        return None
+
+    year, month = int(match.group(1)), match.group(2)
+
+    if month is None:
+        return int(datetime(year, 1, 1, tzinfo=tzinfo).timestamp()), int(datetime(year + 1, 1, 1, tzinfo=tzinfo).timestamp())
+
+    month = int(month)
+    start = datetime(year, month, 1, tzinfo=tzinfo)
+    end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=tzinfo)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+def sitemap_body(response):
+    # xml of a sitemap response, gunzipped when the file itself is a .gz (not only the transfer), None if unreadable
+    if gzip_magic_number(response):
+        try:
+            return gunzip(response.body)
+        except (OSError, EOFError):
+            return None
+
+    return response.body
+
+
+def robots_sitemaps(response):
+    return list(sitemap_urls_from_robots(response.text, base_url=response.url))
+
+
+def feed_links(response):
+    return [response.urljoin(href) for href in response.css(FEED_LINK_SELECTOR).getall()]
+
+
+def feed_entries(body):
+    # (link, title, raw publication date) of every entry of an RSS or Atom feed
+    feed = feedparser.parse(body)
+    return [(entry.get('link'), entry.get('title'), entry.get('published') or entry.get('updated'))
+            for entry in feed.entries if entry.get('link')]
+
+
+class SitemapDiscovery:
+
+    def __init__(self, date_normalizer, period_start, period_end, margin=PRUNE_MARGIN):
+        self.date_normalizer = date_normalizer
+        self.period_start = period_start
+        self.period_end = period_end
+        self.margin = margin
+
+        self.counts = Counter()
+
+    def is_outside_period(self, start, end):
+        return end + self.margin <= self.period_start or start - self.margin >= self.period_end
+
+    def is_modified_before_period(self, lastmod):
+        timestamp = self.date_normalizer.timestamp(lastmod)
+        return timestamp is not None and timestamp + self.margin <= self.period_start
+
+    def entries(self, body):
+        # (is a sitemap index, [(loc, lastmod), ...])
+        try:
+            sitemap = Sitemap(body)
+        except Exception:
+            # not xml at all, e.g. an html error page served with status 200
+            self.counts['unreadable_sitemaps'] += 1
+            return False, []
+
+        return sitemap.type == 'sitemapindex', [(entry['loc'], entry.get('lastmod')) for entry in sitemap if entry.get('loc')]
+
+    def keep_sitemap(self, loc, lastmod):
+        period = sitemap_period(loc, self.date_normalizer.local_timezone)
+
+        if self.is_modified_before_period(lastmod) or (period is not None and self.is_outside_period(*period)):
+            self.counts['skipped_sitemaps'] += 1
+            return False
+
+        self.counts['sitemaps'] += 1
+        return True
+
+    def keep_url(self, loc, lastmod):
+        dates = url_path_date(loc, self.date_normalizer.local_timezone)
+
+        if self.is_modified_before_period(lastmod) or (dates is not None and self.is_outside_period(*dates)):
+            self.counts['skipped_urls'] += 1
+            return False
+
+        self.counts['urls'] += 1
+        return True
+
+    def record_feed(self, entries):
+        self.counts['feeds'] += 1
+        self.counts['feed_entries'] += entries
+
+    def summary(self):
+        return ', '.join(f"{name} {count}" for name, count in sorted(self.counts.items())) or 'nothing discovered'
@@ -0,0 +1,60 @@
+# Offline, memoized domain name resolution
+#
+# tldextract.extract() re-parses the whole url on every call and, the first time
+# it is used, may try to download the public suffix list. DomainResolver uses the
+# suffix list snapshot bundled with tldextract (never touches the network) and
+# memoizes the answer per hostname, since a crawl only ever sees a few hundred
+# distinct hostnames.
+
+from functools import lru_cache
+
+import tldextract
+from tldextract.remote import lenient_netloc
+
+
+# country -> {registered domain: domain name used by the spider}
+# These outlets only serve their english edition under a subdomain or a path prefix
+COUNTRY_DOMAIN_REWRITES = {
+    'malaysia': {
+        'bernama.com': 'bernama.com/en/',
+    },
+    'vietnam': {
+        'vnanet.vn': 'vnanet.vn/en/',
+        'vietnamplus.vn': 'en.vietnamplus.vn',
+    },
+    'indonesia': {
+        'kompas.com': 'go.kompas.com',
+    },
+    'cambodia': {
+        'cambodiadaily.com': 'english.cambodiadaily.com',
+    },
+}
+
+
+class DomainResolver:
+    # domain_name() returns "domain.suffix" for a url, after the country rewrites above
+
+    def __init__(self, countries, cache_size=8192):
+        # Empty suffix_list_urls means the bundled snapshot is used, and cache_dir=None
+        # keeps tldextract from writing its own cache file
+        self.tld_extract = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+        # the registered domains of different countries never overlap, so the rewrites of all the crawled countries can be merged
+        self.rewrites = {}
+        for country in countries:
+            self.rewrites.update(COUNTRY_DOMAIN_REWRITES.get(country, {}))
+
+        self.resolve_hostname = lru_cache(maxsize=cache_size)(self._resolve_hostname)
+
+    def _resolve_hostname(self, hostname):
+        extracted = self.tld_extract(hostname)
+
+        # Concatenates the domain and the suffix (TLD)
+        domain_name = f"{extracted.domain}.{extracted.suffix}"
+
+        return self.rewrites.get(domain_name, domain_name)
+
+    def domain_name(self, link):
+        # lenient_netloc() is the same hostname parsing tldextract does internally,
+        # so resolving the hostname gives the same answer as resolving the full url
+        return self.resolve_hostname(lenient_netloc(link))
@@ -0,0 +1,58 @@
+# Registry of the per-outlet extractors
+#
+# Extractors live in one module per country, so a per-country run only imports
+# the outlets it actually crawls.
+
+from importlib import import_module
+from urllib.parse import urlsplit
+
+from covidnews.extractors.base import EXTRACTORS_BY_COUNTRY, Extractor, first, register
+
+
+COUNTRY_MODULES = ['singapore', 'philippines', 'malaysia', 'vietnam', 'thailand', 'indonesia', 'cambodia']
+
+# loaded for every country since archive.org search results are not tied to a single country
+COMMON_MODULES = ['archive']
+
+
+def load_extractor_classes(countries):
+    classes = []
+
+    for module_name in list(countries) + COMMON_MODULES:
+        import_module(f"{__name__}.{module_name}")
+        classes.extend(EXTRACTORS_BY_COUNTRY[module_name])
+
+    return classes
+
+
+class ExtractorRegistry:
+    def __init__(self, spider, countries):
+        # hostname -> extractors registered for it, more than one only when they differ by path_prefix
+        self.by_domain = {}
+
+        for cls in load_extractor_classes(countries):
+            extractor = cls(spider)
+            for domain in cls.domains:
+                self.by_domain.setdefault(domain, []).append(extractor)
+
+    def lookup(self, url):
+        try:
+            parts = urlsplit(url)
+            hostname = parts.hostname
+        except ValueError:
+            return None
+
+        if not hostname:
+            return None
+
+        # walks 'newsinfo.inquirer.net' -> 'inquirer.net' -> 'net', each step being a dict hit
+        labels = hostname.split('.')
+        for i in range(len(labels)):
+            extractors = self.by_domain.get('.'.join(labels[i:]))
+
+            if extractors:
+                for extractor in extractors:
+                    if extractor.matches_path(parts.path):
+                        return extractor
+
+        return None
@@ -0,0 +1,36 @@
+# Extractor for the archive.org full text search results
+
+from covidnews.extractors.base import Extractor, register
+
+
+@register
+class InternetArchiveExtractor(Extractor):
+    domains = ('archive.org',)
+    source = 'archive'
+
+    next_page_selector = 'a.format-summary:contains("FULL TEXT")::attr(href)'
+
+    def parse_articles(self, response):
+        if 'https://archive.org/details/' in response.url:
+            # Extract article (only the FULL_TEXT download page) from the summary page
+            return response.css('a.format-summary.download-pill:contains("FULL TEXT")::attr(href)')
+        else:
+            print("Already downloaded and extracted the FULL_TEXT archive.org article")
+            # (be aware of compressed zip file format containing multiple djvu.txt.html webpage files,
+            # OR Microsoft Word OR Adobe PDF document)
+            return response.css('*')
+
+    def parse_article(self, article, response):
+        title = article.css('title::text').get()
+        date = article.xpath('//meta[@name="date"]/@content').get()
+
+        link = response.css('a.format-summary.download-pill:contains("FULL TEXT")::attr(href)').get()
+
+        return title, date, link
+
+    def get_article_content(self, response, title, date):
+        body = response.css('div.article p::text').getall() or \
+               response.css('div.text-long').getall() or \
+               response.css('main#maincontent > div.container.container-ia > pre::text').getall()
+
+        return title, date, body
@@ -0,0 +1,131 @@
+# Base class for the per-outlet extractors
+#
+# Each news outlet gets one Extractor subclass carrying its listing selectors,
+# card field selectors, article body XPath, date fallbacks and pagination rules.
+# The spider looks the extractor up once per response by hostname (see
+# covidnews.extractors.ExtractorRegistry) instead of walking an
+# `elif 'domain' in response.url` ladder inside every callback.
+
+from collections import defaultdict
+
+
+# country module name -> extractor classes defined in that module
+EXTRACTORS_BY_COUNTRY = defaultdict(list)
+
+
+def register(cls):
+    # Class decorator, files the extractor under the country module it is defined in
+    country = cls.__module__.rsplit('.', 1)[-1]
+    EXTRACTORS_BY_COUNTRY[country].append(cls)
+    return cls
+
+
+def first(selector, queries):
+    # Same as `selector.css(q1).get() or selector.css(q2).get() or ...`
+    value = None
+    for query in queries:
+        value = selector.css(query).get()
+        if value:
+            break
+    return value
+
+
+class Extractor:
+    # Hostnames served by this extractor, a response hostname also matches its parent domains,
+    # so 'inquirer.net' covers 'newsinfo.inquirer.net'
+    domains = ()
+
+    # Only dispatch to this extractor when the url path starts with this prefix, e.g. bernama.com/en/
+    path_prefix = None
+
+    # Value of the 'source' item field
+    source = None
+
+    # parse_articles() : css selector for the article cards inside a listing page
+    listing_selector = None
+
+    # parse_article() : css selectors tried in order on every article card
+    card_title_selectors = ('a ::text',)
+    card_date_selectors = ('div.article__date-published',)
+    card_link_selectors = ('a::attr(href)',)
+
+    # get_article_content() : body_xpath has precedence over body_css
+    body_xpath = None
+    body_css = 'p ::text'
+    content_title_selectors = ()
+    content_date_selectors = ()
+
+    # css selector (no ::text) whose presence means the Splash render of an article page is ready,
+    # listing pages use listing_selector, see covidnews.splash_readiness
+    ready_selector = None
+
+    # Whether the date found inside the article page replaces the date found on the listing card
+    content_date_overrides_card_date = False
+
+    # strptime formats of this outlet's date strings, tried before the common ones in covidnews.dates
+    date_formats = ()
+
+    # get_next_pages() : next_page_selector is used when searching the entire website hierarchy,
+    # pagination_selector (if not None) is used otherwise, an empty string disables pagination
+    next_page_selector = 'a::attr(href)'
+    pagination_selector = None
+
+    # Some outlets have articles list even in the actual article page, but we do not want to deal with
+    # the list during article data writing phase
+    reparse_listings_in_article_page = True
+
+    def __init__(self, spider):
+        self.spider = spider
+
+    @property
+    def name(self):
+        return self.domains[0] if self.domains else type(self).__name__
+
+    def matches_path(self, path):
+        return self.path_prefix is None or path.startswith(self.path_prefix)
+
+    def parse_articles(self, response):
+        print(f"parse_articles() for {self.name}")
+
+        if self.listing_selector is None:
+            return None
+
+        return response.css(self.listing_selector)
+
+    def parse_article(self, article, response):
+        title = first(article, self.card_title_selectors)
+        date = first(article, self.card_date_selectors)
+        link = first(article, self.card_link_selectors)
+
+        return title, date, link
+
+    def get_body(self, response):
+        if self.body_xpath:
+            return response.xpath(self.body_xpath).getall()
+
+        return response.css(self.body_css).getall()
+
+    def get_article_content(self, response, title, date):
+        body = self.get_body(response)
+
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        if date is None or self.content_date_overrides_card_date:
+            date = first(response, self.content_date_selectors)
+
+            if date is None:
+                print(f"date is None for {self.name}")
+
+        return title, date, body
+
+    def get_next_pages(self, response):
+        selector = self.next_page_selector
+
+        if not self.spider.search_entire_website and self.pagination_selector is not None:
+            selector = self.pagination_selector
+
+        if not selector:
+            return None
+
+        return response.css(selector).getall()
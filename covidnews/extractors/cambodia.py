@@ -0,0 +1,90 @@
+# Extractors for the cambodia outlets
+
+from covidnews.extractors.base import Extractor, first, register
+
+
+@register
+class KhmerTimesExtractor(Extractor):
+    domains = ('khmertimeskh.com',)
+
+    listing_selector = 'div.item-content > h2.item-title > a'
+
+    body_xpath = '//p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][not(position()=last()) and not(position()=last()-1)]//text() | \
+                  //p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][position()=last() or position()=last()-1]/text() | \
+                  //p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][position()=last() or position()=last()-1]/*[not(self::em)]/text() | \
+                  //li[ancestor::div[@class="entry-content"] and not(ancestor::ul[@class="rp4wp-posts-list"]) and not(ancestor::ul[@class="entry-fields"])]//text()'
+    content_title_selectors = ('h2.entry-title::text',)
+    ready_selector = 'div.entry-content p'
+    content_date_selectors = ('time.entry-time::text',)
+    content_date_overrides_card_date = True
+
+    next_page_selector = 'div#paging > a.next.page-numbers::attr(href)'
+
+    reparse_listings_in_article_page = False
+
+
+@register
+class CambodiaDailyExtractor(Extractor):
+    domains = ('english.cambodiadaily.com',)
+
+    listing_selector = 'div.td-module-meta-info > h3 > a'
+
+    body_xpath = '//p[not(contains(., "Also Read:")) and not(contains(., "Also read:"))]//text()'
+    content_title_selectors = ('h1.tdb-title-text::text',)
+    content_date_selectors = ('time.entry-date.updated.td-module-date::text',)
+    content_date_overrides_card_date = True
+
+    next_page_selector = 'div.page-nav > a::attr(href)'
+
+
+@register
+class PhnomPenhPostExtractor(Extractor):
+    domains = ('phnompenhpost.com',)
+
+    # '12 February 2023', once get_article_content() dropped the time after '|'
+    date_formats = ('%d %B %Y',)
+
+    listing_selector = 'body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.main-content > div > div > div.main-content-text > a, \
+                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.article-news > div.article-thumbnail > ul > li > a, \
+                body > div.section-body.page-wrapper > div.category > div.categories-left > div > div > div.category-content > div.category-row > div.category-item > a, \
+                body > div.section-body.page-wrapper > div.category-bot > div > div.category-bot-content > div.category-bot-item-md > div.category-bot-md-text > a, \
+                body > div.section-body.page-wrapper > div.category-bot > div > div.category-bot-content > div.category-bot-item-sm > div > div > a, \
+                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.slideshow-news > div > div > div > span > a, \
+                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.latest-news > ul > li > a, \
+                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.article-news > div > ul > li > a, \
+                #item-list > div > div.more-text > a, \
+                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.category-mid > div > ul > li > div > a, \
+                body > div.section-body.page-wrapper > div.section-article > div.right-sidebar > div.latest-news > ul > li > a'
+
+    body_xpath = '//p[not(contains(., "Publication date")) and not(contains(., "Reporter :")) and not(ancestor::div[@class="img-captions"]) and not(ancestor::div[@class="mustwatch-text"])]//text()'
+    content_title_selectors = ('div.section-article-header > h2::text',)
+    ready_selector = 'div.section-article-header > h2'
+
+    # needs some javascript handling for clicking "Load more" button
+    pagination_selector = 'p.page-Navigation > a::attr(href)'
+
+    reparse_listings_in_article_page = False
+
+    def get_article_content(self, response, title, date):
+        body = self.get_body(response)
+
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        # XPath to find the <p> containing 'Publication date' and then extract the date
+        date = response.xpath('//p[contains(text(), "Publication date")]/text()').getall()
+        print(f"date => {date}")
+
+        if date:
+            # we only want the text after 'Publication date'
+            date = date[-1].strip()
+            print(f"date =>> {date}")
+
+            # Extracting the date part before the '|' inside '12 February 2023 | 12:12 ICT'
+            date = date.split('|')[0].strip()  # This will result in '12 February 2023'
+            print(f"date =>>> {date}")
+
+        else:
+            print("date is None for phnompenhpost.com")
+
+        return title, date, body
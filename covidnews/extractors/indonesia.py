@@ -0,0 +1,40 @@
+# Extractors for the indonesia outlets
+
+from covidnews.extractors.base import Extractor, register
+
+
+@register
+class JakartaPostExtractor(Extractor):
+    domains = ('thejakartapost.com',)
+
+    listing_selector = 'body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__headline > div > div > div.tjp-homepage__headline-main.outlined > div > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__headline > div > div > div.tjp-homepage__headline-third.outlined > div > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--popular > div > div > div > div.tjp-grid.tjp-grid--1-2 > div > div > a, \
+                #swiper-wrapper-61071fce948872ee1 > div.swiper-slide.swiper-slide-active > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--popular > div > div > div > div.tjp-grid.tjp-grid--2 > div > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--opinion > div.tjp-grid.tjp-grid--2 > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--opinion > div.tjp-grid.tjp-grid--2 > div > div > div > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--indonesia > div.tjp-grid.tjp-grid--2 > div > div > div > a, \
+                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--indonesia > div.tjp-grid.tjp-grid--2 > div > div > div > div > a, \
+                body > div.col-xs-12.tjpcontainer > div > div > div > div.jpRow.mainNews.lineSection.channelTwoSided.subCanal > div.containerLeft.col-xs-12 > div > div.theLatest.mb-20 > div.columns.tjp-newsListing > div > div > div.latestDetail > a, \
+                body > div.col-xs-12.tjpcontainer > div > div > div > div.jpRow.mainNews.headLineChannel.channelTwoSided > div > div.smallHeadline.channel > div > div > a'
+
+    body_xpath = '//p[not(ancestor::div[@class="tjp-newsletter-box"]) and not(ancestor::div[@class="on-ie-underversion9"]) and not(ancestor::div[@class="social-login col-sm-12 columns"])]//text() | //div[@class="tjp-opening"]/h1/text()'
+    content_title_selectors = ('div.tjp-single__head-item.tjp-single__head-item--detail > h1::text',)
+    content_date_selectors = ('div.tjp-meta > div > div.tjp-meta__content-list > div:nth-child(2)::text',)
+    content_date_overrides_card_date = True
+
+
+@register
+class KompasExtractor(Extractor):
+    domains = ('go.kompas.com',)
+
+    listing_selector = 'body > div.wrap > div.container.clearfix > div.row.mt3.col-offset-fluid.clearfix > div.col-bs10-7 > div.latest--news.mt2.clearfix > div > div.article__list__title > h3 > a'
+
+    body_xpath = '//p[not(contains(., "Also Read:")) and not(contains(., "Also read:"))]//text() | //div[@class="read__content"]//h3//text() | //div[@class="read__content"]//li//text()'
+    content_title_selectors = ('body > div.wrap > div.container.clearfix > div > div > h1::text',)
+    content_date_selectors = ('div.read__time::text',)
+    ready_selector = 'div.read__content'
+    content_date_overrides_card_date = True
+
+    next_page_selector = 'div.paging__item > a.paging__link::attr(href)'
@@ -0,0 +1,256 @@
+# Extractors for the malaysia outlets
+
+from covidnews.extractors.base import Extractor, first, register
+
+
+@register
+class NewStraitsTimesExtractor(Extractor):
+    domains = ('nst.com.my',)
+
+    listing_selector = 'div.row.mb-4 div.col-md-4.col-lg-3.order-2.order-sm-1.mb-4.mb-sm-0 div.mb-4 div.block.block-article-image-row-listing div.d-flex.flex-row.mb-3, \
+                    \
+                    div.block.block-breaking-news div.d-flex.mb-3, \
+                    div.block.block-breaking-news div.row div.col-12.col-sm.mb-4.mb-sm-0, \
+                    div.block.block-breaking-news div.row div.col.col-sm.align-items-center.article-listing div.d-flex.flex-column.h-100.justify-content-between a.d-flex.article.listing.mb-2 div.content.pl-2 div.field-title, \
+                    \
+                    div.most-popular.block div#__BVID__12.tabs div#__BVID__12__BV_tab_container_.tab-content.pt-2 div#__BVID__13.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
+                    div.most-popular.block div#__BVID__12.tabs div#__BVID__12__BV_tab_container_.tab-content.pt-2 div#__BVID__15.tab-pane.active div.ranked-listing div.ranked-item.d-flex.px-3.pb-2.mb-2.align-items-center.timeline, \
+                    div.most-popular.block div#__BVID__9.tabs div#__BVID__9__BV_tab_container_.tab-content.pt-2 div#__BVID__10.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
+                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__11.tab-pane.active div.ranked-listing div.ranked-item.d-flex.px-3.pb-2.mb-2.align-items-center.timeline, \
+                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__9.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
+                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__9.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-4, \
+                    \
+                    div.block.block-opinions div.row div.col-12.col-sm.mb-4.mb-sm-0, \
+                    div.owl-stage div.owl-item.cloned, \
+                    div.owl-stage div.owl-item.active, \
+                    div.owl-stage div.owl-item.cloned.active, \
+                    div.owl-stage div.owl-item, \
+                    \
+                    div.block.block-left-featured-right-listing div.row.no-gutter div.col-12.col-lg a, \
+                    div.block.block-left-featured-right-listing div.row.no-gutter div.col-12.col-lg div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
+                    div.col-12.col-lg.article-listing div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
+                    div.col-12.col-lg div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
+                    \
+                    div.article-listing div.article-teaser, \
+                    div#trending-block.block.my-4 div.block-content.d-block.position-relative a.d-flex.article.listing.mb-2.pb-2.border-bottom, \
+                    \
+                    div.block.block-single-listing, \
+                    div.collection-listing-latest div.latest-featured div.row, \
+                    div.collection-listing-latest div.latest-listing.mt-4 div.row div.col-12.col-sm.mb-3.mb-sm-0'
+
+    content_title_selectors = ('h1.page-title.mb-2 span.d-inline-block.mr-1::text',)
+
+    def parse_article(self, article, response):
+        title = article.css('h6.field-title::text').get()
+        date = None
+
+        if article.css('div.d-block.article-meta span.created-ago::text').get():
+            date = article.css('div.d-block.article-meta span.created-ago::text').get().split(' @ ')[0]
+
+        if date is None and article.css('div.article-meta > div::text').get():
+            date = article.css('div.article-meta > div::text').get().split(' @ ')[0]
+
+        link = article.css('a::attr(href)').get()
+
+        return title, date, link
+
+    def get_article_content(self, response, title, date):
+        body = self.get_body(response)
+
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        if date is None and response.css('div.article-meta > div::text').get():
+            date = response.css('div.article-meta > div::text').get().split(' @ ')[0]
+
+        return title, date, body
+
+
+@register
+class TheStarExtractor(Extractor):
+    domains = ('thestar.com.my',)
+
+    listing_selector = 'div.content.main-desktop-headline, \
+                    div.content > u1 > li, \
+                    div.col-sm-3.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
+                    div.row.story-set div.col-xs-12.col-sm-3.mob-bot-20 div.col-wrap div.col-content h2, \
+                    div.col-sm-6.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
+                    ul#MoreNews-Second.story-set.col-sm-4.col-md-3 li.row.hidden-visual, \
+                    div.row.list-listing div.col-xs-7.col-sm-9 h2, \
+                    ul#justInListing.timeline.vTicker li.row div.col-xs-8.col-sm-10.col-md-9.tm-content-wrap div.timeline-content p a, \
+                    div.focus section.latest-news div.sub-section-list div.row.list-listing, \
+                    div.featuredDiv div.focus-story div.row div div.col-xs-12.col-sm-4.featuredContent div.content h2, \
+                    div.row ul.story-set.col-sm-3.story3 li.row.hidden-visual div.col-xs-7.left.col-sm-12 h2 a, \
+                    div.story-set-group.story2 div.col-sm-6.in-sec-story div.row div.col-xs-7.left.col-sm-12 a, \
+                    div#section1.story-set-group div.col-sm-3.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
+                    div#section2.sub-section-list div.row.list-listing div.col-xs-7.col-sm-9 h2, \
+                    div#story-recom-list.desc-wrap div.desc div.col-xs-7.col-sm-9.col-md-7.left, \
+                    div#divOpinionWidget section.side-combo-2 div.desc-wrap div.row.desc div.col-xs-9.col-sm-10.right p a, \
+                    div.focus-story.focus-lifestyle div.row div.col-xs-12.col-sm-4, \
+                    div.sub-section-list.story-set-lifestyle div.col-xs-12.col-sm-6.bot-20.lifemain div.row div.col-xs-12.left, \
+                    div.thumb__container.viewpoints__stories.row div.col-sm-6.thumb__item div.thumb.thumb--vp div.thumb__inner, \
+                    div.opinion-content div div.row.story-set div.col-xs-12.col-sm-4.bot-20 div.col-wrap div.col-content h2, \
+                    div#story-recom-list.desc-wrap div.desc, div.row.panel-content'
+
+    #body_css = 'p:not(.caption):not(.date) ::text'
+    body_xpath = '//p[not(contains(@class, "caption")) and not(contains(@class, "date")) and not(contains(@class, "reactions__desc")) and not(contains(@class, "footer-bottom")) and not(contains(., "Do you have question")) and not(ancestor::div[@class="plan-temp_desc relative"]) and not(ancestor::div[@class="klci"]) and not(ancestor::div[@class="sponsored-panel"]) and not(ancestor::div[@class="for-side api-widget"]) and not(.//span[contains(@class, "inline-caption")]) and not(contains(., "ALSO READ:"))]//text() | //li[not(*)]/text()'
+    content_title_selectors = ('.headline.story-pg h1::text',)
+    content_date_selectors = ('p.date::text',)
+
+    def parse_article(self, article, response):
+        title = article.css('h2 a ::text').get() or \
+                article.css('a ::text').get()
+        date = None
+
+        if article.css('span.timestamp ::text').get():
+            date = article.css('span.timestamp ::text').get().split(' | ')[0]
+
+        if date is None and article.css('label.timestamp ::text').get():
+            date = article.css('label.timestamp ::text').get().split(' | ')[0]
+
+        link = article.css('a::attr(href)').get()
+
+        return title, date, link
+
+    def get_body(self, response):
+        body = super().get_body(response)
+
+        # Get the text of the <li> tags without any child tags
+        li_texts = response.xpath('//li[not(*)]/text()').getall()
+        #print(f"li_texts = {li_texts}")
+
+        # Replace <li> texts with comma separated
+        for i, text in enumerate(body):
+            for j, t in enumerate(li_texts):
+                #print(f"text = {text}, t = {t}")
+                if text in t and j < len(li_texts) - 1:
+                    # replace the matching part of the text with t (which has a comma added)
+                    body[i] = text.replace(t, t + ',')
+
+                #if text in t and j == len(li_texts) - 1:
+                    # replace the matching part of the text with t (which has a fullstop added)
+                    #body[i] = text.replace(t, t + '.')
+
+        return body
+
+
+@register
+class BernamaExtractor(Extractor):
+    domains = ('bernama.com',)
+    path_prefix = '/en/'
+
+    listing_selector = 'div#topstory.carousel.slide.mt-2 div.carousel-inner div.carousel-item div.carousel-caption h1.h3 a, \
+                div#skroll div.ji-timeline div.ji-container.ji-right div.ji-content h6, \
+                div#main.container-fluid.px-0 div.row div.col-lg-6 div#spcl2news.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div.row div.col-lg-12 div#spcl3news.row div.col-12.col-sm-12.col-md-3.col-lg-3.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-12 div#latestnews.owl-carousel.owl-theme.owl-loaded.owl-drag div.owl-stage-outer div.owl-stage div.owl-item.active div h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#generalnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#worldnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#businessnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#politicsnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#sportnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#featuresnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#thoughtsnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
+                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-sm-12.col-md-4.col-lg-4.mt-3.mt-md-0.mt-lg-0 h1.h3 a, \
+                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-12.col-sm-12.col-md-3.col-lg-3.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12.mb-3 h6 a, \
+                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-8.col-lg-8 div.row div.p-2.pl-3 div.row div.col-7.col-sm-7.col-md-8.col-lg-8 h6 a'
+
+    card_date_selectors = ()
+
+    content_title_selectors = ('div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-12.col-lg-8 h1.h2::text',)
+    content_date_selectors = ('div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-12.col-lg-8 div.row div.col-6.mt-3 div.text-right::text',)
+    content_date_overrides_card_date = True
+
+
+@register
+class MalaysiaNowExtractor(Extractor):
+    domains = ('malaysianow.com',)
+
+    listing_selector = 'div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 div.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.group a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.border-t-2.border-gray-100.py-8 div.space-y-8 div ul.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:grid-cols-3.lg\\:gap-x-8 li a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.items-stretch.space-y-8.lg\\:flex.lg\\:flex-1.lg\\:space-x-6.lg\\:space-y-0 div.w-full.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.space-y-8.sm\\:grid.sm\\:grid-cols-1.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.items-stretch.space-y-8.lg\\:flex.lg\\:flex-1.lg\\:space-x-6.lg\\:space-y-0 div.flex-1 div.space-y-12.sm\\:-mt-8.sm\\:space-y-0.sm\\:divide-y.sm\\:divide-gray-200.lg\\:gap-x-8.lg\\:space-y-0 div.sm\\:py-8 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 div.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.group a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-8.pb-10.sm\\:px-6 div.mx-auto.grid.gap-5.sm\\:grid-cols-2.lg\\:max-w-none.lg\\:grid-cols-4 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1 div.mx-auto.grid.gap-5.sm\\:grid-cols-2.lg\\:max-w-none.lg\\:grid-cols-3 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a, \
+                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
+                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.hidden.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:block.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
+                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
+                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a'
+
+    card_title_selectors = ('div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 a div.group.space-y-4 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 div.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.group a div.space-y-3 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.border-t-2.border-gray-100.py-8 div.space-y-8 div ul.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:grid-cols-3.lg\\:gap-x-8 li a.group div.group.grid.grid-cols-3.items-start.gap-6.space-y-0 div.col-span-2.flex.h-full.flex-col.justify-center.space-y-1.align-middle h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.items-stretch.space-y-8.lg\\:flex.lg\\:flex-1.lg\\:space-x-6.lg\\:space-y-0 div.w-full.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.space-y-8.sm\\:grid.sm\\:grid-cols-1.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.items-stretch.space-y-8.lg\\:flex.lg\\:flex-1.lg\\:space-x-6.lg\\:space-y-0 div.flex-1 div.space-y-12.sm\\:-mt-8.sm\\:space-y-0.sm\\:divide-y.sm\\:divide-gray-200.lg\\:gap-x-8.lg\\:space-y-0 div.sm\\:py-8 a div.group.space-y-4.sm\\:grid.sm\\:grid-cols-5.sm\\:items-start.sm\\:gap-6.sm\\:space-y-0 div.sm\\:col-span-3 div.space-y-4 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 a div.group.space-y-4 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\\:px-6 div.space-y-8.lg\\:grid.lg\\:grid-cols-4.lg\\:gap-8.lg\\:space-y-0 div.lg\\:col-span-2 div.space-y-8.sm\\:grid.sm\\:grid-cols-2.sm\\:gap-x-6.sm\\:gap-y-8.sm\\:space-y-0.lg\\:gap-x-6.lg\\:gap-y-6 div.group a div.space-y-3 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-8.pb-10.sm\\:px-6 div.mx-auto.grid.gap-5.sm\\:grid-cols-2.lg\\:max-w-none.lg\\:grid-cols-4 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a.mt-2.block p.font-georgia.text-xl.leading-6.text-gray-900.transition.duration-200.group-hover\\:text-brand-red-900 ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1 div.mx-auto.grid.gap-5.sm\\:grid-cols-2.lg\\:max-w-none.lg\\:grid-cols-3 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a.mt-2.block div.space-y-1 p ::text',
+                            'div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.hidden.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:block.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text',
+                            'div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.flex-1.space-y-6 div.space-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.grid.grid-cols-3.items-start.gap-6.space-y-0 div.col-span-2 div.space-y-1 div.space-y-1.font-georgia.text-xl.font-medium.leading-6.transition.duration-200.group-hover\\:text-brand-red-900 h3 ::text',
+                            'div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\\:px-6 div.items-stretch.space-y-6.lg\\:flex.lg\\:flex-1.lg\\:space-y-0.lg\\:space-x-6 div.space-y-8.lg\\:sticky.lg\\:top-40.lg\\:h-full.lg\\:w-\\[300px\\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text')
+    card_date_selectors = ('time ::text',)
+
+    content_title_selectors = ('h1 ::text',)
+    content_date_selectors = ('time ::text',)
+
+
+@register
+class FreeMalaysiaTodayExtractor(Extractor):
+    domains = ('freemalaysiatoday.com',)
+
+    listing_selector = 'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-sm-7.col-lg-5.order-1.order-sm-2.mb-4.mb-lg-0 article div.col-12 h1.sc-aXZVg.jiTbBU.fw-bold a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-lg-4.order-2.order-sm-3 div.row.align-items-stretch.gx-3 article.col-6.mb-4 blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6 div.featured.mb-5 article div.col-12 blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing article.col-12.col-sm-6.px-2.row.gx-2.mb-4.fs-12.align-items-stretch div.col blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-lg-4 aside.col-lg div.home-mostpopular-listing ol li div a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md-7.mb-4.mb-md-0 article.position-relative.h-md-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-4.px-sm-5 div.summary-title-wrapper.mb-4.mb-sm-3 blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md div.row.align-items-stretch.gx-3 div.sc-gFqAkR.KXNUP div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-prev article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-next article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-active article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-prev article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-active article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-next article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-7 article div.col-12 blockquote.sc-aXZVg.jiTbBU.fw-bold a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-5 div.row.gx-3 div.sc-ikkxIA.bklVyq div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-dAbbOL.delONt.col-12 div.row.gx-3.home-lifestyle-listing div.col-6.col-md-3.mb-4.mb-md-0 article.position-relative.h-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-3 div.summary-title-wrapper.pb-28-px blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.mb-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-feUZmu.beTCqT.col-12 div.row.gx-3 div.col-6.col-md-3 article blockquote a, \
+                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-12.col-md-4.mostviewed-listing article.row.gx-3.mb-4.fs-12.align-items-stretch div.col blockquote a, \
+                main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-4 div aside.col-lg div.home-mostpopular-listing ol li div a, \
+                div#__next div.fixed-top.jumpslider.d-none.d-md-block div.fade.bg-light.alert-border.alert.alert-success.show div div div a.m__story, \
+                div#__next main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-8 section.sc-gEvEer.iBuEiq.p-4 section.sc-gEvEer.iBuEiq.pt-5.pb-3.px-0.fs-16 div.row.gx-3 article.col-6.col-sm-3.mb-3 blockquote a'
+
+    card_title_selectors = ('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-sm-7.col-lg-5.order-1.order-sm-2.mb-4.mb-lg-0 article div.col-12 h1.sc-aXZVg.jiTbBU.fw-bold a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-lg-4.order-2.order-sm-3 div.row.align-items-stretch.gx-3 article.col-6.mb-4 blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6 div.featured.mb-5 article div.col-12 blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing article.col-12.col-sm-6.px-2.row.gx-2.mb-4.fs-12.align-items-stretch div.col blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-lg-4 aside.col-lg div.home-mostpopular-listing ol li div a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md-7.mb-4.mb-md-0 article.position-relative.h-md-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-4.px-sm-5 div.summary-title-wrapper.mb-4.mb-sm-3 blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md div.row.align-items-stretch.gx-3 div.sc-gFqAkR.KXNUP div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-prev article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-next article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-active article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-prev article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-active article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-next article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-7 article div.col-12 blockquote.sc-aXZVg.jiTbBU.fw-bold a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-5 div.row.gx-3 div.sc-ikkxIA.bklVyq div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-dAbbOL.delONt.col-12 div.row.gx-3.home-lifestyle-listing div.col-6.col-md-3.mb-4.mb-md-0 article.position-relative.h-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-3 div.summary-title-wrapper.pb-28-px blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.mb-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-feUZmu.beTCqT.col-12 div.row.gx-3 div.col-6.col-md-3 article blockquote a ::text',
+                            'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-12.col-md-4.mostviewed-listing article.row.gx-3.mb-4.fs-12.align-items-stretch div.col blockquote a ::text',
+                            'main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-4 div aside.col-lg div.home-mostpopular-listing ol li div a ::text',
+                            'div#__next div.fixed-top.jumpslider.d-none.d-md-block div.fade.bg-light.alert-border.alert.alert-success.show div div div a.m__story b ::text',
+                            'div#__next main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-8 section.sc-gEvEer.iBuEiq.p-4 section.sc-gEvEer.iBuEiq.pt-5.pb-3.px-0.fs-16 div.row.gx-3 article.col-6.col-sm-3.mb-3 blockquote a ::text')
+    card_date_selectors = ('time ::text',)
+
+    content_title_selectors = ('h1 ::text',)
+    content_date_selectors = ('time ::text',)
@@ -0,0 +1,200 @@
+# Extractors for the philippines outlets
+
+import re
+
+from bs4 import BeautifulSoup
+from parsel import Selector
+
+from covidnews.extractors.base import Extractor, first, register
+
+
+@register
+class PhilstarExtractor(Extractor):
+    domains = ('philstar.com',)
+
+    listing_selector = 'div.carousel__item__title h2 a, \
+                    div.theContent div#news_main div.jscroll-inner div.news_column.latest div.tiles.late.ribbon-cont div.ribbon div.ribbon_content div.ribbon_title h2 a, \
+                    div.theContent div#news_main div.jscroll-inner div#home_columnists div#home_columnists_content div#home_columnists_actual.owl-carousel.owl-theme.owl-loaded.owl-drag div.owl-stage-outer div.owl-stage div.owl-item.active div.home_columnists_cell div.home_columnists_cell_details h3 a, \
+                    div.theContent div#news_main div.jscroll-inner div#inside_philstar table#inside_philstar_cells tbody tr td.inside_cell div.inside_cell_title_main h3 a, \
+                    div.theContent div#news_main div.jscroll-inner div#inside_philstar table#inside_philstar_cells tbody tr td.inside_cell ul li h3 a, \
+                    div.news_title h2 a, \
+                    div.news_title a'
+
+    body_xpath = '//p[not(ancestor::div[@class="twitter-tweet"])]//text()'
+    content_title_selectors = ('div.article__title h1 ::text',)
+
+    def get_article_content(self, response, title, date):
+        print("get_article_content for philstar")
+        body = self.get_body(response)
+
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        if date is None and response.css('div.article__date-published ::text').get():
+            date = response.css('div.article__date-published ::text').get().split(' | ')[0]
+
+        return title, date, body
+
+
+@register
+class InquirerExtractor(Extractor):
+    domains = ('inquirer.net',)
+    source = 'INQ'
+
+    # see CovidNewsSpider.is_a_valid_date()
+    date_formats = ('%B %d, %Y - %I:%M %p',)
+
+    listing_selector = '.flx-leftbox, .flx-m-box, #tr_boxs3, #fv-ed-box, #op-columns-box, .image-with-text, #buzz-box, #inqf-box, div[data-tb-region-item]:not(#fview-cap), div.items[data-tb-region-item], #cmr-bg, #cmr-box, #ncg-box, #cdn-col-box, #cdn-g-box, .list-head, #trend_title, #usa-add-gallery > a, #cdn-cat-wrap > a, #op-sec h3, #ch-ls-head'
+
+    card_title_selectors = ('.flx-m-head::text, .flx-l-head::text, #tr_boxs3 h2 a::text, #inqf-info h2::text, #fv-ed-box h2 a::text, #buzz-info h2::text, div.items[data-tb-region-item] h3 a::text, div[data-tb-region-item] h3 a::text, #cmr-info h1 a::text, #cmr-info h2 a::text, #cmr-info h2::text, #ncg-info h1 a::text, #cgb-head h1::text, #cdn-col-box h2 a::text, #cdn-cat-box h2::text, #cat-info h2::text, .list-head a::text, #trend_title a::text, #trend_title h2 a::text, h1.entry-title::text, #ch-ls-head h2 a::text, #op-sec h3 a::text',)
+    card_date_selectors = ('.elementor-post-info__item--type-date::text',
+                           '#tr_boxs3 h6 ::text',
+                           '#cmr-info h3::text',
+                           '#ch-ls-head #ch-postdate span:first-child::text',
+                           '#cdn-col-box #col-post-date::text',
+                           '#cat-info #cat-pt::text',
+                           '#cdn-cat-box #cb-pt::text',
+                           '#trend_title h3::text',
+                           'div[data-tb-region-item] h4::text',
+                           'div.items[data-tb-region-item] h4::text')
+
+    content_title_selectors = ('h1.entry-title::text, h1[class="elementor-heading-title elementor-size-default"]::text, div[id="landing-headline"] h1::text, div[class="single-post-banner-inner"] h1::text',)
+
+    def parse_articles(self, response):
+        if response.url == 'https://cebudailynews.inquirer.net/':
+            self.spider.write_debug_page(response, 'cebudailynews_inquirer_net_debug')
+
+        return super().parse_articles(response)
+
+    def parse_article(self, article, response):
+        title = first(article, self.card_title_selectors)
+        date = first(article, self.card_date_selectors)
+
+        if date is None and article.css('#ncg-info #ncg-postdate::text').get() and not article.css('#ncg-info #ncg-postdate::text').get().isspace():
+            date = date or article.css('#ncg-info #ncg-postdate::text').get()
+
+        link = None  # just for initialization
+
+        # Get onclick url
+        onclick_url = response.css('#cmr-box::attr(onclick)').get()
+
+        # Extract url from onclick attribute
+        if onclick_url:
+            link = re.search(r"window.open\('(.*?)'", onclick_url).group(1)
+
+        if article.css('a::attr(href)').get() and not article.css('a::attr(href)').get().startswith("?utm_source=(direct)&utm_medium=gallery"):
+            link = article.css('a::attr(href)').get()
+
+        link = link or article.css('#cgb-head h1::attr(data-vr-contentbox-url)').get()
+
+        return title, date, link
+
+    def get_body(self, response):
+        #body = response.css('p:not(.footertext):not(.headertext):not(.wp-caption-text) ::text').getall()
+        #body = response.xpath('//p[not(.//strong) and not(.//b) and not(contains(@class, "wp-caption-text")) and not(contains(@class, "footertext")) and not(contains(@class, "headertext")) and not(ancestor::div[@class="qni-cookmsg"]) and not(ancestor::blockquote[@class="twitter-tweet"]) and not(./iframe)]//text() | //li[not(*)]/text() | //p//text()[contains(.,"ADVT")] | //p//text()[contains(.,"READ MORE")]').getall()
+
+        """
+        The following logic using BeautifulSoup is trying to work around the limitation of
+        response.xpath('//p[not(.//strong) and not(.//b)]//text()').getall() , where this xpath() will
+        exclude html such as:   <p>relevant_text<strong>irrelevant_text</strong>relevant_text</p>
+        """
+
+        # Get HTML content
+        html_content = response.xpath('//body').get()
+
+        # Parse HTML content with BeautifulSoup
+        soup = BeautifulSoup(html_content, 'lxml')
+
+        # Find all <strong> and <b> tags
+        tags = soup.find_all(['strong', 'b'])
+
+        # Remove each tag
+        for tag in tags:
+            tag.decompose()
+
+        # Get the modified HTML
+        html_content = str(soup)
+        #print(f"html_content after removing <strong> and <b> tags = {html_content}")
+
+        # Convert the resulting text into a Selector object
+        response_without_strong_and_b_tags = Selector(text=html_content)
+
+        # Extract the rest of the data
+        body = response_without_strong_and_b_tags.xpath('//p[not(contains(@class, "wp-caption-text")) and not(contains(@class, "footertext")) and not(contains(@class, "headertext")) and not(ancestor::div[@class="qni-cookmsg"]) and not(ancestor::blockquote[@class="twitter-tweet"]) and not(./iframe)]//text() | //li[not(*)]/text() | //p//text()[contains(.,"ADVT")] | //p//text()[contains(.,"READ MORE")]').getall()
+        #print(f"body after removing <strong> and <b> tags = {body}")
+
+        # Get the text of the <li> tags without any child tags
+        li_texts = response.xpath('//li[not(*)]/text()').getall()
+        #print(f"li_texts = {li_texts}")
+
+        # Replace <li> texts with comma separated
+        for i, text in enumerate(body):
+            for j, t in enumerate(li_texts):
+                #print(f"text = {text}, t = {t}")
+                if text in t and j < len(li_texts) - 1:
+                    # replace the matching part of the text with t (which has a comma added)
+                    body[i] = text.replace(t, t + ',')
+
+                if text in t and j == len(li_texts) - 1:
+                    # replace the matching part of the text with t (which has a fullstop added)
+                    body[i] = text.replace(t, t + '.')
+
+        return body
+
+    def get_article_content(self, response, title, date):
+        print("get_article_content for inquirer")
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        body = self.get_body(response)
+
+        if date is None:
+            print("inquirer.net date is None !!!")
+
+            # sometimes there could a meaningless <span> with a single text character
+            if response.css('div#m-pd2 > span:nth-child(2)::text').get() and len(response.css('div#m-pd2 > span:nth-child(2)::text').get()) > 1:
+                date = response.css('div#m-pd2 > span:nth-child(2)::text').get()
+            if ((date and not self.spider.is_a_valid_date(date)) or date is None) and response.css('div#m-pd2 > span:nth-child(3)::text').get() and len(response.css('div#m-pd2 > span:nth-child(3)::text').get()) > 1:
+                date = response.css('div#m-pd2 > span:nth-child(3)::text').get()
+
+            date = date or \
+                    response.css('div.art-byline span:last-child::text').get() or \
+                    response.css('ul.blog-meta-list > li:nth-child(3) a::text').get() or \
+                    response.css('li[itemprop="datePublished"] span::text').get() or \
+                    response.css('div[id="art_plat"]::attr(data-timezone)').get() or \
+                    response.css('#spl-byline span:last-child::text').get()
+
+            if date is None and response.css('div[id="art_plat"]::text').getall():
+                date = date or \
+                        response.css('div[id="art_plat"]::text').getall()[-1].replace("Updated as of:", "")
+
+            if response.css('div.bpdate::text').getall():
+                date = date or \
+                        response.css('div.bpdate::text').getall()[-1]
+
+        return title, date, body
+
+
+@register
+class ManilaBulletinExtractor(Extractor):
+    domains = ('mb.com.ph',)
+    source = 'MB'
+
+    listing_selector = 'div.row.mb-16, div.row.mb-5, .custom-article-text, .mb-font-article-title, .mb-font-live-update-article-title, div.videoCube.trc_spotlight_item.origin-undefined'
+
+    card_title_selectors = ('.mb-font-article-title a::text',
+                            'div.mb-font-article-title a span::text',
+                            'span.mb-font-live-update-article-title::attr(title)')
+    card_date_selectors = ('.mb-font-article-date::text',)
+
+    content_date_selectors = ('.mb-font-article-date::text',)
+
+    # need to figure out how to click the "MORE+" button, and then execute the css() selector code again
+    #pagination_selector = '.mb-font-more-button::text'
+    pagination_selector = ''
+
+    def parse_articles(self, response):
+        if response.url == 'https://mb.com.ph/category/specials':
+            self.spider.write_debug_page(response, 'manila_bulletin_debug')
+
+        return super().parse_articles(response)
@@ -0,0 +1,72 @@
+# Extractors for the singapore outlets
+
+from covidnews.extractors.base import Extractor, first, register
+
+
+@register
+class ChannelNewsAsiaExtractor(Extractor):
+    domains = ('channelnewsasia.com',)
+    source = 'CNA'
+
+    # Extract articles from CNA
+    listing_selector = 'div.list-object'
+
+    card_title_selectors = ('title::text',
+                            'h1.entry-title::text',
+                            '.h1.h1--page-title::text',
+                            'div.quick-link[data-heading]::attr(data-heading)',
+                            'div.quick-link::attr(data-heading)',
+                            'meta[property="og:title"]::attr(content)',
+                            'meta[name="twitter:title"]::attr(content)')
+    card_date_selectors = ('time.entry-date::text', 'div.list-object__datetime-duration span::text')
+    card_link_selectors = ('h1.entry-title a::attr(href)', 'h6.list-object__heading a::attr(href)', 'div.quick-link::attr(data-link_absolute)')
+
+    body_xpath = '//blockquote//p//text() | //p[not(@*) and not(ancestor::figcaption)]/descendant-or-self::node()/text() | //ul/li[not(@*)]/span[not(@*)]/span[not(@*)]/text()'
+    content_date_selectors = ('.article-publish::text', '.article-publish span::text')
+
+
+@register
+class StraitsTimesExtractor(Extractor):
+    domains = ('straitstimes.com',)
+    source = 'ST'
+
+    # Extract articles from ST
+    #listing_selector = 'div.container > div.grid.cards > div.card'
+    #listing_selector = 'div.queryly_item_row'
+    listing_selector = 'div.card-body'
+
+    card_title_selectors = ('h5.card-title a::text',
+                            '.node-header.h1::text')
+    card_date_selectors = ('time::text', 'time::attr(datetime)', '.story-postdate::text')
+
+    #body_css = 'p ::text, h2:not(.visually-hidden) ::text'
+    body_xpath = '//p[not(ancestor::blockquote[contains(@class, "instagram-media")]) and not(ancestor::div[contains(@class, "fb-post")])]//text() | //h2[not(contains(@class, "visually-hidden"))]/text()'
+    content_date_selectors = ('.group-story-changedate .story-changeddate::text',
+                              '.group-story-postdate .story-postdate::text',
+                              'div.story-postdate::text',
+                              '.byline::text',
+                              '.st-byline::text',
+                              'time::text',
+                              'time::attr(datetime)',
+                              '.lb24-default-list-item-date::text',
+                              'time[itemprop="datePublished"]::attr(datetime)')
+
+    # Find all 'a' tags inside 'div' tags with class 'queryly_item_row', 'a' tags with the text 'More', and 'a' tags with class 'stretched-link'
+    #pagination_selector = 'div.queryly_item_row a::attr(href), a:contains("More")::attr(href), a.stretched-link::attr(href)'
+    #pagination_selector = 'div.queryly_item_row > a::attr(href)'
+    pagination_selector = 'a:contains("Next Page")::attr(href)'
+
+    def get_article_content(self, response, title, date):
+        body = self.get_body(response)
+
+        if date is None:
+            print("straitstimes date is None !!!")
+            date = first(response, self.content_date_selectors)
+
+            if response.css('.byline::text').get() is not None and 'PUBLISHED: ' in date:
+                date = date.split('PUBLISHED: ')[-1]
+
+            if response.css('.st-byline::text').get() is not None and 'Published: ' in date:
+                date = date.split('Published: ')[-1]
+
+        return title, date, body
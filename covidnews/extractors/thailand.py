@@ -0,0 +1,80 @@
+# Extractors for the thailand outlets
+
+from covidnews.extractors.base import Extractor, first, register
+
+
+@register
+class BangkokPostExtractor(Extractor):
+    domains = ('bangkokpost.com',)
+
+    # '12 Mar 2024', once get_article_content() dropped the 'PUBLISHED :' prefix and the time
+    date_formats = ('%d %b %Y',)
+
+    listing_selector = 'body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-11.ctrl-height > div.divnews-highlight > div > div.owl-stage-outer.owl-height > div > div.owl-item.active > div > div > figure > figcaption > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-11.ctrl-height > div.news--slide222 > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-4 > div > div.div-timeline--list > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-4 > div > div.div-timeline--list > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div.news--slide > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
+                div.section-news > div.container > #news-tabContent > div > div > div > div.col-15.col-lg-9 > div > figure > figcaption > h3 > a, \
+                div.section-news > div.container > #news-tabContent > div > div > div > div.col-15.col-lg-6 > div > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div > div.col-15.col-lg-10 > div.row > div > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div > div.col-15.col-lg-10 > div.row > div > div > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-leaning > div > div.boxnews--container.learning--slide > div > div.owl-stage-outer > div > div > div > div > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div.topics--slide > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-9.col-xl-50 > div > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div.topics--slide > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-6.col-xl-50 > div > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.col-lg-10 > div > div > div.owl-stage-outer > div > div.owl-item.active > div > div > figure > figcaption > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.col-lg-5 > div > div.div-mostview--list > ul > li > h3 > a, \
+                div.news--slide > div#recommended > div.owl-stage-outer > div > div > div > div > h3 > a, \
+                body > div > div.divsection-container > section > section.section-page > div > div.row.topics-news > div > div > div > h3 > a, \
+                div > div > div > div.col-15.col-lg-6 > div > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div.container > div > div.col-15.col-lg-5 > div.articl--aside > div.div-recommended.mb-30 > div.div-recommended--list > ul > li > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div.container > div > div.col-15.col-lg-5 > div.articl--aside > div.box-topic--bg > div.row > div > div > ul > li > h3 > a, \
+                body > section.section-learning > section > div.div-learning-listdetail > div > div > div.col-15.col-md-15.col-lg-10 > div.row.lea-commu > div > article > div > div > h3 > a, \
+                li#primary-slider-slide01 > div > a, \
+                body > section.section-learning > section > div > div > div.col-15.col-md-15.col-lg-10 > div.section-learning--article > div > div > article > div > div > h3 > a, \
+                body > div > div.divsection-container > section.section-page > div > div > div > div > div > h3 > a, \
+                #trending-widget > div > div.news--slide > div > div > div > div > a, \
+                div > div.videoCube.trc_spotlight_item.origin-default.thumbnail_top.textItem.videoCube_2_child.trc_excludable > a, \
+                body > div > div.divsection-container > section.section-page > div > div > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-9.col-xl-50 > div > a, \
+                #alphabet-a > div.mt-5 > div.news--slide > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div > div > div.div-section--main.mb-5 > div.news--list.border-bottom.mb-4.pb-3 > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div > div > div.div-section--main.mb-5 > div.news--list-noimg > ul > li > h3 > a, \
+                div > div.videoCube.trc_spotlight_item.origin-default.thumbnail_top.textItem.videoCube_1_child.trc-first-recommendation.trc-spotlight-first-recommendation.trc_excludable > a, \
+                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.boxnews--notshow-mobi.mt-md-5 > div > div > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div.row.page--link > div > div > div > h3 > a, \
+                body > div.divbody-container > div.divsection-container > section > div > div.subsect--latest > div.row.page--link > div > div > div > h3 > a, \
+                body > div.divbody-container.life-container > div.divsection-container > section > div > div.subsect--latest.divlife--latest > div.row.page--link > div > div > div > h3 > a, \
+                #content > div.content-right > ul > li > div > h3 > a, \
+                #content > div.content-right > ul > div > h3 > a'
+
+    body_xpath = '//p[not(contains(@class, "Footnote")) and not(contains(@class, "footnote")) and not(ancestor::div[@class="footer"]) and not(ancestor::div[@class="article-info"]) and not(ancestor::div[@class="article-info--col"]) and not(ancestor::div[@class="article--columnist-history"]) and not(ancestor::div[@class="articlePhotoCenter"]) and not(ancestor::div[@class="embed-responsive-content"]) and not(ancestor::div[@class="PostbagName"])]//text() | //article/div[@class="articl-content"]/ul/li//text() | //article/div[@class="article-content"]/ul/li//text() | //article/div[@class="article-content"]/h2//text()'
+    content_title_selectors = ('div.article-headline > h1::text',)
+    content_date_selectors = ('div.article-info--col:nth-child(1) > p:nth-child(1)::text',
+                              'div.article-info > div.row > div > p::text',
+                              'div.postbag-info-date > a#calendar > span::text',
+                              'div.article-news > article > div.article-info.has-columnnist > div:nth-child(1) > div > div:nth-child(2) > p::text')
+
+    pagination_selector = 'p.page-Navigation > a::attr(href)'
+
+    reparse_listings_in_article_page = False
+
+    def get_article_content(self, response, title, date):
+        print("get_article_content for bangkokpost")
+        body = self.get_body(response)
+
+        if title is None:
+            title = first(response, self.content_title_selectors)
+
+        original_date_str = first(response, self.content_date_selectors)
+
+        if original_date_str is None:
+            print("original_date_str is None for bangkokpost")
+            return title, None, body
+
+        # Original date string
+        # original_date_str = "PUBLISHED : 12 Mar 2024 at 12:42"
+
+        # Preprocess the string to remove unnecessary parts
+        date = original_date_str.split("PUBLISHED :")[-1].split("published :")[-1].split(" at ")[0].strip()
+
+        return title, date, body
@@ -0,0 +1,81 @@
+# Extractors for the vietnam outlets
+
+from covidnews.extractors.base import Extractor, register
+
+
+@register
+class VietnamNewsAgencyExtractor(Extractor):
+    domains = ('vnanet.vn',)
+    path_prefix = '/en'
+
+    listing_selector = 'div.col-big-news.fl-left div.title-big-news h2 > a, \
+                div.list-box-rows.list-box-rows-2.scrollbar.divTopNews ul li.parentMenuItem a, \
+                li.act-cate-main div.sub-cate-main div.big-news-cate-main div.title-bg-grd.title-big-news-main > a, \
+                li.act-cate-main div.sub-cate-main div.list-box-rows.list-box-rows-4.cf ul li > a, \
+                div.list-box-rows.list-box-rows-5.scrollbar ul#divOtherNews li > a, \
+                div.ct-post-details div.feature-list-news ul li div.grp-panel > a, \
+                div.ct-post-details div.grp-list-news-2 ul li div.grp-panel > a, \
+                div.sidebar-rows.fix-sidebar-rows div#divServiceNews.list-news-dv ul li div.grp-panel > a, \
+                div.divTextView.newsListForm div.flex-container div.flex-item.meta-data-port a'
+
+    content_title_selectors = ('div.details__header h1::text',)
+    content_date_selectors = ('time::text',)
+    content_date_overrides_card_date = True
+
+
+@register
+class VietnamNewsExtractor(Extractor):
+    domains = ('vietnamnews.vn',)
+
+    listing_selector = 'html body div.site-content div.l-grid div.l-content div#spotlight_slick.spotlight-slick.slick-initialized.slick-slider div.slick-list.draggable div.slick-track div.d-flex.slick-slide div.slick-meta h2 a, \
+                html body div.site-content div.l-grid div.l-content div.row.feature div.col article.story.story--focus div.story__meta h2 a, \
+                html body div.site-content div.l-grid div.l-content div.row.feature div.col article.story h2 a, \
+                html body div.site-content div.l-grid div.l-content div.highlight section.zone.zone--highlight div.row.zone__content article.col.story h2 a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content article.story.story--focus h2 a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
+                html body div.site-content div.l-grid div.sidebar section.aside.aside--latest div.tab-content div#latest.tab-pane.fade.show.active article.story h2 a, \
+                html body div.site-content div.l-grid div.sidebar div.event ul.event-list li a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--column div.zone__content div.row article.col.story h2 a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-text div.zone__content article.story.story--focus h2 a, \
+                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-text div.zone__content div.row article.col.story h2 a, \
+                html body div.site-content div.area.area--dark div.l-grid section.zone.zone--opinion div.zone__content div.row div.col article.story div.story__meta h2 a, \
+                html body div.site-content div.l-grid.cate-col div.row div.col section.zone div.zone__content article.story h2 a, \
+                html body div.site-content div.l-grid div.l-content.category section.zone.zone--cate.has-thumb div.zone__content article.story.story--focus h2 a, \
+                html body div.site-content div.l-grid div.l-content.category section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
+                html body div.site-content div.l-grid div.l-content.category div.d-flex div.timeline article.story h2 a'
+
+    content_title_selectors = ('div.detail__header h1.headline::text',)
+    content_date_selectors = ('div.datetime::text',)
+    content_date_overrides_card_date = True
+
+    reparse_listings_in_article_page = False
+
+
+@register
+class VietnamPlusExtractor(Extractor):
+    domains = ('en.vietnamplus.vn',)
+
+    listing_selector = 'section.latest-news div.clearfix article.story--text h2 a, \
+                div.spotlight article.story.story--horizontal h2 a, \
+                div.highlight div.l-content div.focus article.story h2 a, \
+                div.highlight div.l-content div.feature.cols-3 article.story h2 a, \
+                div.l-content section.zone--timeline div.clearfix article.story h2 a, \
+                div.clearfix article.story.story--horizontal h2 a, \
+                div.clearfix ul.story--list li a, \
+                div.zone--region__list ul.story--list li a, \
+                div.clearfix article.story.story--large h2 a, \
+                div.clearfix div.right article.story.story--horizontal h2 a, \
+                div.l-content section.zone--cate div.feature.cols-3 article.story h2 a, \
+                div#wrapper-popular section.zone.zone--popular div.clearfix article.story h2 a, \
+                div.clearfix article.story.story--split h2 a, \
+                div.clearfix article.story--large h2 a, \
+                div.clearfix ul li article.story h2 a'
+
+    body_xpath = '//p//text() | //div[contains(@class, "content") and contains(@class, "article-body")]//text()[not(ancestor::div[contains(@class, "article-photo")])]'
+    content_title_selectors = ('div.details__header h1.details__headline.cms-title::text',)
+    ready_selector = 'div.details__header h1.details__headline'
+    content_date_selectors = ('time::text',)
+    content_date_overrides_card_date = True
+
+    reparse_listings_in_article_page = False
@@ -0,0 +1,107 @@
+# Tiered fetch : plain HTTP first, Splash render only when extraction fails
+#
+# Every listing and article page used to be a SplashRequest running js_script, which
+# waits seconds per page even for outlets serving the full article HTML without any
+# javascript. With USE_TIERED_FETCH, a page is first downloaded with a plain
+# scrapy.Request and handed to the outlet extractor. Only when the extraction misses
+# something (no articles on a listing page, no title / body / date on an article page)
+# is the same url requested again through Splash.
+#
+# FetchTierMemory remembers, per kind of page, hostname and url pattern, how often the
+# plain tier succeeded, so a section that always needs javascript goes straight to
+# Splash after a few failures instead of paying for the plain download every time.
+# The counts are kept in a small json file between runs.
+
+import json
+import os
+import re
+from urllib.parse import urlsplit
+
+
+TIER_HTTP = 'http'
+TIER_SPLASH = 'splash'
+
+FETCH_TIER_FILENAME = 'fetch_tiers.json'
+
+# Plain downloads tried for a url pattern before its success rate is trusted
+MIN_HTTP_ATTEMPTS = 3
+
+# Below this success rate of the plain tier, the url pattern goes straight to Splash
+MIN_HTTP_SUCCESS_RATE = 0.5
+
+# Path segments made of ids or dates do not name a section, e.g. khmertimeskh.com/501079622/...
+ID_SEGMENT_PATTERN = re.compile(r"\d")
+
+
+def url_pattern(url):
+    # 'www.straitstimes.com/singapore/jobs/some-slug' -> ('www.straitstimes.com', 'singapore')
+    # the last path segment is the article slug, so it never names a section
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split('/') if segment]
+
+    if len(segments) < 2:
+        section = ''
+    elif ID_SEGMENT_PATTERN.search(segments[0]):
+        section = '#'
+    else:
+        section = segments[0].lower()
+
+    return parts.hostname or '', section
+
+
+class FetchTierMemory:
+    # key 'kind host section' -> {'http_attempts', 'http_successes', 'splash_attempts', 'splash_successes'}
+
+    def __init__(self, directory=None):
+        self.filename = os.path.join(directory, FETCH_TIER_FILENAME) if directory else None
+        self.counts = {}
+
+        if self.filename and os.path.exists(self.filename):
+            with open(self.filename, encoding='utf-8') as f:
+                try:
+                    self.counts = json.load(f)
+                except ValueError:
+                    # file of a crawl that got killed while writing it, start over
+                    self.counts = {}
+
+        print(f"FetchTierMemory : {len(self.counts)} url patterns already known")
+
+    def key(self, kind, url):
+        host, section = url_pattern(url)
+        return f"{kind} {host} {section}"
+
+    def tier(self, kind, url):
+        # Tier to start with for this url
+        counts = self.counts.get(self.key(kind, url))
+
+        if counts is None or counts['http_attempts'] < MIN_HTTP_ATTEMPTS:
+            return TIER_HTTP
+
+        if counts['http_successes'] < counts['http_attempts'] * MIN_HTTP_SUCCESS_RATE:
+            return TIER_SPLASH
+
+        return TIER_HTTP
+
+    def record(self, kind, url, tier, success):
+        counts = self.counts.setdefault(self.key(kind, url), {
+            'http_attempts': 0,
+            'http_successes': 0,
+            'splash_attempts': 0,
+            'splash_successes': 0,
+        })
+
+        counts[f"{tier}_attempts"] += 1
+        if success:
+            counts[f"{tier}_successes"] += 1
+
+    def save(self):
+        if not self.filename:
+            return
+
+        os.makedirs(os.path.dirname(self.filename) or '.', exist_ok=True)
+
+        temporary_filename = self.filename + '.tmp'
+        with open(temporary_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.counts, f, indent=1, sort_keys=True)
+
+        os.replace(temporary_filename, self.filename)
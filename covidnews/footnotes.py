@@ -0,0 +1,476 @@
+# Footnote (author bio, "Edited by", copyright, app promotion ...) removal behind
+# CovidNewsSpider.remove_footnote()
+#
+# The original implementation slid a 3-line window over the body, lowercased and joined
+# the window twice per line, tested all the phrases below against it, and after a hit
+# recursed on the whole cleaned text. This module keeps exactly the same output :
+#   - one Aho-Corasick automaton over the lowercased phrases is built at import time
+#   - the lowercased body (lines joined with ' ' and with '') is scanned once with it,
+#     which gives the first window where any phrase shows up
+#   - only that window goes through the original phrase-priority check and truncation
+#   - the truncation keeps the lines before the window untouched, so the following
+#     rounds (lower priority phrases, see previous_search_footnote_phrase) only have
+#     to look at the new last window instead of the whole text again
+# Only difference : where the original recursed until RecursionError (a phrase found again
+# and again without anything being cut), the text cut so far is returned.
+
+import sys
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+
+# Phrases starting a footnote, in priority order : earlier phrases are removed first, and
+# once one is found only the same or later phrases are looked for in what remains
+FOOTNOTE_PHRASES = [
+    "join st's telegram channel",
+    "join st's whatsapp channel",
+    "download our app",
+    "read this story in",
+    "is an editor at",
+    "is a journalist at",
+    "is a journalist based in",
+    "is a senior journalist at",
+    "is associate fellow",
+    "is a phd candidate",
+    "is a doctoral candidate",
+    "is Research Fellow",
+    "is Associate Professor",
+    "is an associate professor",
+    "is Professor",
+    "is a lecturer",
+    "is a senior lecturer",
+    "is Dean of",
+    "is the Dean of",
+    "Senior Research Associate",
+    "Note:",
+    "Editor's note",
+    "Editor’s Note:",
+    "Editorial note:",
+    "Correction note:",
+    "Clarification note:",
+    "Terence Fernandez is a",
+    "Brian Martin is the managing editor of The Star",
+    "About the author:",
+    "(Author:",
+    "(Author :",
+    "(Authors:",
+    "(Authors :",
+    "(Reporter:",
+    "(Reporter :",
+    "(Reporters:",
+    "(Reporters :",
+    "(Writer:",
+    "(Writer :",
+    "(Writers:",
+    "(Writers :",
+    "(Editor:",
+    "(Editor :",
+    "(Editors:",
+    "(Editors :",
+    "(Writer & Editor:",
+    "(Writer & Editor :",
+    "(Writers & Editors:",
+    "(Writers & Editors :",
+    "(Author/Editor:",
+    "(Author/Editor :",
+    "(Authors/Editors:",
+    "(Authors/Editors :",
+    "The article was edited",
+    "This article was first published",
+    "This story was produced",
+    "The story has been updated",
+    "This story has been updated",
+    "This article has been updated",
+    "this article originally appear",
+    "This story came from",
+    "© The New York Times",
+    "© 2023 the new york times",
+    "© The Financial Times",
+    "© 2021 The Financial Times",
+    "© 2022 The Financial Times",
+    "© 2023 The Financial Times",
+    "©2020 Bloomberg",
+    "©2021 Bloomberg",
+    "©2022 Bloomberg",
+    "©2020 Project Syndicate",
+    "©2021 Project Syndicate",
+    "©2022 project syndicate",
+    "©1995-2022 Project Syndicate",
+    "©Project Syndicate",
+    "Project Syndicate",
+    "©2022",
+    "© 2022",
+    "©2021",
+    "© 2021",
+    "©2020",
+    "© 2020",
+    "© 2016 - 2024 PT. Bina Media Tenggara",
+    "©CNN",
+    "TSB",
+    "lzb",
+    "/lzb",
+    "[atm]",
+    "/atm",
+    "Sources: Reuters",
+    "(Source: AP)",
+    "(Reporting by",
+    "(by Xinhua writer",
+    "(Additional reporting by",
+    "Additional reporting by",
+    "Edited by",  # Comment this out for manual scraping due to truncated words for "accrEdited by"
+    "Produced by:",
+    "Brought to you by",
+    "WITH REPORT FROM", "—REPORTS FROM",
+    "—With a report from", "—WITH REPORTS FROM",
+    "— By YEE XIANG YUN", "— By M. SIVANANTHA SHARMA", "— By FARID WAHAB", "— By ANDY CHUA",
+    "— By REBECCA RAJAENDRAM",
+    "— By GRACE CHEN", "— By PAUL GABRIEL", "— By JEREMY TAN", "— By IMRAN HILMY", "— By SANDHYA MENON",
+    "—Jerome",
+    "–Jaime Laude",
+    "—Julie",
+    "–Helen Flores",
+    "–Elizabeth Marcelo",
+    "—MA. APRIL MIER-MANJARES",
+    "—Jovic",
+    "—JOANNA",
+    "—JUN A. MALIG",
+    "—DONA",
+    "—Nikka",
+    "–Rudy Santos",
+    "—Leila B. Salaverria",
+    "—NESTLE SEMILLA",
+    "—NESTOR",
+    "—Patricia",
+    "—Tina",
+    "— Bella Perez-Rubio",
+    "— KHIRTHNADHEVI KUMAR",
+    "— Christian Deiparine",
+    "— Kaycee Valmonte with Agence France-Presse",
+    "- Jakarta Post",
+    "— Jakarta Post",
+    "– AP",
+    "- AFP",
+    "– AFP",
+    "— AFP",
+    "– dpa",
+    "- Reuters",
+    "— Reuters",
+    "– Reuters",
+    "- Bloomberg",
+    "– Bloomberg",
+    "— Bloomberg",
+    "- Bernama",
+    "– Bernama",
+    "— Bernama",
+    "-- Bernama",
+    "- Xinhua",
+    "— VNS", "VNS Copyrights 2012",
+    "-VNA", "./. VNA", "./.  VNA", "./.   VNA", "./.    VNA",
+    "- The Straits Times/ANN",
+    "– The Straits Times (Singapore)/Asia News Network",
+    "- The Nation Thailand/ANN",
+    "— The Nation Thailand/ANN",
+    "- Philippines Daily Inquirer/ANN",
+    "— Vietnam News",
+    "- Vietnam News/ANN",
+    "- Phnom Penh Post/ANN",
+    "– South China Morning Post",
+    "– Thomson Reuters Foundation",
+    "– Los Angeles Times/Tribune News Service",
+    "– Hartford Courant/Tribune News Service",
+    "– Bangkok Post, Thailand/Tribune News Service",
+    "– Khaleej Times, Dubai/Tribune News Service",
+    "C. Nika – AKP",
+    "C. Nika -AKP",
+    "Pheng Somany – AKP",
+    "Pheng Somany -AKP",
+    "Chea Vannak – AKP",
+    "Chea Vannak -AKP",
+    "Chea Vannak/AKP/KT",
+    "AKP-Lim Nary",
+    "bhf.org",
+    "Gavi.org",
+    "burs/",
+    "burs-",
+    "bangkok post/",
+    "CHINA DAILY/ANN",
+    "Khmer Times/Coventry Telegraph",
+    "Email karnjanak@bangkokpost.co.th",
+    "CONTACT: BANGKOK POST BUILDING",
+    "MCI (P)",
+    "[ac]",
+    "-- More to follow --",
+    "Click below to watch",
+    "Click here for more",
+    "Click here to read more",
+    "View More",
+    "READ:",
+    "READ MORE:",
+    "Read next",
+    "READ NEXT:",
+    "READ MORE HERE",
+    "Read more from",
+    "Read more stories",
+    "READ FULL STORY:",
+    "Read more Global Nation stories",
+    "More from South China Morning Post:",
+    ". Learn more about",
+    "For more news like this",
+    "For more information about",
+    "For the latest news from",
+    "Watch the full news",
+    "RELATED:",
+    "RELATED STORIES",
+    "RELATED STORY",
+    "RELATED VIDEO",
+    "TOPIC:",
+    "Reference:",
+    "Source:",
+    "Visit https://spoti.fi",
+    "catch the olympics games",
+    "cna women is a section on cna",
+    "Write to us at",
+    "Sign up for our daily",
+    "Subscribe now to",
+    ". Subscribe to",
+    "Already a subscriber?",
+    "Download the app and",
+    "We use cookies",
+    "Tags / Keywords:",
+    "By registering, you agree with",
+    "All letter writers must provide full name and address",
+    "All letter writers must provide a full name and address",
+    "To be updated with all the latest news and analyses daily.",
+    "For more news about the novel coronavirus click here",
+    "Follow INQUIRER.net",
+    "The Inquirer Foundation",
+    "The Cambodia Daily is",
+    "Philstar.com is one of the most ",
+    "Khmer Times is now available",
+    "ADVT",
+    "Best viewed on",
+    "Report it to us",
+    "COPYRIGHT ©",
+    "copyright© mediacorp 2023"
+]
+
+FOOTNOTE_PHRASES_IN_LOWERCASE = [phrase.lower() for phrase in FOOTNOTE_PHRASES]
+
+
+class PhraseScanner:
+    # Aho-Corasick automaton reporting every occurrence of every phrase, overlapping ones
+    # included, as (end position, phrase index) in increasing end position
+
+    def __init__(self, phrases):
+        goto = [{}]
+        output = [[]]
+
+        for phrase_index, phrase in enumerate(phrases):
+            state = 0
+            for char in phrase:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    output.append([])
+                    goto[state][char] = next_state
+                state = next_state
+
+            output[state].append(phrase_index)
+
+        # Breadth-first construction of the failure links, folded straight into a
+        # full transition table so that occurrences() never has to follow them
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            transitions = dict(delta[fail[state]])
+            transitions.update(goto[state])
+            delta[state] = transitions
+
+            for char, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(char, 0) if state else 0
+                output[next_state] = output[next_state] + output[fail[next_state]]
+                queue.append(next_state)
+
+        self.delta = delta
+        self.output = [tuple(phrase_indexes) for phrase_indexes in output]
+        self.lengths = [len(phrase) for phrase in phrases]
+
+    def occurrences(self, text, min_phrase_index=0):
+        delta = self.delta
+        output = self.output
+
+        state = 0
+        for position, char in enumerate(text):
+            state = delta[state].get(char, 0)
+
+            if output[state]:
+                for phrase_index in output[state]:
+                    if phrase_index >= min_phrase_index:
+                        yield position + 1, phrase_index
+
+
+FOOTNOTE_SCANNER = PhraseScanner(FOOTNOTE_PHRASES_IN_LOWERCASE)
+
+
+def first_candidate_window(lines, window_size, min_phrase_index):
+    # Index of the first line i such that the window lines[i-window_size+1:i+1], joined with
+    # ' ' or with '', contains one of the phrases, or None
+
+    # str.lower() only depends on the context for the greek final sigma, which none of the
+    # phrases contain, so lowercasing line by line finds the same occurrences as lowercasing
+    # the joined window
+    lowered_lines = [line.lower() for line in lines]
+    first_window = None
+
+    for separator in (' ', ''):
+        starts = []
+        ends = []
+        position = 0
+        for lowered_line in lowered_lines:
+            starts.append(position)
+            position += len(lowered_line)
+            ends.append(position)
+            position += len(separator)
+
+        for end, phrase_index in FOOTNOTE_SCANNER.occurrences(separator.join(lowered_lines), min_phrase_index):
+            start = end - FOOTNOTE_SCANNER.lengths[phrase_index]
+
+            # first and last line the occurrence overlaps, a separator counts as part of the window
+            # only when both of its neighbouring lines are inside the window
+            first_line = bisect_right(starts, start) - 1
+            last_line = bisect_left(ends, end)
+
+            if last_line - first_line <= window_size - 1:
+                # occurrences come by increasing end, so this is the first window for this separator
+                if first_window is None or last_line < first_window:
+                    first_window = last_line
+                break
+
+            if first_window is not None and last_line >= first_window:
+                break
+
+    return first_window
+
+
+def footnote_phrases_in_window(buffer, min_phrase_index):
+    # The original check of one window : phrases in priority order, and where they start
+    buffer_string = ' '.join(buffer).lower()
+    buffer_string_2 = ''.join(buffer).lower()
+
+    for phrase in FOOTNOTE_PHRASES_IN_LOWERCASE[min_phrase_index:]:
+        if phrase in buffer_string:
+            yield phrase, buffer_string.find(phrase)
+        elif phrase in buffer_string_2:
+            yield phrase, buffer_string_2.find(phrase)
+
+
+def cut_footnote(lines, i, buffer, phrase, phrase_start):
+    # Removes the footnote found in the window `buffer` ending at line i, along with all the
+    # subsequent lines, the same way the original implementation did
+    phrase_end = phrase_start + len(phrase)
+
+    # Determine which lines those positions correspond to in the buffer
+    line_lengths = [len(line) + 1 for line in buffer]  # +1 for '\n'
+    line_start_positions = [sum(line_lengths[:i]) for i in range(len(buffer))]
+    line_end_positions = [sum(line_lengths[:i+1]) for i in range(len(buffer))]
+
+    # None when no line qualifies, which only happens when lowercasing made the window longer
+    for start, end in zip(line_start_positions, line_end_positions):
+        if start <= phrase_start < end or start < phrase_end <= end:
+            phrase_is_located_at_this_buffer_index = line_start_positions.index(start)
+
+            orig_buf_len = len(buffer)
+            # pop() for 'line_with_the_footnote_phrase' only removes 1 single element, but not the subsequent elements
+            line_with_the_footnote_phrase = buffer.pop(phrase_is_located_at_this_buffer_index)
+
+            # removes subsequent element in 'buffer'
+            for ws_i in range(phrase_is_located_at_this_buffer_index, len(buffer)):
+                if phrase_is_located_at_this_buffer_index > 0:
+                    buffer.pop(ws_i)
+                else:
+                    buffer = []
+
+            line_without_the_footnote_phrase = line_with_the_footnote_phrase[:phrase_start-start]
+
+            footnote_is_spread_across_multiple_buffer_items = \
+                (len(phrase) > end - start) or \
+                (phrase_end > end)
+
+            # Remove the exact line containing footnote phrase as well as all other subsequent lines
+            if phrase_is_located_at_this_buffer_index == 0:
+                lines[i-orig_buf_len+1:] = ''
+            else:
+                if not footnote_is_spread_across_multiple_buffer_items:
+                    lines[i:] = ''
+                else:
+                    lines[i-len(buffer):] = ''
+
+            # Combines lines that have no footnote phrase
+            lines.append(line_without_the_footnote_phrase)
+            return lines
+
+
+def remove_footnote(text, window_size=3, previous_search_footnote_phrase=None):
+    if previous_search_footnote_phrase:
+        min_phrase_index = FOOTNOTE_PHRASES_IN_LOWERCASE.index(previous_search_footnote_phrase)
+    else:
+        min_phrase_index = 0
+
+    scan_all_windows = True
+    rounds = 0
+
+    while True:
+        # cleans up some strange character
+        text = text.replace('\xa0', ' ')
+        text = text.replace('<200b>', ' ')
+
+        # splits into multiple tokens using newline characters
+        lines = text.split('\n')
+        lines = [l.strip() for l in lines]
+
+        if scan_all_windows:
+            i = first_candidate_window(lines, window_size, min_phrase_index)
+        else:
+            # every window but the last one was already checked against these phrases
+            i = len(lines) - 1
+
+        cleaned_lines = None
+        while cleaned_lines is None and i is not None and i < len(lines):
+            window = lines[max(0, i - window_size + 1):i + 1]
+
+            for phrase, phrase_start in footnote_phrases_in_window(window, min_phrase_index):
+                cleaned_lines = cut_footnote(lines, i, list(window), phrase, phrase_start)
+                if cleaned_lines is not None:
+                    break
+            else:
+                # only when the scan hit a window that cut_footnote() gave up on
+                i += 1
+
+        if cleaned_lines is None:
+            # return the original text if no footnote was found
+            return text
+
+        # Join the lines back into a single string
+        cleaned_text = "\n".join(cleaned_lines)
+
+        # to make sure ALL footnote phrases are removed completely : the original implementation
+        # recursed with the same or later phrases only, and always with a window of 3 lines
+        next_min_phrase_index = FOOTNOTE_PHRASES_IN_LOWERCASE.index(phrase)
+
+        # A cut that leaves the text as it was (e.g. a phrase ending with a space matched across an empty
+        # line) would be found again forever. The original recursion ended up in RecursionError there, which
+        # lost the whole article, the text cut so far is returned instead.
+        rounds += 1
+        if rounds >= sys.getrecursionlimit() or \
+           (cleaned_text == text and next_min_phrase_index == min_phrase_index and window_size == 3):
+            return cleaned_text
+
+        text = cleaned_text
+        min_phrase_index = next_min_phrase_index
+        scan_all_windows = window_size < 3
+        window_size = 3
@@ -0,0 +1,216 @@
+# Persistent, cross-run url frontier
+#
+# SplashAwareDupeFilter only remembers the urls of the current run, so every
+# `scrapy crawl covid_news_spider` used to render again all the listing and article
+# pages it already processed before. UrlFrontier keeps on local disk:
+#   - a scalable Bloom filter per kind of url (listing, article), which answers most
+#     "never seen" questions in memory, with a bounded footprint (about 2 bytes per url)
+#   - an exact sqlite index of confirmed urls, only consulted on a Bloom filter hit,
+#     which also keeps the last visit time so listing pages can be revisited after a TTL
+
+import math
+import os
+import sqlite3
+import struct
+import time
+from hashlib import blake2b
+
+
+BLOOM_FILE_MAGIC = b'CNBLOOM1'
+
+URL_KIND_LISTING = 'listing'
+URL_KIND_ARTICLE = 'article'
+
+
+class BloomFilter:
+    # Fixed capacity Bloom filter, k bit positions derived from one blake2b digest (double hashing)
+
+    def __init__(self, capacity, error_rate, count=0, bits=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = count
+
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+
+    def positions(self, digest):
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def contains(self, digest):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.positions(digest))
+
+    def add(self, digest):
+        bits = self.bits
+        for position in self.positions(digest):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def is_full(self):
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    # Chain of Bloom filters, each one twice as large and with a tighter error rate than
+    # the previous one, so the overall false positive rate stays below error_rate however
+    # many urls are added (Almeida et al., "Scalable Bloom Filters")
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, initial_capacity=1_000_000, error_rate=0.001):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters = []
+
+    @staticmethod
+    def digest(key):
+        return blake2b(key.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def __contains__(self, key):
+        digest = self.digest(key)
+        return any(bloom.contains(digest) for bloom in reversed(self.filters))
+
+    def add(self, key):
+        digest = self.digest(key)
+
+        if any(bloom.contains(digest) for bloom in self.filters):
+            return False
+
+        if not self.filters or self.filters[-1].is_full():
+            capacity = self.initial_capacity * self.GROWTH ** len(self.filters)
+            error_rate = self.error_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** len(self.filters)
+            self.filters.append(BloomFilter(capacity, error_rate))
+
+        self.filters[-1].add(digest)
+        return True
+
+    def __len__(self):
+        return sum(bloom.count for bloom in self.filters)
+
+    def memory_size(self):
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+    def save(self, filename):
+        # Written next to the target then renamed, so a killed crawl never leaves a truncated file
+        temporary_filename = filename + '.tmp'
+
+        with open(temporary_filename, 'wb') as f:
+            f.write(BLOOM_FILE_MAGIC)
+            f.write(struct.pack('<QdI', self.initial_capacity, self.error_rate, len(self.filters)))
+
+            for bloom in self.filters:
+                f.write(struct.pack('<QdQ', bloom.capacity, bloom.error_rate, bloom.count))
+                f.write(bloom.bits)
+
+        os.replace(temporary_filename, filename)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'rb') as f:
+            if f.read(len(BLOOM_FILE_MAGIC)) != BLOOM_FILE_MAGIC:
+                raise ValueError(f"{filename} is not a bloom filter file")
+
+            initial_capacity, error_rate, num_filters = struct.unpack('<QdI', f.read(struct.calcsize('<QdI')))
+            scalable_bloom = cls(initial_capacity, error_rate)
+
+            for _ in range(num_filters):
+                capacity, bloom_error_rate, count = struct.unpack('<QdQ', f.read(struct.calcsize('<QdQ')))
+                bloom = BloomFilter(capacity, bloom_error_rate, count)
+                bloom.bits = bytearray(f.read(len(bloom.bits)))
+                scalable_bloom.filters.append(bloom)
+
+        return scalable_bloom
+
+
+class UrlFrontier:
+    # Seen-set shared by every run of the spider, stored inside `directory`
+
+    def __init__(self, directory, listing_ttl, initial_capacity=1_000_000, error_rate=0.001, commit_every=1000):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.listing_ttl = listing_ttl
+        self.commit_every = commit_every
+        self.pending_writes = 0
+
+        self.db = sqlite3.connect(os.path.join(directory, 'seen_urls.sqlite3'))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                visited_at REAL NOT NULL,
+                PRIMARY KEY (url, kind)
+            ) WITHOUT ROWID
+        """)
+
+        # The Bloom filters are only saved by close(), this marker tells whether the previous run got there
+        crashed = os.path.exists(self.running_marker_filename())
+        open(self.running_marker_filename(), 'w').close()
+
+        self.blooms = {}
+        for kind in (URL_KIND_LISTING, URL_KIND_ARTICLE):
+            filename = self.bloom_filename(kind)
+
+            if os.path.exists(filename) and not crashed:
+                self.blooms[kind] = ScalableBloomFilter.load(filename)
+            else:
+                # Rebuilt from the exact index, which is committed as the crawl goes
+                self.blooms[kind] = ScalableBloomFilter(initial_capacity, error_rate)
+                for (url,) in self.db.execute("SELECT url FROM seen_urls WHERE kind = ?", (kind,)):
+                    self.blooms[kind].add(url)
+
+    def bloom_filename(self, kind):
+        return os.path.join(self.directory, f"{kind}_urls.bloom")
+
+    def running_marker_filename(self):
+        return os.path.join(self.directory, 'running')
+
+    def visited_at(self, url, kind):
+        # The Bloom filter has no false negatives, so a miss never needs a disk lookup
+        if url not in self.blooms[kind]:
+            return None
+
+        row = self.db.execute("SELECT visited_at FROM seen_urls WHERE url = ? AND kind = ?", (url, kind)).fetchone()
+        return row[0] if row else None
+
+    def mark(self, url, kind):
+        self.blooms[kind].add(url)
+        self.db.execute("INSERT OR REPLACE INTO seen_urls (url, kind, visited_at) VALUES (?, ?, ?)", (url, kind, time.time()))
+
+        self.pending_writes += 1
+        if self.pending_writes >= self.commit_every:
+            self.flush()
+
+    def is_known_article(self, url, max_age=None):
+        # max_age (seconds) lets articles processed long enough ago be fetched again
+        visited_at = self.visited_at(url, URL_KIND_ARTICLE)
+        return visited_at is not None and (max_age is None or time.time() - visited_at < max_age)
+
+    def add_article(self, url):
+        self.mark(url, URL_KIND_ARTICLE)
+
+    def should_fetch_listing(self, url):
+        # Listing pages keep getting new articles, so they are revisited once listing_ttl has passed
+        visited_at = self.visited_at(url, URL_KIND_LISTING)
+        return visited_at is None or time.time() - visited_at >= self.listing_ttl
+
+    def add_listing(self, url):
+        self.mark(url, URL_KIND_LISTING)
+
+    def flush(self):
+        self.db.commit()
+        self.pending_writes = 0
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+        for kind, bloom in self.blooms.items():
+            bloom.save(self.bloom_filename(kind))
+
+        os.remove(self.running_marker_filename())
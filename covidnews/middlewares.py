@@ -6,22 +6,14 @@
 from scrapy import signals
 from scrapy.http import HtmlResponse
 
-import time
-import logging
-
 # For javascript handling
-from selenium import webdriver
-from selenium.webdriver.chromium.options import ChromiumOptions as Chrome_Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as Firefox_Options
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-import asyncio
+from covidnews.selenium_pool import DriverPool, SELENIUM_DRIVERS, SELENIUM_MAX_MEMORY_GROWTH, SELENIUM_MAX_PAGES_PER_DRIVER
+from scrapy.utils.httpobj import urlparse_cached
+from twisted.internet import reactor
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
 from twisted.internet import defer
 from scrapy.utils.defer import mustbe_deferred
-from scrapy.utils.python import to_bytes
-from playwright.async_api import async_playwright
 
 # useful for handling different item types with a single interface
 from itemadapter import is_item, ItemAdapter
@@ -61,60 +53,39 @@ class ForgivingHttpCompressionMiddleware(HttpCompressionMiddleware):
 
 
 class SeleniumMiddleware:
-    def __init__(self):
-        selenium_logger = logging.getLogger('selenium.webdriver.remote.remote_connection')
-        selenium_logger.setLevel(logging.ERROR)
-        options = Firefox_Options()
-        #options = Chrome_Options()
-        options.headless = True
-        options.add_argument('--headless')
-        self.driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
-        #self.driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-
-    def __del__(self):
-        self.driver.quit()
-
-    def wait_for_ajax(self):
-        wait_start = time.time()
-        while time.time() - wait_start < 10:  # wait for 10 seconds
-            try:
-                is_ajax_finished = self.driver.execute_script("return jQuery.active == 0")
-                if is_ajax_finished:
-                    break
-            except Exception as e:
-                pass
-            time.sleep(0.5)
-        else:
-            print("Waited 10 seconds for AJAX, moving on regardless if it's finished.")
-            #time.sleep(10)  # Wait for another 10 seconds, for debugging purpose
+    # Page loads run on a thread pool with one headless driver per thread, see covidnews.selenium_pool
 
-    def process_request(self, request, spider):
-        self.driver.get(request.url)
-        self.wait_for_ajax()
-        return HtmlResponse(self.driver.current_url, body=self.driver.page_source, encoding='utf-8', request=request)
+    def __init__(self, settings, stats=None):
+        size = settings.getint('SELENIUM_DRIVERS', SELENIUM_DRIVERS)
+
+        self.pool = DriverPool(
+            size=size,
+            max_pages_per_driver=settings.getint('SELENIUM_MAX_PAGES_PER_DRIVER', SELENIUM_MAX_PAGES_PER_DRIVER),
+            max_memory_growth=settings.getfloat('SELENIUM_MAX_MEMORY_GROWTH', SELENIUM_MAX_MEMORY_GROWTH),
+            stats=stats
+        )
 
+        self.threadpool = ThreadPool(minthreads=0, maxthreads=size, name='selenium')
+        self.threadpool.start()
 
-class PlaywrightMiddleware:
-    def __init__(self):
-        self.playwright = None
-        self.browser = None
-        self.loop = asyncio.get_event_loop()
-        self.loop.run_until_complete(self.launch_browser())
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = cls(crawler.settings, crawler.stats)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
 
-    async def launch_browser(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch()
+    def process_request(self, request, spider):
+        if request.meta.get('selenium') is False or urlparse_cached(request).path == '/robots.txt':
+            return None
 
-    async def process_request(self, request, spider):
-        page = await self.browser.new_page()
-        response = await page.goto(request.url)
-        body = await response.text()
-        await page.close()
-        return HtmlResponse(url=request.url, body=to_bytes(body), encoding='utf-8', request=request)
+        d = deferToThreadPool(reactor, self.threadpool, self.pool.fetch, request.url)
+        d.addCallback(lambda page: HtmlResponse(page[0], body=page[1], encoding='utf-8', request=request))
+        return d
 
     def spider_closed(self, spider):
-        self.loop.run_until_complete(self.browser.close())
-        self.loop.run_until_complete(self.playwright.stop())
+        self.threadpool.stop()
+        self.pool.close()
+        print(f"Selenium driver utilization :\n{self.pool.summary()}")
 
 
 class CovidnewsSpiderMiddleware:
@@ -7,7 +7,256 @@
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 
+import time
+
+from scrapy.exceptions import NotConfigured
+from twisted.internet import defer, reactor, task
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+from w3lib.url import canonicalize_url
+
+# For the articles database
+from covidnews.article_db import connect, upsert_items
+
+# For the production articles collection
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import AutoReconnect, BulkWriteError, ConnectionFailure, OperationFailure
+
+
+SQLITE_DATABASE = 'articles.sqlite3'
+SQLITE_BATCH_SIZE = 500
+
+MONGO_DATABASE = 'covidnews'
+MONGO_COLLECTION = 'articles'
+MONGO_BATCH_SIZE = 500
+MONGO_FLUSH_INTERVAL = 5.0  # seconds, a partial batch is written once its oldest item is this old
+MONGO_MAX_RETRIES = 3
+
 
 class CovidnewsPipeline:
     def process_item(self, item, spider):
         return item
+
+
+class BatchPipeline:
+    # Buffers the items of get_article_content() and writes them in batches on a single worker thread,
+    # off the reactor thread. One thread keeps the batches in order, and suits sqlite connections which
+    # belong to the thread that opened them.
+    #
+    # Subclasses implement open_store(), write_batch(items) and close_store(), all called on the worker thread.
+
+    thread_name = 'batch'
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.buffer = []
+        self.pending = []
+        self.threadpool = ThreadPool(minthreads=1, maxthreads=1, name=self.thread_name)
+
+    def run_in_thread(self, function, *args):
+        return deferToThreadPool(reactor, self.threadpool, function, *args)
+
+    def open_spider(self, spider):
+        self.threadpool.start()
+        return self.run_in_thread(self.open_store)
+
+    def flush(self):
+        items, self.buffer = self.buffer, []
+
+        d = self.run_in_thread(self.write_batch, items)
+        self.pending.append(d)
+
+        def done(result):
+            self.pending.remove(d)
+            return result
+
+        d.addBoth(done)
+        return d
+
+    def process_item(self, item, spider):
+        adapter = ItemAdapter(item)
+
+        if adapter.get('link'):
+            self.buffer.append(adapter.asdict())
+
+        if len(self.buffer) < self.batch_size:
+            return item
+
+        # Only the item filling the batch waits for the write, which slows the crawl down if the store cannot keep up
+        d = self.flush()
+        d.addCallback(lambda _: item)
+        return d
+
+    @defer.inlineCallbacks
+    def close_spider(self, spider):
+        if self.buffer:
+            self.flush()
+
+        yield defer.DeferredList(list(self.pending))
+        yield self.run_in_thread(self.close_store)
+        self.threadpool.stop()
+
+
+class SqlitePipeline(BatchPipeline):
+    # Upserts into covidnews.article_db, keyed by canonical url, with a full-text index over title and body
+
+    thread_name = 'sqlite'
+
+    def __init__(self, database, batch_size):
+        super().__init__(batch_size)
+        self.database = database
+        self.db = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            crawler.settings.get('SQLITE_DATABASE', SQLITE_DATABASE),
+            crawler.settings.getint('SQLITE_BATCH_SIZE', SQLITE_BATCH_SIZE)
+        )
+
+    def open_store(self):
+        self.db = connect(self.database)
+
+    def write_batch(self, items):
+        upsert_items(self.db, items)
+
+    def close_store(self):
+        self.db.close()
+
+
+class MongoPipeline(BatchPipeline):
+    # Ordered bulk_write() of upserts keyed by canonical url, one round trip per batch instead of per item.
+    # A batch is written once it has batch_size items, or flush_interval seconds after its first item.
+    #
+    # client_factory() is called on the worker thread and returns the client to write with, a MongoClient
+    # of MONGO_URI in a crawl, or any stand-in with the same bulk_write() and close() (mongomock ...)
+
+    thread_name = 'mongo'
+
+    def __init__(self, client_factory, database=MONGO_DATABASE, collection=MONGO_COLLECTION, batch_size=MONGO_BATCH_SIZE,
+                 flush_interval=MONGO_FLUSH_INTERVAL, max_retries=MONGO_MAX_RETRIES, stats=None):
+        super().__init__(batch_size)
+        self.client_factory = client_factory
+        self.database = database
+        self.collection_name = collection
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.stats = stats
+
+        self.client = None
+        self.collection = None
+        self.buffer_started_at = None
+        self.flush_timer = task.LoopingCall(self.flush_if_old)
+
+        # per batch latency in seconds, for the summary printed by close_spider()
+        self.batch_latencies = []
+        self.retries = 0
+        self.failed_batches = 0
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        uri = settings.get('MONGO_URI')
+
+        if not uri:
+            raise NotConfigured("MONGO_URI is not set")
+
+        return cls(
+            lambda: MongoClient(uri),
+            database=settings.get('MONGO_DATABASE', MONGO_DATABASE),
+            collection=settings.get('MONGO_COLLECTION', MONGO_COLLECTION),
+            batch_size=settings.getint('MONGO_BATCH_SIZE', MONGO_BATCH_SIZE),
+            flush_interval=settings.getfloat('MONGO_FLUSH_INTERVAL', MONGO_FLUSH_INTERVAL),
+            max_retries=settings.getint('MONGO_MAX_RETRIES', MONGO_MAX_RETRIES),
+            stats=crawler.stats
+        )
+
+    def open_spider(self, spider):
+        self.flush_timer.start(min(1.0, self.flush_interval), now=False)
+        return super().open_spider(spider)
+
+    def open_store(self):
+        self.client = self.client_factory()
+        self.collection = self.client[self.database][self.collection_name]
+
+    def process_item(self, item, spider):
+        if not self.buffer:
+            self.buffer_started_at = time.monotonic()
+        return super().process_item(item, spider)
+
+    def flush_if_old(self):
+        if self.buffer and time.monotonic() - self.buffer_started_at >= self.flush_interval:
+            self.flush()
+
+    def write_batch(self, items):
+        operations = [
+            UpdateOne({'_id': canonicalize_url(item['link'])}, {'$set': item}, upsert=True)
+            for item in items
+        ]
+        started = time.monotonic()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.collection.bulk_write(operations, ordered=True)
+                break
+
+            except (AutoReconnect, ConnectionFailure) as e:
+                # upserts are idempotent, the whole batch can be sent again
+                if attempt == self.max_retries:
+                    self.drop_batch(items, f"after {attempt} retries : {e}")
+                    return
+
+                self.retries += 1
+                self.inc_stat('mongo/retries')
+                time.sleep(2 ** attempt)
+
+            except BulkWriteError as e:
+                # a rejected document (too large, validation ...), the ordered bulk stopped there, sending it again would too
+                write_errors = e.details.get('writeErrors') or [{}]
+                self.drop_batch(items, f": {e.details.get('nUpserted', 0) + e.details.get('nMatched', 0)} written before "
+                                       f"{len(write_errors)} write errors, first : {write_errors[0].get('errmsg')}")
+                return
+
+            except OperationFailure as e:
+                # refused by the server (authorization, quota ...), not worth retrying either
+                self.drop_batch(items, f": {e}")
+                return
+
+        latency = time.monotonic() - started
+        self.batch_latencies.append(latency)
+        self.inc_stat('mongo/batches')
+        self.inc_stat('mongo/items_upserted', len(items))
+
+        if self.stats is not None:
+            self.stats.max_value('mongo/batch_latency_max_ms', int(latency * 1000))
+
+    def drop_batch(self, items, reason):
+        # Nothing consumes a failure of the deferred of a flush, a failed batch is counted and logged here instead
+        self.failed_batches += 1
+        self.inc_stat('mongo/failed_batches')
+        print(f"MongoPipeline : dropped a batch of {len(items)} items {reason}")
+
+    def inc_stat(self, key, count=1):
+        # called from the worker thread, stats collectors are plain dicts so an increment is safe enough
+        if self.stats is not None:
+            self.stats.inc_value(key, count)
+
+    def close_store(self):
+        if self.client is not None:
+            self.client.close()
+
+    def close_spider(self, spider):
+        if self.flush_timer.running:
+            self.flush_timer.stop()
+
+        d = super().close_spider(spider)
+        d.addCallback(lambda _: print(f"MongoPipeline : {self.summary()}"))
+        return d
+
+    def summary(self):
+        if not self.batch_latencies:
+            return f"no batch written, {self.retries} retries, {self.failed_batches} failed batches"
+
+        latencies = sorted(self.batch_latencies)
+        return (f"{len(latencies)} batches, latency p50 {latencies[len(latencies) // 2] * 1000:.0f} ms, "
+                f"max {latencies[-1] * 1000:.0f} ms, {self.retries} retries, {self.failed_batches} failed batches")
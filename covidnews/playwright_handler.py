@@ -0,0 +1,229 @@
+# Pooled, concurrent Playwright download handler
+#
+# The former PlaywrightMiddleware opened a new page on one shared browser for every
+# request, launched that browser with loop.run_until_complete() although scrapy already
+# runs on the asyncio reactor, and had no limit on the number of open pages.
+#
+# PlaywrightDownloadHandler replaces the http / https download handlers (see the
+# USE_PLAYWRIGHT custom_settings of the spider) :
+#   - one Chromium instance, launched on the first request
+#   - at most PLAYWRIGHT_MAX_CONTEXTS browser contexts of PLAYWRIGHT_MAX_PAGES_PER_CONTEXT
+#     pages each, pages are given back to the pool after every request and reused
+#   - at most CONCURRENT_REQUESTS_PER_DOMAIN renders at a time for the same hostname
+#   - image, font, media and ad requests are aborted by a route on every context, they
+#     are not needed to read the article html
+#   - the pool is closed on spider_closed
+# Requests with meta {'playwright': False} and robots.txt go through the plain scrapy
+# HTTP handler.
+
+import asyncio
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from playwright.async_api import async_playwright
+from scrapy import signals
+from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
+from scrapy.http import HtmlResponse
+from scrapy.utils.defer import deferred_from_coro
+from scrapy.utils.httpobj import urlparse_cached
+from twisted.internet import defer
+
+
+PLAYWRIGHT_MAX_CONTEXTS = 4
+PLAYWRIGHT_MAX_PAGES_PER_CONTEXT = 8
+
+# Playwright resource types never downloaded by the browser
+ABORTED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+# Ad and tracker hosts, a request to one of them or to one of their subdomains is aborted
+ABORTED_HOSTS = {
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'adservice.google.com',
+    'amazon-adsystem.com',
+    'scorecardresearch.com',
+    'taboola.com',
+    'outbrain.com',
+    'connect.facebook.net',
+}
+
+# The body handed to scrapy is the decoded html, these headers of the original response no longer apply to it
+DROPPED_RESPONSE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def is_aborted_host(hostname):
+    # 'securepubads.g.doubleclick.net' -> tries 'securepubads.g.doubleclick.net', 'g.doubleclick.net', 'doubleclick.net' ...
+    labels = (hostname or '').split('.')
+    return any('.'.join(labels[i:]) in ABORTED_HOSTS for i in range(len(labels) - 1))
+
+
+class PagePool:
+    # Bounded pool of pages spread over a few browser contexts
+
+    def __init__(self, browser, max_contexts, max_pages_per_context, stats=None):
+        self.browser = browser
+        self.max_contexts = max_contexts
+        self.max_pages_per_context = max_pages_per_context
+        self.stats = stats
+
+        self.contexts = []  # [context, number of pages], in creation order
+        self.idle_pages = []  # [(page, context entry)]
+        self.available = asyncio.Semaphore(max_contexts * max_pages_per_context)
+
+    async def route(self, route):
+        request = route.request
+
+        if request.resource_type in ABORTED_RESOURCE_TYPES or is_aborted_host(urlsplit(request.url).hostname):
+            if self.stats is not None:
+                self.stats.inc_value('playwright/aborted_requests')
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def new_page(self):
+        # a new context while there is room for one, then the least busy context, the
+        # semaphore of acquire() keeps the number of pages of every context below the limit
+        if len(self.contexts) < self.max_contexts:
+            context = await self.browser.new_context()
+            await context.route('**/*', self.route)
+            entry = [context, 0]
+            self.contexts.append(entry)
+
+            if self.stats is not None:
+                self.stats.inc_value('playwright/contexts_created')
+        else:
+            entry = min(self.contexts, key=lambda entry: entry[1])
+
+        entry[1] += 1
+        page = await entry[0].new_page()
+
+        if self.stats is not None:
+            self.stats.inc_value('playwright/pages_created')
+
+        return page, entry
+
+    async def acquire(self):
+        await self.available.acquire()
+
+        if self.idle_pages:
+            return self.idle_pages.pop()
+
+        try:
+            return await self.new_page()
+        except Exception:
+            self.available.release()
+            raise
+
+    async def release(self, page, entry, reusable=True):
+        if reusable and not page.is_closed():
+            self.idle_pages.append((page, entry))
+        else:
+            # crashed or timed out in the middle of a navigation, do not hand it to the next request
+            entry[1] -= 1
+            if not page.is_closed():
+                await page.close()
+
+        self.available.release()
+
+    async def close(self):
+        for context, _ in self.contexts:
+            await context.close()
+
+        self.contexts = []
+        self.idle_pages = []
+
+
+class PlaywrightDownloadHandler:
+    lazy = False
+
+    def __init__(self, settings, crawler=None):
+        self.crawler = crawler
+        self.stats = crawler.stats if crawler is not None else None
+
+        self.max_contexts = settings.getint('PLAYWRIGHT_MAX_CONTEXTS', PLAYWRIGHT_MAX_CONTEXTS)
+        self.max_pages_per_context = settings.getint('PLAYWRIGHT_MAX_PAGES_PER_CONTEXT', PLAYWRIGHT_MAX_PAGES_PER_CONTEXT)
+        self.max_renders_per_domain = settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN')
+        self.navigation_timeout = settings.getfloat('DOWNLOAD_TIMEOUT') * 1000
+        self.wait_until = settings.get('PLAYWRIGHT_WAIT_UNTIL', 'domcontentloaded')
+
+        self.http_handler = HTTP11DownloadHandler(settings, crawler)
+
+        self.playwright = None
+        self.browser = None
+        self.pool = None
+        self.launch_lock = asyncio.Lock()
+        self.domain_semaphores = defaultdict(lambda: asyncio.Semaphore(self.max_renders_per_domain))
+
+        if crawler is not None:
+            crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.settings, crawler)
+
+    def download_request(self, request, spider):
+        if request.meta.get('playwright') is False or urlparse_cached(request).path == '/robots.txt':
+            return self.http_handler.download_request(request, spider)
+
+        return deferred_from_coro(self.render(request))
+
+    async def launch_browser(self):
+        async with self.launch_lock:
+            if self.browser is None:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch()
+                self.pool = PagePool(self.browser, self.max_contexts, self.max_pages_per_context, self.stats)
+
+    async def render(self, request):
+        if self.browser is None:
+            await self.launch_browser()
+
+        async with self.domain_semaphores[urlparse_cached(request).hostname]:
+            page, entry = await self.pool.acquire()
+            reusable = False
+
+            try:
+                response = await page.goto(request.url, wait_until=self.wait_until, timeout=self.navigation_timeout)
+
+                # Everything read from the page before release(), which may hand it over to another request right away
+                if response is not None:
+                    status = response.status
+                    headers = {name: value for name, value in (await response.all_headers()).items() if name not in DROPPED_RESPONSE_HEADERS}
+                else:
+                    # same document navigation, e.g. only the url fragment changed
+                    status = 200
+                    headers = {}
+
+                body = await page.content()
+                url = page.url
+                reusable = True
+            finally:
+                await self.pool.release(page, entry, reusable)
+
+        if self.stats is not None:
+            self.stats.inc_value('playwright/rendered_pages')
+
+        return HtmlResponse(url=url, status=status, headers=headers, body=body, encoding='utf-8', request=request)
+
+    async def shutdown(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    def spider_closed(self, spider):
+        return deferred_from_coro(self.shutdown())
+
+    def close(self):
+        # also called by the downloader when the engine stops, after spider_closed
+        return defer.DeferredList([self.http_handler.close(), deferred_from_coro(self.shutdown())])
@@ -0,0 +1,116 @@
+# Relevance pruning before an article page is fetched
+#
+# parse_article() already has the title and date of the listing card, and the article url
+# often carries its publication date (/2020/04/29/), yet every card used to become a full
+# Splash render, and the keyword and covid period test only ran afterwards, in
+# write_to_local_data(). PrefetchScorer looks at what is known before the fetch :
+#   - the card date, read by the same DateNormalizer as write_to_local_data()
+#   - the date in the url path, /2020/04/29/ or /2020/04/ (the whole month then)
+#   - keyword hits, with the same KeywordMatcher, in the card title and in the url slug
+# and returns one of :
+#   - PREFETCH_PRUNE, a date clearly outside the covid period of the country, the article
+#     would never be written, so it is not fetched at all
+#   - PREFETCH_LIKELY, a keyword hit and nothing against the date
+#   - PREFETCH_AMBIGUOUS, no keyword before the fetch, the body may still have some, the
+#     article is fetched with a lower priority
+
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+
+PREFETCH_PRUNE = 'prune'
+PREFETCH_LIKELY = 'likely'
+PREFETCH_AMBIGUOUS = 'ambiguous'
+
+# A date this close to the covid period is not trusted enough to prune, the card or url date of an
+# article can be a day off its published date, and card dates may lack the timezone
+PRUNE_MARGIN = 2 * 24 * 60 * 60
+
+# /2020/04/29/ or /2020/4/29 or /2020/04/, not followed by more digits (article ids)
+URL_PATH_DATE_PATTERN = re.compile(r'/((?:19|20)\d\d)/(0?[1-9]|1[0-2])(?:/(0?[1-9]|[12]\d|3[01]))?(?=/|$)')
+
+SLUG_SEPARATORS = re.compile(r'[-_/.]+')
+
+
+def url_path_date(url, tzinfo):
+    # [start, end) timestamps of the day (or month) in the url path, None if there is none
+    match = URL_PATH_DATE_PATTERN.search(urlsplit(url).path)
+    if match is None:
+        return None
+
+    year, month, day = int(match.group(1)), int(match.group(2)), match.group(3)
+
+    if day is not None:
+        try:
+            start = datetime(year, month, int(day), tzinfo=tzinfo)
+        except ValueError:
+            # /2021/02/30/, not a date, probably not a date at all
+            return None
+
+        return int(start.timestamp()), int((start + timedelta(days=1)).timestamp())
+
+    start = datetime(year, month, 1, tzinfo=tzinfo)
+    end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=tzinfo)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+def url_slug_text(url):
+    # 'covid-19-vaccination-centre' of .../2021/05/12/covid-19-vaccination-centre as words
+    return SLUG_SEPARATORS.sub(' ', urlsplit(url).path)
+
+
+class PrefetchScorer:
+
+    def __init__(self, keyword_matcher, date_normalizer, period_start, period_end, margin=PRUNE_MARGIN):
+        self.keyword_matcher = keyword_matcher
+        self.date_normalizer = date_normalizer
+        self.period_start = period_start
+        self.period_end = period_end
+        self.margin = margin
+
+        self.verdicts = Counter()
+        self.pruned_by_domain = Counter()
+
+    def is_outside_period(self, start, end):
+        # True when [start, end) does not come within margin of the covid period
+        return end + self.margin <= self.period_start or start - self.margin >= self.period_end
+
+    def url_date_outside_period(self, url):
+        dates = url_path_date(url, self.date_normalizer.local_timezone)
+        return dates is not None and self.is_outside_period(*dates)
+
+    def assess(self, url, title, date, date_formats=(), fetched_at=None):
+        # (verdict, reason) for an article card
+        published_timestamp = self.date_normalizer.timestamp(date, date_formats, fetched_at)
+
+        if published_timestamp is not None and self.is_outside_period(published_timestamp, published_timestamp):
+            return self.verdict(url, PREFETCH_PRUNE, f"card date {date!r} outside the covid period")
+
+        if self.url_date_outside_period(url):
+            return self.verdict(url, PREFETCH_PRUNE, "url date outside the covid period")
+
+        if self.keyword_matcher.is_relevant(title) or self.keyword_matcher.is_relevant(url_slug_text(url)):
+            return self.verdict(url, PREFETCH_LIKELY, "keyword in card title or url")
+
+        return self.verdict(url, PREFETCH_AMBIGUOUS, "no keyword before fetch")
+
+    def verdict(self, url, verdict, reason):
+        self.verdicts[verdict] += 1
+
+        if verdict == PREFETCH_PRUNE:
+            self.pruned_by_domain[urlsplit(url).hostname] += 1
+            print(f"pruned {url} before fetching it, {reason}")
+
+        return verdict, reason
+
+    def record_pruned_listing(self, url):
+        self.verdicts['pruned_listing'] += 1
+        self.pruned_by_domain[urlsplit(url).hostname] += 1
+        print(f"pruned listing link {url} before fetching it, url date outside the covid period")
+
+    def summary(self):
+        verdicts = ', '.join(f"{verdict} {count}" for verdict, count in self.verdicts.most_common()) or 'none'
+        domains = ', '.join(f"{domain} {count}" for domain, count in self.pruned_by_domain.most_common())
+        return f"{verdicts}" + (f"\npruned per domain : {domains}" if domains else '')
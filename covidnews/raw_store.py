@@ -0,0 +1,91 @@
+# Content-addressed store of the raw article pages
+#
+# write_to_local_data() only keeps the cleaned body text, so fixing a selector used to
+# mean crawling (and rendering) everything again. RawPageStore keeps the html of every
+# article page handed to get_article_content() :
+#   - objects/ab/<sha256 of the html>.z, zlib compressed, identical pages (mirrors,
+#     redirects to the same article) are stored once
+#   - pages.jsonl, one json line per fetched page with its url, the listing card data
+#     passed in the request meta, the fetch time, the encoding and the object hash
+# `scrapy reextract` (covidnews/commands/reextract.py) replays get_article_content()
+# over this store, without any network access.
+
+import hashlib
+import json
+import os
+import time
+import zlib
+
+
+PAGES_FILENAME = 'pages.jsonl'
+
+COMPRESSION_LEVEL = 6
+
+# Request meta kept with the page, get_article_content() reads them
+STORED_META_KEYS = ('title', 'date', 'article_url')
+
+
+class RawPageStore:
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.objects_directory = os.path.join(directory, 'objects')
+        os.makedirs(self.objects_directory, exist_ok=True)
+
+        self.pages_filename = os.path.join(directory, PAGES_FILENAME)
+        self.pages_file = None
+
+    def object_filename(self, content_hash):
+        return os.path.join(self.objects_directory, content_hash[:2], content_hash + '.z')
+
+    def put(self, url, body, meta, fetched_at=None, encoding=None):
+        content_hash = hashlib.sha256(body).hexdigest()
+        filename = self.object_filename(content_hash)
+
+        if not os.path.exists(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename + '.tmp', 'wb') as f:
+                f.write(zlib.compress(body, COMPRESSION_LEVEL))
+            os.replace(filename + '.tmp', filename)
+
+        if self.pages_file is None:
+            self.pages_file = open(self.pages_filename, 'a', encoding='utf-8')
+
+        self.pages_file.write(json.dumps({
+            'url': url,
+            'meta': {key: meta.get(key) for key in STORED_META_KEYS},
+            'fetched_at': fetched_at if fetched_at is not None else time.time(),
+            'encoding': encoding,
+            'content_hash': content_hash,
+        }) + '\n')
+        self.pages_file.flush()
+
+        return content_hash
+
+    def get(self, content_hash):
+        with open(self.object_filename(content_hash), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def pages(self):
+        # Latest fetch of every url
+        latest = {}
+
+        if not os.path.exists(self.pages_filename):
+            return []
+
+        with open(self.pages_filename, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    page = json.loads(line)
+                except ValueError:
+                    # last line of a crawl that got killed while writing it
+                    continue
+
+                latest[page['url']] = page
+
+        return list(latest.values())
+
+    def close(self):
+        if self.pages_file is not None:
+            self.pages_file.close()
+            self.pages_file = None
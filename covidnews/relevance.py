@@ -0,0 +1,71 @@
+# Keyword relevance matcher behind CovidNewsSpider.write_to_local_data()
+#
+# Relevance used to be `any(keyword in body.lower() for keyword in search_keywords)` :
+# the whole body was lowercased once per keyword, and 'covid' also matched inside
+# unrelated tokens. KeywordMatcher compiles all the keywords into one case-insensitive
+# pattern and returns, in one pass over the text, how many times each keyword was hit
+# and where. Single-word keywords also match their plural ('vaccines', 'pandemics'),
+# which the substring check accepted, stemming (USE_KEYWORD_STEMMING) goes further.
+
+import re
+
+
+# Suffixes stripped from a single-word keyword when stemming, longest first
+STEM_SUFFIXES = ['ations', 'ation', 'ing', 'es', 'ed', 'e', 's']
+STEM_MIN_LENGTH = 4
+
+# Plural endings always allowed after a single-word keyword
+PLURAL_SUFFIX = r"(?:es|s)?"
+
+
+def stem(keyword):
+    # Light suffix stripping, enough for 'vaccination' / 'vaccine' to also match 'vaccinated', 'vaccines' ...
+    for suffix in STEM_SUFFIXES:
+        if keyword.endswith(suffix) and len(keyword) - len(suffix) >= STEM_MIN_LENGTH:
+            return keyword[:-len(suffix)]
+    return keyword
+
+
+class KeywordMatcher:
+    # scan() returns ({keyword: hit count}, [(start, end, keyword), ...])
+
+    def __init__(self, keywords, use_stemming=False):
+        self.keywords = list(keywords)
+
+        # exact keywords first, so that with stemming 'vaccination' is still counted as itself
+        # and not as 'vaccine' whose stem is the same
+        alternatives = [re.escape(keyword) + (PLURAL_SUFFIX if re.fullmatch(r'\w+', keyword) else '') for keyword in self.keywords]
+        self.group_keywords = list(self.keywords)
+
+        if use_stemming:
+            for keyword in self.keywords:
+                # a keyword without any suffix to strip, like 'covid', would become a prefix match ('covidiot')
+                if re.fullmatch(r'\w+', keyword) and stem(keyword.lower()) != keyword.lower():
+                    # the stem followed by any other letters of the same word
+                    alternatives.append(re.escape(stem(keyword.lower())) + r"[^\W\d_]*")
+                    self.group_keywords.append(keyword)
+
+        # A keyword has to start a word, and must not be followed by another letter,
+        # digits are fine so that 'covid' still matches 'COVID19' but not 'covidiot'
+        self.pattern = re.compile(
+            r"(?<!\w)(?:" + '|'.join(f"({alternative})" for alternative in alternatives) + r")(?![^\W\d_])",
+            re.IGNORECASE
+        )
+
+    def scan(self, text):
+        counts = dict.fromkeys(self.keywords, 0)
+        spans = []
+
+        if text:
+            for match in self.pattern.finditer(text):
+                keyword = self.group_keywords[match.lastindex - 1]
+                counts[keyword] += 1
+                spans.append((match.start(), match.end(), keyword))
+
+        return counts, spans
+
+    def count(self, text):
+        return self.scan(text)[0]
+
+    def is_relevant(self, text):
+        return text is not None and self.pattern.search(text) is not None
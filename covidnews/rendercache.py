@@ -0,0 +1,226 @@
+# Render cache, a scrapy HTTPCACHE_STORAGE for rendered pages
+#
+# Iterating on an extractor used to mean rendering every page through Splash again.
+# RenderCacheStorage keeps the downloaded responses, Splash renders included, on local
+# disk so a development rerun over the same start urls only pays for parsing :
+#   - the key is the canonical target url, plus for a Splash render the hash of the Lua
+#     script and the other render args, so editing js_script or a readiness override
+#     invalidates the right entries only
+#   - every response is one zlib compressed file, the png of a render is part of the
+#     cached Splash response whenever the script returned one
+#   - an sqlite index keeps size and last access time of every entry, the least recently
+#     used ones are evicted once the cache grows past RENDERCACHE_MAX_BYTES
+#   - RENDERCACHE_DOMAIN_TTLS gives an expiration per domain, other domains use
+#     HTTPCACHE_EXPIRATION_SECS (0 means never expires)
+#
+# Enabled with `scrapy crawl covid_news_spider -s HTTPCACHE_ENABLED=1`
+
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from urllib.parse import urlsplit
+
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.project import data_path
+from w3lib.url import canonicalize_url
+
+
+RENDERCACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# Eviction goes this far below RENDERCACHE_MAX_BYTES, so that it does not run again on the next store
+EVICTION_TARGET_RATIO = 0.9
+
+COMPRESSION_LEVEL = 6
+
+# Splash args that are not part of the render key, the script goes in as its hash
+NON_RENDER_ARGS = {'url', 'lua_source', 'save_args', 'load_args'}
+
+# Index updates are committed in batches
+COMMIT_EVERY = 200
+
+
+def render_key(request):
+    # (key, target url) of a plain request, or of a Splash request once SplashMiddleware rewrote it
+    splash_options = request.meta.get('splash', {})
+    splash_args = splash_options.get('args')
+
+    if splash_args is None:
+        url = request.url
+        key_parts = ['http', canonicalize_url(url)]
+    else:
+        url = splash_args.get('url', request.url)
+
+        # SplashDeduplicateArgsMiddleware may have replaced lua_source by its own fingerprint of it
+        lua_source = splash_args.get('lua_source')
+        if lua_source is not None:
+            script_hash = hashlib.sha1(lua_source.encode('utf-8')).hexdigest()
+        else:
+            script_hash = splash_options.get('_local_arg_fingerprints', {}).get('lua_source', '')
+
+        args = {name: value for name, value in splash_args.items() if name not in NON_RENDER_ARGS}
+        key_parts = ['splash', canonicalize_url(url), script_hash, json.dumps(args, sort_keys=True, default=str)]
+
+    return hashlib.sha1('\n'.join(key_parts).encode('utf-8')).hexdigest(), url
+
+
+def domain_ttl(hostname, domain_ttls, default_ttl):
+    # The most specific matching domain wins, 'inquirer.net' also covers 'newsinfo.inquirer.net'
+    labels = (hostname or '').split('.')
+
+    for i in range(len(labels)):
+        domain = '.'.join(labels[i:])
+        if domain in domain_ttls:
+            return domain_ttls[domain]
+
+    return default_ttl
+
+
+def encode_response(response):
+    meta = json.dumps({
+        'url': response.url,
+        'status': response.status,
+        'headers': [(name.decode('latin-1'), [value.decode('latin-1') for value in values]) for name, values in response.headers.items()],
+    }).encode('utf-8')
+
+    return zlib.compress(struct.pack('<I', len(meta)) + meta + response.body, COMPRESSION_LEVEL)
+
+
+def decode_response(data):
+    data = zlib.decompress(data)
+    meta_length, = struct.unpack('<I', data[:4])
+    meta = json.loads(data[4:4 + meta_length])
+    body = data[4 + meta_length:]
+
+    headers = Headers(meta['headers'])
+    response_class = responsetypes.from_args(headers=headers, url=meta['url'], body=body)
+    return response_class(url=meta['url'], headers=headers, status=meta['status'], body=body)
+
+
+class RenderCacheStorage:
+
+    def __init__(self, settings):
+        self.cache_directory = data_path(settings['HTTPCACHE_DIR'], createdir=True)
+        self.max_bytes = settings.getint('RENDERCACHE_MAX_BYTES', RENDERCACHE_MAX_BYTES)
+        self.default_ttl = settings.getint('HTTPCACHE_EXPIRATION_SECS')
+        self.domain_ttls = settings.getdict('RENDERCACHE_DOMAIN_TTLS')
+
+        self.db = None
+        self.directory = None
+        self.total_bytes = 0
+        self.pending_writes = 0
+
+    def open_spider(self, spider):
+        self.directory = os.path.join(self.cache_directory, spider.name, 'render_cache')
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.db = sqlite3.connect(os.path.join(self.directory, 'index.sqlite3'))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_by_access ON entries (accessed_at)")
+
+        self.total_bytes = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        print(f"RenderCacheStorage : {self.total_bytes / 1024 ** 2:.1f} MB cached in {self.directory}")
+
+    def close_spider(self, spider):
+        self.db.commit()
+        self.db.close()
+
+    def entry_filename(self, key):
+        return os.path.join(self.directory, key[:2], key + '.z')
+
+    def commit_later(self):
+        self.pending_writes += 1
+        if self.pending_writes >= COMMIT_EVERY:
+            self.db.commit()
+            self.pending_writes = 0
+
+    def remove(self, key, size):
+        try:
+            os.remove(self.entry_filename(key))
+        except FileNotFoundError:
+            pass
+
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.total_bytes -= size
+
+    def retrieve_response(self, spider, request):
+        key, url = render_key(request)
+        row = self.db.execute("SELECT stored_at, size FROM entries WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        stored_at, size = row
+        ttl = domain_ttl(urlsplit(url).hostname, self.domain_ttls, self.default_ttl)
+
+        if ttl and time.time() - stored_at > ttl:
+            self.remove(key, size)
+            self.commit_later()
+            return None
+
+        try:
+            with open(self.entry_filename(key), 'rb') as f:
+                response = decode_response(f.read())
+        except (OSError, zlib.error, ValueError):
+            # deleted or truncated by hand, render it again
+            self.remove(key, size)
+            self.commit_later()
+            return None
+
+        self.db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        self.commit_later()
+
+        return response
+
+    def store_response(self, spider, request, response):
+        key, url = render_key(request)
+        data = encode_response(response)
+        filename = self.entry_filename(key)
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(filename + '.tmp', filename)
+
+        row = self.db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self.total_bytes -= row[0]
+
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries (key, url, stored_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+            (key, url, now, now, len(data))
+        )
+        self.total_bytes += len(data)
+        self.commit_later()
+
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        # Least recently used first, down to EVICTION_TARGET_RATIO of the size limit
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        evicted = 0
+
+        for key, size in self.db.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            if self.total_bytes <= target:
+                break
+            self.remove(key, size)
+            evicted += 1
+
+        self.db.commit()
+        self.pending_writes = 0
+        print(f"RenderCacheStorage : evicted {evicted} entries, {self.total_bytes / 1024 ** 2:.1f} MB left")
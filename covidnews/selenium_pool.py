@@ -0,0 +1,232 @@
+# Pool of headless Selenium drivers behind SeleniumMiddleware
+#
+# SeleniumMiddleware used to drive one single Firefox from process_request(), on the
+# reactor thread : driver.get() then up to 10 seconds of `time.sleep(0.5)` polling, so
+# the whole crawl waited for one page at a time. DriverPool.fetch() is now run by
+# SeleniumMiddleware on a twisted thread pool with as many threads as drivers, each call
+# borrowing an idle driver (started on first use) and giving it back afterwards.
+#
+# A driver is quit and replaced after max_pages_per_driver pages, or once the memory of
+# its browser processes grew more than max_memory_growth times what it was after its
+# first page (long running Firefox instances leak). Busy time and pages per driver are
+# kept so summary() can tell how well the drivers are used.
+
+import logging
+import os
+import queue
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options as Firefox_Options
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from webdriver_manager.firefox import GeckoDriverManager
+
+
+SELENIUM_DRIVERS = os.cpu_count() or 2
+SELENIUM_MAX_PAGES_PER_DRIVER = 200
+SELENIUM_MAX_MEMORY_GROWTH = 3.0
+
+# Reading the memory of the browser processes walks /proc, only done every so many pages
+MEMORY_CHECK_EVERY = 10
+
+# How long fetch() waits for the page scripts to settle
+AJAX_WAIT_TIMEOUT = 10
+AJAX_POLL_INTERVAL = 0.25
+
+# Pages without jQuery count as settled as soon as the document is loaded
+AJAX_FINISHED_SCRIPT = "return document.readyState === 'complete' && (typeof jQuery === 'undefined' || jQuery.active == 0)"
+
+
+def process_tree_rss(pid):
+    # Resident memory in KB of a process and all its descendants, None where /proc is not available
+    children = {}
+    rss = {}
+
+    try:
+        proc_entries = os.listdir('/proc')
+    except OSError:
+        return None
+
+    for entry in proc_entries:
+        if not entry.isdigit():
+            continue
+
+        try:
+            with open(f'/proc/{entry}/status') as f:
+                status = dict(line.split(':', 1) for line in f if ':' in line)
+        except OSError:
+            # exited in the meantime
+            continue
+
+        child_pid = int(entry)
+        children.setdefault(int(status['PPid']), []).append(child_pid)
+        rss[child_pid] = int(status.get('VmRSS', '0 kB').split()[0])
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+
+    return total
+
+
+class PooledDriver:
+    def __init__(self, number, driver):
+        self.number = number
+        self.driver = driver
+        self.started_at = time.monotonic()
+        self.busy_seconds = 0.0
+        self.pages = 0
+        self.baseline_rss = None
+
+    @property
+    def pid(self):
+        return self.driver.service.process.pid
+
+
+class DriverPool:
+
+    def __init__(self, size=SELENIUM_DRIVERS, max_pages_per_driver=SELENIUM_MAX_PAGES_PER_DRIVER,
+                 max_memory_growth=SELENIUM_MAX_MEMORY_GROWTH, stats=None):
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_memory_growth = max_memory_growth
+        self.stats = stats
+
+        self.idle_drivers = queue.LifoQueue()
+        self.started_drivers = 0
+        self.recycled_drivers = []  # utilization of the drivers already quit, for summary()
+        self.active_drivers = {}
+        self.lock = threading.Lock()
+        self.driver_path = None
+
+        selenium_logger = logging.getLogger('selenium.webdriver.remote.remote_connection')
+        selenium_logger.setLevel(logging.ERROR)
+
+    def start_driver(self):
+        with self.lock:
+            if self.driver_path is None:
+                self.driver_path = GeckoDriverManager().install()
+
+            self.started_drivers += 1
+            number = self.started_drivers
+
+        options = Firefox_Options()
+        options.add_argument('--headless')
+        driver = webdriver.Firefox(service=FirefoxService(self.driver_path), options=options)
+
+        if self.stats is not None:
+            self.stats.inc_value('selenium/drivers_started')
+
+        pooled = PooledDriver(number, driver)
+        with self.lock:
+            self.active_drivers[number] = pooled
+        return pooled
+
+    def quit_driver(self, pooled, reason):
+        print(f"quitting selenium driver {pooled.number} after {pooled.pages} pages ({reason})")
+
+        with self.lock:
+            self.active_drivers.pop(pooled.number, None)
+            self.recycled_drivers.append(self.utilization(pooled))
+
+        if self.stats is not None:
+            self.stats.inc_value(f'selenium/drivers_recycled/{reason}')
+
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"selenium driver {pooled.number} did not quit cleanly : {e}")
+
+    def borrow(self):
+        try:
+            return self.idle_drivers.get_nowait()
+        except queue.Empty:
+            # never more calls at a time than threads, so never more drivers than self.size
+            return self.start_driver()
+
+    def give_back(self, pooled):
+        if pooled.pages >= self.max_pages_per_driver:
+            self.quit_driver(pooled, 'max_pages')
+            return
+
+        if pooled.pages == 1 or pooled.pages % MEMORY_CHECK_EVERY == 0:
+            rss = process_tree_rss(pooled.pid)
+
+            if rss is not None:
+                if pooled.baseline_rss is None:
+                    pooled.baseline_rss = rss
+
+                elif rss > pooled.baseline_rss * self.max_memory_growth:
+                    self.quit_driver(pooled, 'memory_growth')
+                    return
+
+        self.idle_drivers.put(pooled)
+
+    def wait_for_ajax(self, driver):
+        wait_start = time.monotonic()
+
+        while time.monotonic() - wait_start < AJAX_WAIT_TIMEOUT:
+            try:
+                if driver.execute_script(AJAX_FINISHED_SCRIPT):
+                    return
+            except Exception:
+                pass
+            time.sleep(AJAX_POLL_INTERVAL)
+
+        print(f"Waited {AJAX_WAIT_TIMEOUT} seconds for AJAX, moving on regardless if it's finished.")
+
+    def fetch(self, url):
+        # Runs on a pool thread, returns (current url, page source)
+        pooled = self.borrow()
+        started = time.monotonic()
+        healthy = False
+
+        try:
+            pooled.driver.get(url)
+            self.wait_for_ajax(pooled.driver)
+            result = pooled.driver.current_url, pooled.driver.page_source
+            healthy = True
+        finally:
+            pooled.busy_seconds += time.monotonic() - started
+            pooled.pages += 1
+
+            if healthy:
+                self.give_back(pooled)
+            else:
+                # the browser may be hung or gone, start from a fresh one
+                self.quit_driver(pooled, 'error')
+
+        if self.stats is not None:
+            self.stats.inc_value('selenium/pages')
+
+        return result
+
+    def utilization(self, pooled):
+        lifetime = time.monotonic() - pooled.started_at
+        return {
+            'driver': pooled.number,
+            'pages': pooled.pages,
+            'busy_seconds': round(pooled.busy_seconds, 1),
+            'utilization': round(pooled.busy_seconds / lifetime, 3) if lifetime else 0.0,
+        }
+
+    def summary(self):
+        with self.lock:
+            drivers = self.recycled_drivers + [self.utilization(pooled) for pooled in self.active_drivers.values()]
+
+        return '\n'.join(
+            f"selenium driver {entry['driver']} : {entry['pages']} pages, busy {entry['busy_seconds']}s, utilization {entry['utilization']:.0%}"
+            for entry in sorted(drivers, key=lambda entry: entry['driver'])
+        )
+
+    def close(self):
+        while True:
+            try:
+                pooled = self.idle_drivers.get_nowait()
+            except queue.Empty:
+                break
+            self.quit_driver(pooled, 'spider_closed')
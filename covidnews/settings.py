@@ -11,6 +11,7 @@ BOT_NAME = "covidnews"
 
 SPIDER_MODULES = ["covidnews.spiders"]
 NEWSPIDER_MODULE = "covidnews.spiders"
+COMMANDS_MODULE = "covidnews.commands"
 
 
 # Crawl responsibly by identifying yourself (and your website) on the user-agent
@@ -62,9 +63,30 @@ ROBOTSTXT_OBEY = True
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
-#ITEM_PIPELINES = {
+ITEM_PIPELINES = {
 #    "covidnews.pipelines.CovidnewsPipeline": 300,
-#}
+    "covidnews.pipelines.SqlitePipeline": 300,
+    "covidnews.pipelines.MongoPipeline": 400,
+}
+
+# Full-text searchable articles database, see covidnews/article_db.py
+SQLITE_DATABASE = "articles.sqlite3"
+SQLITE_BATCH_SIZE = 500
+
+# Production articles collection, the Mongo pipeline is disabled while MONGO_URI is not set
+MONGO_URI = None  # e.g. "mongodb://localhost:27017"
+MONGO_DATABASE = "covidnews"
+MONGO_COLLECTION = "articles"
+MONGO_BATCH_SIZE = 500
+MONGO_FLUSH_INTERVAL = 5.0
+MONGO_MAX_RETRIES = 3
+
+# `scrapy shardcrawl --shards N`, see covidnews/sharding.py : urls partitioned by domain name ('host') or by url ('url'),
+# shard i listens for the requests handed over by the other shards on SHARD_BASE_PORT + i, and dumps its stats to
+# SHARD_STATS_DIRECTORY, next to its log
+SHARD_BY = 'host'
+SHARD_BASE_PORT = 47100
+SHARD_STATS_DIRECTORY = 'shards'
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
@@ -85,7 +107,10 @@ HTTPCACHE_ENABLED = False
 HTTPCACHE_EXPIRATION_SECS = 0
 HTTPCACHE_DIR = "httpcache"
 HTTPCACHE_IGNORE_HTTP_CODES = []
-HTTPCACHE_STORAGE = 'scrapy_splash.SplashAwareFSCacheStorage'
+#HTTPCACHE_STORAGE = 'scrapy_splash.SplashAwareFSCacheStorage'
+HTTPCACHE_STORAGE = 'covidnews.rendercache.RenderCacheStorage'  # keyed on url, Lua script hash and render args
+RENDERCACHE_MAX_BYTES = 2 * 1024 ** 3  # least recently used renders are evicted past this size
+RENDERCACHE_DOMAIN_TTLS = {}  # e.g. {'straitstimes.com': 24 * 60 * 60}, other domains use HTTPCACHE_EXPIRATION_SECS
 #HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
 
 # Set settings whose default value is deprecated to a future-proof value
@@ -0,0 +1,351 @@
+# Several crawler processes on one host, each owning a hash partition of the urls
+#
+# A Scrapy process runs on one core, and that core is saturated by the parse side : the
+# url filter chains, fix_url(), remove_footnote(), the BeautifulSoup passes of some
+# extractors. `scrapy shardcrawl --shards N` (covidnews/commands/shardcrawl.py) starts N
+# `scrapy crawl` processes with `-a shard=i -a shards=N`, and ShardRouter, a spider
+# middleware, makes every url belong to exactly one of them :
+#   - shard_of() hashes the domain name of the url (SHARD_BY = 'host', every request of an
+#     outlet stays in one process, so do its politeness and robots.txt), or the whole
+#     canonical url (SHARD_BY = 'url', even spread when a few outlets dominate)
+#   - start requests and links found by a shard that belong to another one are handed over
+#     through a localhost TCP connection to the owner (port SHARD_BASE_PORT + owner), which
+#     schedules them as if it had found them itself. Messages are json, and a connection is
+#     only listened to once it sent the random token the launcher gives to the shards of a
+#     run (SHARD_TOKEN_VARIABLE), other local processes cannot inject requests.
+#   - a shard only closes once every shard is idle and every handed over request has been
+#     received, the counts being exchanged between shards while they wait. A shard that
+#     cannot listen on its port closes right away, and the launcher then stops the others.
+#   - each shard keeps its own url frontier, raw page store and article segments in a
+#     shard-<i>-of-<N>/ sub-directory, and dumps its stats to SHARD_STATS_DIRECTORY, which
+#     the launcher merges into one report
+# The url -> shard mapping only holds for the same N, a rerun with another number of
+# shards starts with empty frontiers.
+
+import base64
+import hmac
+import json
+import os
+import zlib
+from urllib.parse import urlsplit
+
+from twisted.internet import reactor
+from twisted.internet.error import CannotListenError
+from twisted.internet.protocol import Factory, ReconnectingClientFactory
+from twisted.protocols.basic import Int32StringReceiver
+from scrapy import Request, signals
+from scrapy.exceptions import DontCloseSpider
+from scrapy.utils.request import request_from_dict
+from w3lib.url import canonicalize_url
+
+
+SHARD_BY = 'host'  # or 'url'
+SHARD_BASE_PORT = 47100
+SHARD_STATS_DIRECTORY = 'shards'
+
+# Environment variable with the token of a shardcrawl run, set by the launcher
+SHARD_TOKEN_VARIABLE = 'COVIDNEWS_SHARD_TOKEN'
+
+# Largest message between shards, a request with its Lua script is a few kB
+MAX_MESSAGE_LENGTH = 16 * 1024 * 1024
+
+# Stats that are a maximum per process rather than a count
+MAX_STATS = ('elapsed_time_seconds', 'memusage/max')
+
+
+def shard_of(key, shards):
+    # crc32, unlike hash(), is the same in every process
+    return zlib.crc32(key.encode('utf-8')) % shards
+
+
+def shard_directory(directory, shard, shards):
+    # Per shard state directory, unchanged for a single process crawl
+    if directory is None or shards <= 1:
+        return directory
+    return os.path.join(directory, f"shard-{shard}-of-{shards}")
+
+
+def stats_filename(directory, shard):
+    return os.path.join(directory, f"stats-{shard}.json")
+
+
+def finish_reason(directory, shard):
+    # Why a shard closed, None while it has not dumped its stats
+    try:
+        with open(stats_filename(directory, shard), encoding='utf-8') as f:
+            return json.load(f).get('finish_reason')
+    except (OSError, ValueError):
+        return None
+
+
+def encode_message(message):
+    # a meta value json does not know (a datetime ...) goes over as its text
+    return json.dumps(message, default=str).encode('utf-8')
+
+
+def encode_request(request, spider):
+    # Request.to_dict() as json, the body as base64 and the headers as latin-1 text, the meta of this spider is json already
+    request_dict = request.to_dict(spider=spider)
+    request_dict['body'] = base64.b64encode(request_dict['body']).decode('ascii')
+    request_dict['headers'] = {key.decode('latin-1'): [value.decode('latin-1') for value in values]
+                               for key, values in request_dict['headers'].items()}
+    return request_dict
+
+
+def decode_request(request_dict, spider):
+    return request_from_dict(dict(request_dict, body=base64.b64decode(request_dict['body'])), spider=spider)
+
+
+def merge_stats(shard_stats):
+    # One stats dict out of the stats of every shard : counts are added up, start time, finish time and
+    # maxima are taken across shards, and the distinct values of the other stats are listed
+    merged = {}
+
+    for stats in shard_stats:
+        for key, value in stats.items():
+            if key not in merged:
+                merged[key] = value
+            elif key == 'start_time':
+                merged[key] = min(merged[key], value)
+            elif key == 'finish_time' or key in MAX_STATS or key.endswith('_max_ms'):
+                merged[key] = max(merged[key], value)
+            elif isinstance(value, (int, float)) and isinstance(merged[key], (int, float)):
+                merged[key] += value
+            elif str(value) not in str(merged[key]).split(', '):
+                merged[key] = f"{merged[key]}, {value}"
+
+    return merged
+
+
+class ShardProtocol(Int32StringReceiver):
+    # Length prefixed json messages between the processes of one shardcrawl, the first one of a connection is
+    # ['hello', token of the run]
+    MAX_LENGTH = MAX_MESSAGE_LENGTH
+
+    authenticated = False
+
+    def connectionMade(self):
+        self.factory.connection_made(self)
+
+    def stringReceived(self, data):
+        try:
+            message = json.loads(data)
+        except ValueError:
+            message = None
+
+        if not self.authenticated:
+            token = self.factory.router.token.encode('utf-8')
+
+            if not (isinstance(message, list) and len(message) == 2 and message[0] == 'hello' and
+                    hmac.compare_digest(str(message[1]).encode('utf-8'), token)):
+                print(f"shard {self.factory.router.shard} : closing a connection without the token of this run")
+                self.transport.loseConnection()
+                return
+
+            self.authenticated = True
+            return
+
+        if message is not None:
+            self.factory.router.message_received(message)
+
+
+class ShardServerFactory(Factory):
+    protocol = ShardProtocol
+
+    def __init__(self, router):
+        self.router = router
+
+    def connection_made(self, protocol):
+        pass
+
+
+class PeerConnection(ReconnectingClientFactory):
+    # Connection to another shard, messages sent before it is up (the shards do not all start at once) wait in order
+    protocol = ShardProtocol
+    maxDelay = 5
+
+    def __init__(self, router):
+        self.router = router
+        self.connection = None
+        self.waiting = []
+
+    def connection_made(self, protocol):
+        self.resetDelay()
+        self.connection = protocol
+
+        protocol.sendString(encode_message(['hello', self.router.token]))
+
+        for data in self.waiting:
+            protocol.sendString(data)
+        self.waiting = []
+
+    def clientConnectionLost(self, connector, reason):
+        self.connection = None
+        super().clientConnectionLost(connector, reason)
+
+    def clientConnectionFailed(self, connector, reason):
+        self.connection = None
+        super().clientConnectionFailed(connector, reason)
+
+    def send(self, message):
+        data = encode_message(message)
+
+        if self.connection is not None:
+            self.connection.sendString(data)
+        else:
+            self.waiting.append(data)
+
+
+class ShardRouter:
+
+    def __init__(self, crawler, shard_by=SHARD_BY, base_port=SHARD_BASE_PORT, stats_directory=SHARD_STATS_DIRECTORY):
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.shard_by = shard_by
+        self.base_port = base_port
+        self.stats_directory = stats_directory
+
+        # Set by `-a shard=i -a shards=N`, a plain `scrapy crawl` is the only shard
+        spider = crawler.spider
+        self.shard = int(getattr(spider, 'shard', 0))
+        self.shards = int(getattr(spider, 'shards', 1))
+        self.spider = spider
+
+        self.token = os.environ.get(SHARD_TOKEN_VARIABLE, '')
+        self.listening = None
+        self.listen_failed = False
+        self.peers = {}
+
+        # Termination : requests handed over and received by this shard, and the last (idle, sent, received)
+        # reported by every shard, this one included
+        self.sent = 0
+        self.received = 0
+        self.idle = False
+        self.reports = {}
+        self.last_snapshot = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        router = cls(
+            crawler,
+            shard_by=settings.get('SHARD_BY', SHARD_BY),
+            base_port=settings.getint('SHARD_BASE_PORT', SHARD_BASE_PORT),
+            stats_directory=settings.get('SHARD_STATS_DIRECTORY', SHARD_STATS_DIRECTORY)
+        )
+
+        if router.shards > 1:
+            crawler.signals.connect(router.spider_opened, signal=signals.spider_opened)
+            crawler.signals.connect(router.spider_idle, signal=signals.spider_idle)
+            crawler.signals.connect(router.spider_closed, signal=signals.spider_closed)
+
+        return router
+
+    def spider_opened(self, spider):
+        try:
+            self.listening = reactor.listenTCP(self.base_port + self.shard, ShardServerFactory(self), interface='127.0.0.1')
+        except CannotListenError as e:
+            # The other shards would wait forever for this one, it closes and the launcher stops them
+            print(f"shard {self.shard} : cannot listen on port {self.base_port + self.shard}, closing : {e}")
+            self.listen_failed = True
+            reactor.callLater(0, self.crawler.engine.close_spider, spider, 'shard_port_unavailable')
+            return
+
+        for peer in range(self.shards):
+            if peer != self.shard:
+                self.peers[peer] = PeerConnection(self)
+                reactor.connectTCP('127.0.0.1', self.base_port + peer, self.peers[peer])
+
+        print(f"shard {self.shard} of {self.shards}, by {self.shard_by}, listening on port {self.base_port + self.shard}")
+
+    def shard_key(self, url):
+        if self.shard_by == 'url':
+            return canonicalize_url(url)
+        return self.spider.extract_domain_name(url) or urlsplit(url).hostname or url
+
+    def owner(self, request):
+        return shard_of(self.shard_key(request.url), self.shards)
+
+    def route(self, results, spider):
+        for result in results:
+            if self.listen_failed:
+                # closing, see spider_opened()
+                continue
+
+            if self.shards > 1 and isinstance(result, Request):
+                owner = self.owner(result)
+
+                if owner != self.shard:
+                    self.hand_over(owner, result, spider)
+                    continue
+
+            yield result
+
+    def process_spider_output(self, response, result, spider):
+        return self.route(result, spider)
+
+    def process_start_requests(self, start_requests, spider):
+        return self.route(start_requests, spider)
+
+    def hand_over(self, owner, request, spider):
+        self.sent += 1
+        self.stats.inc_value('shard/handed_over')
+        self.peers[owner].send(['request', encode_request(request, spider)])
+
+    def broadcast_status(self):
+        self.reports[self.shard] = (self.idle, self.sent, self.received)
+
+        for peer in self.peers.values():
+            peer.send(['status', self.shard, self.idle, self.sent, self.received])
+
+    def message_received(self, message):
+        if message[0] == 'request':
+            self.received += 1
+            self.stats.inc_value('shard/received')
+
+            # Straight to the scheduler, the dupefilter still drops the urls this shard already has
+            self.crawler.engine.crawl(decode_request(message[1], self.spider))
+
+            if self.idle:
+                self.idle = False
+                self.broadcast_status()
+
+        elif message[0] == 'status':
+            _, shard, idle, sent, received = message
+            self.reports[int(shard)] = (idle, sent, received)
+
+    def spider_idle(self, spider):
+        self.idle = True
+        self.broadcast_status()
+
+        # Every shard idle with nothing in flight, and the same counts as at the previous idle check (spider_idle is
+        # sent again every few seconds), so that reports that crossed each other are not mistaken for the end
+        snapshot = tuple(self.reports.get(shard) for shard in range(self.shards))
+        done = (
+            all(report is not None and report[0] for report in snapshot)
+            and sum(report[1] for report in snapshot) == sum(report[2] for report in snapshot)
+            and snapshot == self.last_snapshot
+        )
+        self.last_snapshot = snapshot
+
+        if not done:
+            raise DontCloseSpider
+
+    def spider_closed(self, spider, reason):
+        for peer in self.peers.values():
+            peer.stopTrying()
+            if peer.connection is not None:
+                peer.connection.transport.loseConnection()
+
+        if self.listening is not None:
+            self.listening.stopListening()
+
+        stats = dict(self.stats.get_stats(), finish_reason=reason)
+        os.makedirs(self.stats_directory, exist_ok=True)
+
+        filename = stats_filename(self.stats_directory, self.shard)
+        with open(filename + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(stats, f, default=str, indent=2, sort_keys=True)
+        os.replace(filename + '.tmp', filename)
+
+        print(f"shard {self.shard} : {self.sent} requests handed over, {self.received} received")
@@ -0,0 +1,259 @@
+# Where write_to_local_data() puts the relevant articles
+#
+# Every article used to become one file in the current directory, named after its url
+# with '/' replaced and cut at 255 characters (so two long urls could share a file). A
+# full-country crawl left hundreds of thousands of small files in one flat directory.
+#
+# SegmentSink appends the articles as records to a few large segment files instead :
+#   - segment-000001.jsonl(.gz) : one json line per article, gzip compressed or not
+#   - segment-000001.seg / .zseg : length-prefixed records, .zseg ones zlib compressed
+#     one by one, so that a record can still be read back on its own
+#   - a new segment is started every run and once the current one reaches max_bytes
+#   - an sqlite index maps the sha1 of every url to its latest record (segment, offset,
+#     length) and body hash, it also answers the incremental recrawl questions
+#   - segments are fsynced and the index committed every fsync_every records, not per article
+#
+# FilePerArticleSink keeps the original one file per article layout, also used by
+# `scrapy exportfiles` to turn segments back into files.
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import time
+import zlib
+
+from covidnews.article_index import article_filename, body_hash
+
+
+SEGMENT_FORMAT_JSONL = 'jsonl'
+SEGMENT_FORMAT_LENGTH_PREFIXED = 'length_prefixed'
+
+SEGMENT_MAX_BYTES = 256 * 1024 ** 2
+SEGMENT_FSYNC_EVERY = 256
+
+LENGTH_PREFIX = struct.Struct('<I')
+
+
+def url_hash(link):
+    return hashlib.sha1(link.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+class FilePerArticleSink:
+    # One '<url with / replaced>.html' file per article, the first line is the full filename when it had to be truncated
+
+    def __init__(self, file_parent_directory='', article_index=None):
+        self.file_parent_directory = file_parent_directory
+        self.article_index = article_index
+
+    def is_fresh(self, link):
+        return self.article_index is not None and self.article_index.is_fresh(link)
+
+    def is_unchanged(self, link, body):
+        return self.article_index is not None and self.article_index.is_unchanged(link, body)
+
+    def touch(self, link):
+        if self.article_index is not None:
+            self.article_index.touch(link)
+
+    def write(self, link, title, date, body, derived_fields=None):
+        # Create a unique filename for each URL, truncated if too long for the filesystem
+        filename, original_filename = article_filename(link, self.file_parent_directory)
+        print("filename = ", original_filename)
+
+        # Write the entire body of the response to a file
+        with open(filename, 'wb') as f:
+            if filename != original_filename:
+                f.write(original_filename.encode('utf-8'))
+                f.write('\n'.encode('utf-8'))
+
+            f.write(body.encode('utf-8'))
+
+        if self.article_index is not None:
+            self.article_index.record(link, filename, date, body)
+
+    def close(self):
+        pass
+
+
+class SegmentSink:
+
+    def __init__(self, directory, max_bytes=SEGMENT_MAX_BYTES, segment_format=SEGMENT_FORMAT_JSONL, compress=True,
+                 fsync_every=SEGMENT_FSYNC_EVERY, force_refresh=False, max_age=None):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_format = segment_format
+        self.compress = compress
+        self.fsync_every = fsync_every
+        self.force_refresh = force_refresh
+        self.max_age = max_age
+
+        self.db = sqlite3.connect(os.path.join(directory, 'index.sqlite3'))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                body_hash TEXT,
+                written_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        self.segment_file = None
+        self.segment_name = None
+        self.segment_bytes = 0
+        self.pending_records = 0
+
+        # Numbering goes on from the segments of the previous runs
+        numbers = [int(name.split('.')[0].split('-')[1]) for name in os.listdir(directory) if name.startswith('segment-')]
+        self.segment_number = max(numbers, default=0)
+
+        print(f"SegmentSink : {self.db.execute('SELECT COUNT(*) FROM articles').fetchone()[0]} articles already in {directory}")
+
+    def segment_extension(self):
+        if self.segment_format == SEGMENT_FORMAT_LENGTH_PREFIXED:
+            return '.zseg' if self.compress else '.seg'
+        return '.jsonl.gz' if self.compress else '.jsonl'
+
+    def open_segment(self, name, mode):
+        path = os.path.join(self.directory, name)
+        if name.endswith('.gz'):
+            return gzip.open(path, mode)
+        return open(path, mode)
+
+    def rotate(self):
+        self.close_segment()
+
+        self.segment_number += 1
+        self.segment_name = f"segment-{self.segment_number:06d}{self.segment_extension()}"
+        self.segment_file = self.open_segment(self.segment_name, 'wb')
+        self.segment_bytes = 0
+
+    def close_segment(self):
+        if self.segment_file is not None:
+            self.sync()
+            self.segment_file.close()
+            self.segment_file = None
+
+    def sync(self):
+        # Segment data first, so that the committed index never points past what is on disk
+        self.segment_file.flush()
+        raw_file = getattr(self.segment_file, 'fileobj', None) or self.segment_file
+        raw_file.flush()
+        os.fsync(raw_file.fileno())
+
+        self.db.commit()
+        self.pending_records = 0
+
+    def encode_record(self, record):
+        data = json.dumps(record, ensure_ascii=False).encode('utf-8')
+
+        if self.segment_format == SEGMENT_FORMAT_LENGTH_PREFIXED:
+            if self.compress:
+                data = zlib.compress(data)
+            return LENGTH_PREFIX.pack(len(data)) + data
+
+        return data + b'\n'
+
+    def get_entry(self, link):
+        return self.db.execute(
+            "SELECT segment, offset, length, body_hash, written_at FROM articles WHERE url_hash = ?", (url_hash(link),)
+        ).fetchone()
+
+    def is_fresh(self, link):
+        # True when the article is already stored and the refresh policy does not ask for it again
+        if self.force_refresh:
+            return False
+
+        entry = self.get_entry(link)
+        return entry is not None and (self.max_age is None or time.time() - entry[4] < self.max_age)
+
+    def is_unchanged(self, link, body):
+        entry = self.get_entry(link)
+        return entry is not None and entry[3] == body_hash(body)
+
+    def touch(self, link):
+        # Fetched again and found unchanged, counts as written now so that max_age does not refetch it on every run.
+        # Committed with the next sync() or at close(), a touch lost in a crash only means one more fetch.
+        self.db.execute("UPDATE articles SET written_at = ? WHERE url_hash = ?", (time.time(), url_hash(link)))
+
+    def write(self, link, title, date, body, derived_fields=None):
+        if self.segment_file is None or self.segment_bytes >= self.max_bytes:
+            self.rotate()
+
+        record = {
+            'link': link,
+            'title': title,
+            'date': str(date) if date is not None else None,
+            'body': body,
+            'written_at': time.time(),
+            **(derived_fields or {}),
+        }
+        data = self.encode_record(record)
+
+        offset = self.segment_bytes
+        self.segment_file.write(data)
+        self.segment_bytes += len(data)
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO articles (url_hash, url, segment, offset, length, body_hash, written_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url_hash(link), link, self.segment_name, offset, len(data), body_hash(body) if body is not None else None, record['written_at'])
+        )
+
+        self.pending_records += 1
+        if self.pending_records >= self.fsync_every:
+            self.sync()
+
+    def decode_record(self, name, data):
+        if name.endswith('seg'):
+            data = data[LENGTH_PREFIX.size:]
+            if name.endswith('.zseg'):
+                data = zlib.decompress(data)
+        return json.loads(data)
+
+    def get(self, link):
+        # Latest record of an article, None if it was never written
+        entry = self.get_entry(link)
+        if entry is None:
+            return None
+
+        segment, offset, length = entry[:3]
+        if segment == self.segment_name:
+            self.segment_file.flush()
+
+        with self.open_segment(segment, 'rb') as f:
+            f.seek(offset)
+            return self.decode_record(segment, f.read(length))
+
+    def records(self):
+        # Latest record of every article, segment by segment
+        if self.segment_file is not None:
+            self.segment_file.flush()
+
+        rows = self.db.execute("SELECT segment, offset, length FROM articles ORDER BY segment, offset").fetchall()
+        current_segment, f = None, None
+
+        try:
+            for segment, offset, length in rows:
+                if segment != current_segment:
+                    if f is not None:
+                        f.close()
+                    current_segment, f = segment, self.open_segment(segment, 'rb')
+
+                f.seek(offset)
+                yield self.decode_record(segment, f.read(length))
+        finally:
+            if f is not None:
+                f.close()
+
+    def close(self):
+        self.close_segment()
+        self.db.commit()
+        self.db.close()
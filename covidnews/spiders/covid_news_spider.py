@@ -5,7 +5,6 @@ from urllib.parse import urljoin
 import re
 from urllib.parse import urlparse, urlunparse
 
-from dateutil.parser import parse
 from datetime import datetime
 
 import os
@@ -19,26 +18,97 @@ import internetarchive
 import requests
 
 # For domain name
-import tldextract
+from covidnews.domains import DomainResolver
+
+# For skipping irrelevant url links
+from covidnews.url_filter import UrlFilter
+
+# For repairing malformed href
+from covidnews.url_repair import UrlRepair
+
+# For skipping urls already crawled by previous runs
+from covidnews.frontier import UrlFrontier, URL_KIND_ARTICLE, URL_KIND_LISTING
+
+# For plain HTTP download first, Splash render only when extraction fails
+from covidnews.fetch_tiers import FetchTierMemory, TIER_HTTP, TIER_SPLASH
+
+# For request priorities, listing depth budgets and scheduler backpressure
+from covidnews.crawl_policy import CrawlPolicy, LINK_CLASS_AMBIGUOUS_ARTICLE, LINK_CLASS_ARTICLE, LINK_CLASS_PAGINATION, LINK_CLASS_SECTION, PRIORITY_PAGINATION
+
+# For not fetching articles that could not be relevant anyway
+from covidnews.prefetch import PrefetchScorer, PREFETCH_AMBIGUOUS, PREFETCH_PRUNE
+
+# For finding articles through sitemaps and feeds instead of listing pages
+from covidnews.discovery import DOMAIN_FEED_URLS, SitemapDiscovery, feed_entries, feed_links, robots_sitemaps, sitemap_body
+
+# For deciding when a Splash render is ready
+from covidnews.splash_readiness import READINESS_LUA_SCRIPT, RenderTimings, readiness_args
+
+# For incremental recrawl
+from covidnews.article_index import ArticleIndex
+
+# For writing the relevant articles
+from covidnews.sinks import FilePerArticleSink, SegmentSink
+
+# For re-extracting articles offline, see `scrapy reextract`
+from covidnews.raw_store import RawPageStore
+
+# For flagging wire stories republished by several outlets
+from covidnews.dedup import MIN_WORDS, NearDuplicateIndex, simhash, word_count
+
+# For removing photo captions and media credits
+from covidnews.text_cleanup import remove_media_credit
+
+# For removing footnotes
+from covidnews.footnotes import remove_footnote
+
+# For deciding article relevance
+from covidnews.relevance import KeywordMatcher
+
+# For normalizing publication dates
+from covidnews.dates import fetch_time
+
+# Per-outlet selectors, looked up by hostname
+from covidnews.extractors import ExtractorRegistry
+
+# Allowed domains, start urls and covid period of every country
+from covidnews.countries import load_profiles, select_profiles
+
+# For several crawler processes on one host, see `scrapy shardcrawl`
+from covidnews.sharding import shard_directory
 
 
 # Define preferred search keywords
 #search_keywords = ['covid','virus','pandemic','vaccine','corona','vaccination','circuit breaker','SARS-CoV-2']
 search_keywords = ['covid','pandemic','vaccine','coronavirus','vaccination','SARS-CoV-2']
 
-# Define preferred search country scope
+# Whether search keywords also match their inflections, e.g. 'vaccine' matching 'vaccinated'
+USE_KEYWORD_STEMMING = 0
+
+# Define preferred search country scope, when no `-a countries=sg,my,ph` is given (see covidnews/countries.yaml)
 search_country = 'singapore'
 #search_country = 'philippines'
 
 # Whether to brute-force search across the entire website hierarchy, due to robots.txt restriction
 SEARCH_ENTIRE_WEBSITE = 1
 
+# How article urls are found : 'crawl' (the start urls and their listing pages) or 'sitemaps' (robots.txt sitemaps
+# and RSS feeds of the start urls' domains, without rendering any listing page, see covidnews.discovery)
+DISCOVERY_MODE = 'crawl'
+
 # For javascript handling
 USE_SPLASH = 0
 USE_SELENIUM = 0
 USE_PLAYWRIGHT = 0
 USE_PUPPETEER = 0
 
+# Download pages with plain scrapy first, and only render them with Splash when the extractor misses
+# the articles of a listing page, or the title, body or date of an article page
+USE_TIERED_FETCH = 1
+
+# Sent with both plain and Splash requests
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
+
 # USE cloudfare anti-bot verification bypass technique
 # https://github.com/Anorov/cloudflare-scrape
 USE_CLOUDFLARE_BYPASS = 0
@@ -47,34 +117,48 @@ USE_CLOUDFLARE_BYPASS = 0
 # It is an HTTP response status code indicating that the user has sent too many requests in a given amount of time ("rate limiting").
 USE_RATE_LIMIT = 0
 
-# Whether to skip cdx search
-SKIP_CDX = True
+# Whether to remember the crawled urls across runs, so that a rerun does not render the same pages again
+USE_URL_FRONTIER = 1
+URL_FRONTIER_DIRECTORY = 'url_frontier'
 
-# Excludes search URL results that renders the following files extensions
-excluded_file_extensions = [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".pdf", ".xls", ".mp3", ".mp4", ".mov", ".flv",
-                            ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".zip", ".webp", ".webm", ".m4v"]
+# Listing pages keep getting new articles, so they are still revisited once this many seconds have passed
+LISTING_PAGE_TTL = 24 * 60 * 60
 
-# Only parses URLs within these domains
-if search_country == 'singapore':
-    allowed_domain_names = ["straitstimes.com", "channelnewsasia.com"]
+# Where the relevant articles are written, one partition per country : 'segments' (a few large append-only files with
+# an index in articles/<country>/, see covidnews.sinks) or 'files' (one file per article in <country>/)
+ARTICLE_SINK = 'segments'
+ARTICLE_SEGMENT_DIRECTORY = 'articles'
+ARTICLE_SEGMENT_FORMAT = 'jsonl'  # or 'length_prefixed'
+COMPRESS_ARTICLE_SEGMENTS = 1
 
-elif search_country == 'philippines':
-    allowed_domain_names = ["mb.com.ph", "inquirer.net", "philstar.com"]
+# Incremental recrawl : do not render again the articles already written by a previous run
+INCREMENTAL_RECRAWL = 1
 
-elif search_country == 'malaysia':
-    allowed_domain_names = ["nst.com.my", "thestar.com.my", "bernama.com/en/", "malaysianow.com", "malaymail.com", "freemalaysiatoday.com", "malaysiakini.com"]
+# Render every already known article again anyway
+FORCE_REFRESH = 0
 
-elif search_country == 'vietnam':
-    allowed_domain_names = ["vnanet.vn/en/", "vietnamnews.vn", "en.vietnamplus.vn"]
+# Or only the articles written (or seen) more than this many seconds ago, None to never render them again
+ARTICLE_MAX_AGE = None
 
-elif search_country == 'thailand':
-    allowed_domain_names = ["bangkokpost.com"]
+# Keep the raw html of every article page, so that `scrapy reextract` can run the extraction again without crawling
+KEEP_RAW_PAGES = 1
+RAW_PAGE_STORE_DIRECTORY = 'raw_pages'
 
-elif search_country == 'indonesia':
-    allowed_domain_names = ["thejakartapost.com", "go.kompas.com"]
+# SimHash fingerprint of every relevant article body, and whether near-duplicates of an already written article
+# (the same wire story on another outlet or url) are only flagged on the item, or also not written again
+DETECT_NEAR_DUPLICATES = 1
+COLLAPSE_NEAR_DUPLICATES = 1
 
-elif search_country == 'cambodia':
-    allowed_domain_names = ["khmertimeskh.com", "phnompenhpost.com", "english.cambodiadaily.com"]
+# Drop the article cards whose card date or url date is clearly outside the covid period before rendering them,
+# and render the cards without any keyword in their title or url after the others
+USE_PREFETCH_PRUNING = 1
+
+# Whether to skip cdx search
+SKIP_CDX = True
+
+# Excludes search URL results that renders the following files extensions
+excluded_file_extensions = [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".pdf", ".xls", ".mp3", ".mp4", ".mov", ".flv",
+                            ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".zip", ".webp", ".webm", ".m4v"]
 
 # not accessible due to DNS lookup error or the webpage had since migrated to other subdomains
 inaccessible_subdomain_names = ["olympianbuilder.straitstimes.com", "ststaff.straitstimes.com", "media.straitstimes.com",
@@ -294,68 +378,6 @@ class CovidNewsSpider(scrapy.Spider):
         except FileNotFoundError:
             print("The file manual_scrape.txt does not exist.")
 
-    else:
-        if search_country == 'singapore':
-            start_urls = [
-                #'https://web.archive.org/',
-                'https://www.straitstimes.com/',
-                'https://www.channelnewsasia.com/'
-                #'https://www.channelnewsasia.com/search?q=covid'  # [scrapy.downloadermiddlewares.robotstxt] DEBUG: Forbidden by robots.txt:
-                #'https://www.straitstimes.com/search?searchkey=covid'  # Forbidden by https://www.straitstimes.com/robots.txt
-            ]
-
-        elif search_country == 'philippines':
-            start_urls = [
-                #'https://www.pna.gov.ph/',  # webite server seems to block scraping activity
-                #'https://www.manilatimes.net/search?query=covid',  # forbidden by the /search rule in robots.txt
-                #'https://www.manilatimes.net/',  # almost all articles requires digital subscription fees
-                #'https://mb.com.ph/search-results?s=covid',  # splash is not working yet
-                #'https://www.inquirer.net/',  # already finished the entire scraping process
-                'https://www.philstar.com/'
-            ]
-
-        elif search_country == 'malaysia':
-            start_urls = [
-                #'https://www.nst.com.my/',  # does not work with Selenium library
-                #'https://www.bernama.com/en/',  # only contains article for the most recent 2 months
-                'https://www.malaysianow.com/',
-                'https://www.malaymail.com/',
-                'https://www.freemalaysiatoday.com/',
-                'https://www.malaysiakini.com/',
-                'https://www.thestar.com.my/'
-            ]
-
-        elif search_country == 'vietnam':
-            start_urls = [
-                'https://vnanet.vn/en/',
-                'https://vietnamnews.vn',
-                'https://en.vietnamplus.vn'
-            ]
-
-        elif search_country == 'thailand':
-            if SEARCH_ENTIRE_WEBSITE:
-                start_urls = [
-                    'https://www.bangkokpost.com'
-                ]
-            else:
-                start_urls = [
-                    #'https://search.bangkokpost.com/search/result_advanced?q=covid&searchedField=all&category=all&xNewsSection=&xChannel=&xColumn=covid&author=&xDate2=past60Days&xDate=&xDateSearchRadio=range&xDateFrom=01%2F01%2F2020&xDateTo=01%2F01%2F2023',
-                    'https://search.bangkokpost.com/search/result_advanced?q=covid&category=archive&refinementFilter=&sort=newest&publishedDate=%5B2020-01-01T00%3A00%3A00Z%3B2022-12-31T23%3A59%3A59Z%5D&searchedField=all&xNewsSection=&xChannel=&xColumn=&author='
-                ]
-
-        elif search_country == 'indonesia':
-            start_urls = [
-                'https://www.thejakartapost.com',
-                'https://go.kompas.com/search?q=covid&submit=Submit'
-            ]
-
-        elif search_country == 'cambodia':
-            start_urls = [
-                'https://www.khmertimeskh.com/?s=covid',  # CloudFlare anti-bot verification requires the use of selenium to emulate human execution of javascript pages
-                #'https://phnompenhpost.com/search/?query=covid',  # not working yet
-                #'https://english.cambodiadaily.com/?s=covid'  # not working yet
-            ]
-
 
     # settings for Javacript handling
     if USE_SPLASH:  # scrapy-splash
@@ -379,7 +401,12 @@ class CovidNewsSpider(scrapy.Spider):
             'DOWNLOADER_MIDDLEWARES': {
                 'covidnews.middlewares.GzipRetryMiddleware': 543,
                 'covidnews.middlewares.ForgivingHttpCompressionMiddleware': 810,
-                'covidnews.middlewares.PlaywrightMiddleware': 800,
+            },
+
+            # One Chromium, a bounded pool of reused contexts and pages, see covidnews.playwright_handler
+            'DOWNLOAD_HANDLERS': {
+                'http': 'covidnews.playwright_handler.PlaywrightDownloadHandler',
+                'https': 'covidnews.playwright_handler.PlaywrightDownloadHandler',
             },
 
             'SPIDER_MIDDLEWARES': {
@@ -427,85 +454,277 @@ class CovidNewsSpider(scrapy.Spider):
     if USE_RATE_LIMIT:
         custom_settings['DOWNLOAD_DELAY'] = 0.5
 
+    # Hands the requests of the other shards over to them, does nothing without `-a shards=N`. Runs first on the
+    # spider output, before SplashDeduplicateArgsMiddleware keeps the Lua script of a request in this process only.
+    custom_settings['SPIDER_MIDDLEWARES']['covidnews.sharding.ShardRouter'] = 950
+
+
+    # Polls for readiness instead of waiting a fixed time, see covidnews.splash_readiness
+    js_script = READINESS_LUA_SCRIPT
 
-    if TEST_SPECIFIC:
 
-        js_script = """
-            function main(splash, args)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
-                -- Go to page
-                splash:go(splash.args.url)
+        # The countries crawled by this run, TEST_SPECIFIC urls may span all countries
+        self.profiles = select_profiles(load_profiles(), 'all' if TEST_SPECIFIC else getattr(self, 'countries', search_country))
+        self.profile_by_name = {profile.name: profile for profile in self.profiles}
+        self.profile_by_domain = {domain: profile for profile in self.profiles for domain in profile.allowed_domains}
 
-                -- Wait for 7 seconds
-                splash:wait(7.0)
+        if TEST_SPECIFIC:
+            for profile in self.profiles:
+                profile.set_covid_period(2019, None)
+        else:
+            self.start_urls = [url for profile in self.profiles for url in profile.crawl_start_urls(SEARCH_ENTIRE_WEBSITE)]
 
-                -- Print url
-                print("splash:url() = ", splash:url())
+        print(f"countries : {', '.join(profile.name for profile in self.profiles)}")
 
-                -- for visual debugging purpose
-                splash:set_viewport_full()
-                local png = splash:png()
+        # Set by `scrapy shardcrawl`, every shard keeps its crawl state and output in its own sub-directories
+        self.shard = int(getattr(self, 'shard', 0))
+        self.shards = int(getattr(self, 'shards', 1))
+        self.url_frontier_directory = shard_directory(URL_FRONTIER_DIRECTORY, self.shard, self.shards)
+        self.article_segment_directory = shard_directory(ARTICLE_SEGMENT_DIRECTORY, self.shard, self.shards)
+        self.raw_page_store_directory = shard_directory(RAW_PAGE_STORE_DIRECTORY, self.shard, self.shards)
 
-                yield {
-                    url = splash:url(),
-                    png = png,
-                    html = splash:html(),
-                }
+        # Built once at spider start, then shared by parse(), get_next_pages(), parse_article() and get_article_content()
+        self.url_filter = UrlFilter(
+                                    incomplete_articles,
+                                    excluded_file_extensions,
+                                    irrelevant_subdomain_names,
+                                    inaccessible_subdomain_names,
+                                    list(self.profile_by_domain)
+                                   )
+
+        # Only the extractor modules of the countries being crawled are imported
+        self.extractors = ExtractorRegistry(self, [profile.name for profile in self.profiles])
+        self.search_entire_website = SEARCH_ENTIRE_WEBSITE
+
+        # Uses the bundled public suffix list, so spider startup does not need network access
+        self.domain_resolver = DomainResolver([profile.name for profile in self.profiles])
+
+        self.url_repair = UrlRepair()
+
+        self.keyword_matcher = KeywordMatcher(search_keywords, use_stemming=USE_KEYWORD_STEMMING)
+
+        # Set by `scrapy reextract`, which replays get_article_content() over the raw page store without any crawl state
+        self.offline = getattr(self, 'offline', False)
+
+        if USE_URL_FRONTIER and not TEST_SPECIFIC and not self.offline:
+            self.url_frontier = UrlFrontier(self.url_frontier_directory, LISTING_PAGE_TTL)
+        else:
+            self.url_frontier = None
+
+        self.incremental_recrawl = INCREMENTAL_RECRAWL and not TEST_SPECIFIC and not self.offline
+
+        # `scrapy reextract` runs several processes, which cannot share one sink, they write their own output
+        if not self.offline:
+            for profile in self.profiles:
+                profile.article_sink = self.build_article_sink(profile)
+
+        # The tier that worked per url pattern, kept next to the url frontier between runs
+        if USE_TIERED_FETCH and not self.offline:
+            self.fetch_tiers = FetchTierMemory(None if TEST_SPECIFIC else self.url_frontier_directory)
+        else:
+            self.fetch_tiers = None
 
-            end
-            """
-
-    else:
-        if search_country == 'cambodia' and 'phnompenhpost.com' in allowed_domain_names:
-            js_script = """
-                function main(splash, args)
-                    -- Go to the specified page
-                    assert(splash:go(args.url))
-                    splash:wait(7.0)
-
-                    -- Try to find the "load more" button and click it
-                    local load_more_button = splash:select('#load-more-button')
-                    if load_more_button then
-                        load_more_button:mouse_click()
-                        splash:wait(5.0)  -- wait for more content to load after clicking
-                    end
-
-                    -- Optionally, you can loop the click for several times if you know
-                    -- the number of pages you need to load, or until the button is disabled
-                    while true do
-                        local load_more_button = splash:select('#load-more-button')
-                        if not load_more_button or load_more_button:attr('disabled') then
-                            break
-                        end
-                        load_more_button:mouse_click()
-                        splash:wait(5.0)  -- adjust wait time as necessary based on observed load times
-                    end
-
-                    -- Print the final URL after all interactions
-                    print("splash:url() = ", splash:url())
-
-                    -- Return the HTML of the page after fully loading all contents
-                    yield splash:html()
-                end
-                """
+        if KEEP_RAW_PAGES and not self.offline:
+            self.raw_store = RawPageStore(self.raw_page_store_directory)
         else:
-            js_script = """
-                function main(splash, args)
+            self.raw_store = None
+
+        # Fingerprints of the articles written by this and previous runs, kept next to the url frontier
+        if DETECT_NEAR_DUPLICATES and not self.offline:
+            self.near_duplicates = NearDuplicateIndex(None if TEST_SPECIFIC else self.url_frontier_directory)
+        else:
+            self.near_duplicates = None
+
+        # Splash-side render latency per domain, printed when the spider closes
+        self.render_timings = RenderTimings()
+
+        # Articles first, then pagination, then the rest of the site, see covidnews.crawl_policy
+        self.crawl_policy = CrawlPolicy()
+
+        # `scrapy crawl covid_news_spider -a discovery_mode=sitemaps` overrides DISCOVERY_MODE
+        self.discovery_mode = getattr(self, 'discovery_mode', DISCOVERY_MODE)
+
+        for profile in self.profiles:
+            if self.discovery_mode == 'sitemaps':
+                profile.discovery = SitemapDiscovery(profile.date_normalizer, profile.covid_period_start, profile.covid_period_end)
+
+            # Same keywords, date parsing and covid period as write_to_local_data()
+            if USE_PREFETCH_PRUNING and not TEST_SPECIFIC:
+                profile.prefetch_scorer = PrefetchScorer(self.keyword_matcher, profile.date_normalizer,
+                                                         profile.covid_period_start, profile.covid_period_end)
+
+
+    def build_article_sink(self, profile):
+        # One output partition per country, articles/<country>/ (articles/shard-<i>-of-<N>/<country>/ when sharded)
+        # or <country>/ for one file per article, the shards never write the same article file
+        if ARTICLE_SINK == 'segments':
+            return SegmentSink(
+                               os.path.join(self.article_segment_directory, profile.name),
+                               segment_format=ARTICLE_SEGMENT_FORMAT,
+                               compress=COMPRESS_ARTICLE_SEGMENTS,
+                               force_refresh=FORCE_REFRESH,
+                               max_age=ARTICLE_MAX_AGE
+                              )
+
+        file_parent_directory = os.path.join(profile.name, '')
+        os.makedirs(file_parent_directory, exist_ok=True)
+
+        if self.incremental_recrawl:
+            article_index = ArticleIndex(file_parent_directory, force_refresh=FORCE_REFRESH, max_age=ARTICLE_MAX_AGE)
+        else:
+            article_index = None
+
+        return FilePerArticleSink(file_parent_directory, article_index=article_index)
+
+
+    def profile_for(self, url, meta=None):
+        # Country of a request, attached by build_request(), or else found from the allowed domain of the url.
+        # Urls outside every allowed domain (archive.org ...) go with the first country.
+        name = meta.get('country') if meta else None
+        if name in self.profile_by_name:
+            return self.profile_by_name[name]
+
+        if url:
+            profile = self.profile_by_domain.get(self.extract_domain_name(url))
+            if profile is not None:
+                return profile
+
+        return self.profiles[0]
+
+
+    def inc_country_stat(self, profile, key, count=1):
+        # Per country crawl stats, there is no stats collector in `scrapy reextract`
+        stats = getattr(getattr(self, 'crawler', None), 'stats', None)
 
-                    -- Go to page
-                    splash:go(splash.args.url)
+        if stats is not None:
+            stats.inc_value(f"country/{profile.code}/{key}", count)
 
-                    -- Wait for 7 seconds
-                    splash:wait(7.0)
 
-                    -- Print url
-                    print("splash:url() = ", splash:url())
+    def closed(self, reason):
+        if self.url_frontier is not None:
+            self.url_frontier.close()
 
-                    -- Return HTML after waiting
-                    yield splash:html()
+        if self.fetch_tiers is not None:
+            self.fetch_tiers.save()
 
-                end
-                """
+        if self.raw_store is not None:
+            self.raw_store.close()
+
+        for profile in self.profiles:
+            if profile.article_sink is not None:
+                profile.article_sink.close()
+
+        if self.near_duplicates is not None:
+            self.near_duplicates.close()
+
+        print(f"Splash render timings :\n{self.render_timings.summary()}")
+        print(f"Crawl policy :\n{self.crawl_policy.summary()}")
+
+        for profile in self.profiles:
+            if profile.prefetch_scorer is not None:
+                print(f"Prefetch pruning, {profile.name} :\n{profile.prefetch_scorer.summary()}")
+
+            if profile.discovery is not None:
+                print(f"Sitemap discovery, {profile.name} : {profile.discovery.summary()}")
+
+
+    def record_render_timing(self, response):
+        # Timing returned by self.js_script, plain responses do not have any
+        data = getattr(response, 'data', None)
+
+        if isinstance(data, dict) and 'timing' in data:
+            self.render_timings.record(self.extract_domain_name(response.url), data['timing'])
+
+
+    def pending_requests(self):
+        # Requests waiting in the scheduler, None when there is no running engine, e.g. `scrapy reextract`
+        engine = getattr(getattr(self, 'crawler', None), 'engine', None)
+        slot = getattr(engine, 'slot', None) or getattr(engine, '_slot', None)
+
+        if slot is None or slot.scheduler is None:
+            return None
+
+        return len(slot.scheduler)
+
+
+    def build_request(self, url, callback, meta=None, kind=URL_KIND_ARTICLE, tier=None, dont_filter=False, link_class=None):
+        # Plain scrapy.Request or SplashRequest, depending on which tier last worked for this url pattern
+        if tier is None:
+            tier = self.fetch_tiers.tier(kind, url) if self.fetch_tiers is not None else TIER_SPLASH
+
+        profile = self.profile_for(url, meta)
+        meta = dict(meta or {}, fetch_tier=tier, fetch_kind=kind, country=profile.name)
+        self.inc_country_stat(profile, 'requests')
+
+        # link_class tells pagination from other listing links, and likely from ambiguous articles, see covidnews.crawl_policy
+        if link_class is None:
+            link_class = LINK_CLASS_ARTICLE if kind == URL_KIND_ARTICLE else LINK_CLASS_SECTION
+
+        priority = self.crawl_policy.priority(link_class)
+        self.crawl_policy.record_scheduled(link_class)
+
+        if tier == TIER_HTTP:
+            return scrapy.Request(
+                url,
+                callback=callback,
+                meta=meta,
+                headers=REQUEST_HEADERS,
+                priority=priority,
+                dont_filter=dont_filter
+            )
+
+        self.crawl_policy.record_render()
+
+        # ready_selector, poll interval, hard cap ... read by self.js_script
+        domain_name = self.extract_domain_name(url)
+        splash_args = readiness_args(self.extractors.lookup(url), kind, domain_name)
+
+        if TEST_SPECIFIC:
+            splash_args['png'] = 1  # for visual debugging purpose
+
+        return SplashRequest(
+            url,
+            callback=callback,
+            meta=meta,
+            #endpoint='render.html',  # for non-pure html with javascript
+            endpoint='execute',  # for closing advertising overlay page to get to desired page
+            args={'lua_source': self.js_script,
+                  'lua_source_isolated': False,  # for showing self.js_script print() output
+                  'adblock': True,
+                  'wait': 10,
+                  'resource_timeout': 10,
+                  'timeout': 60,  # limit the total time the Lua script can run (optional)
+                  **splash_args
+                 },
+            splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
+            headers=REQUEST_HEADERS,
+            priority=priority,
+            dont_filter=dont_filter
+        )
+
+
+    def write_debug_page(self, response, title):
+        body = response.css('*').getall()
+
+        if body:
+            body = [s.strip() for s in body]
+            body = '\n'.join(body)
+            body = body.strip()
+
+            body = self.remove_media_credit(body)
+            body = self.remove_footnote(body)
+
+        # Write the scraped html response to local file for debugging purpose
+        self.write_to_local_data(
+                                    link = response.url,
+                                    title = title,
+                                    body = body,
+                                    date = '1 October 2020',
+                                    response = response,
+                                )
 
 
     def search_archives(self, search_keywords, countries, creators, types, languages):
@@ -659,20 +878,10 @@ class CovidNewsSpider(scrapy.Spider):
                         )
 
                     else:
-                        yield SplashRequest(
+                        yield self.build_request(
                                 url,
                                 callback=self.get_article_content,
                                 meta={'title': None, 'date': None, 'article_url': url},  # Pass additional data here, assigned None here for testing purpose
-                                endpoint='execute',  # for closing advertising overlay page to get to desired page
-                                args={'lua_source': self.js_script,
-                                      'lua_source_isolated': False,  # for showing self.js_script print() output
-                                      'adblock': True,
-                                      'wait': 10,
-                                      'resource_timeout': 10,
-                                      'timeout': 60  # limit the total time the Lua script can run (optional)
-                                     },
-                                splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
-                                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
                             )
 
                 else:
@@ -682,47 +891,16 @@ class CovidNewsSpider(scrapy.Spider):
                         scraper = cfscrape.create_scraper()  # returns a CloudflareScraper instance
                         print(scraper.get("https://www.khmertimeskh.com/?s=covid").content)  # => "<!DOCTYPE html><html><head>..."
 
+                    elif self.discovery_mode == 'sitemaps':
+                        yield from self.discovery_requests(url)
+
                     else:
-                        yield SplashRequest(
-                                url,
-                                callback=self.parse,
-                                endpoint='execute',  # for closing advertising overlay page to get to desired page
-                                args={'lua_source': self.js_script,
-                                      'lua_source_isolated': False,  # for showing self.js_script print() output
-                                      'adblock': True,
-                                      'wait': 10,
-                                      'resource_timeout': 10,
-                                      'timeout': 60  # limit the total time the Lua script can run (optional)
-                                     },
-                                splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
-                                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-                            )
+                        yield self.build_request(url, callback=self.parse, kind=URL_KIND_LISTING)
 
 
     def extract_domain_name(self, link):
-        extracted = tldextract.extract(link)
-
-        # Concatenates the domain and the suffix (TLD)
-        domain_name = f"{extracted.domain}.{extracted.suffix}"
-
-        if (search_country == 'malaysia' and domain_name == 'bernama.com') or \
-           (search_country == 'vietnam' and domain_name == 'vnanet.vn'):
-            # for specific use case only
-            domain_name = domain_name + "/en/"
-
-        elif (search_country == 'vietnam' and domain_name == 'vietnamplus.vn'):
-            # for specific use case only
-            domain_name = "en." + domain_name
-
-        elif (search_country == 'indonesia' and domain_name == 'kompas.com'):
-            # for specific use case only
-            domain_name = "go." + domain_name
-
-        elif (search_country == 'cambodia' and domain_name == 'cambodiadaily.com'):
-            # for specific use case only
-            domain_name = "english." + domain_name
-
-        return domain_name
+        # Memoized per hostname, country specific rewrites are in covidnews.domains.COUNTRY_DOMAIN_REWRITES
+        return self.domain_resolver.domain_name(link)
 
 
     def get_next_pages(self, response):
@@ -732,96 +910,17 @@ class CovidNewsSpider(scrapy.Spider):
 
         domain_name = self.extract_domain_name(link)
 
-        if not link or "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-            "play.google.com" in link or "apps.apple.com" in link or \
-            any(article_url in link for article_url in incomplete_articles) or \
-            any(file_extension in link for file_extension in excluded_file_extensions) or \
-            any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-            any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-            domain_name not in allowed_domain_names:
+        skip_reason = self.url_filter.check(link, domain_name)
+        if skip_reason:
             # skipping urls
             # This is a workaround to avoid scraping url links inside irrelevant pages redirected from other urls
-            #print(f"skipped {link} inside get_next_pages()")
+            #print(f"skipped {link} inside get_next_pages() due to {skip_reason}")
             return None
 
-        if 'channelnewsasia' in response.url:
-            more_links = response.css('a::attr(href)').getall()  # Replace with the correct CSS selector
-
-        elif 'straitstimes' in response.url:
-            if SEARCH_ENTIRE_WEBSITE:
-                more_links = response.css('a::attr(href)').getall()
-            else:
-                # Find all 'a' tags inside 'div' tags with class 'queryly_item_row', 'a' tags with the text 'More', and 'a' tags with class 'stretched-link'
-                #more_links = response.css('div.queryly_item_row a::attr(href), a:contains("More")::attr(href), a.stretched-link::attr(href)').getall()
-                #more_links = response.css('div.queryly_item_row > a::attr(href)').getall()
-                more_links = response.css('a:contains("Next Page")::attr(href)').get()
-
-        elif 'philstar.com' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'inquirer.net' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'mb.com.ph' in response.url:
-            if SEARCH_ENTIRE_WEBSITE:
-                more_links = response.css('a::attr(href)').getall()
-            else:
-                # need to figure out how to click the "MORE+" button, and then execute the css() selector code again
-                #more_links = response.css('.mb-font-more-button::text').get()
-                return None
-
-        elif 'nst.com.my' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'thestar.com.my' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'bernama.com/en/' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'malaysianow.com' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'freemalaysiatoday.com' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'vnanet.vn/en/' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'vietnamnews.vn' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'en.vietnamplus.vn' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'bangkokpost.com' in response.url:
-            if SEARCH_ENTIRE_WEBSITE:
-                more_links = response.css('a::attr(href)').getall()
-            else:
-                more_links = response.css('p.page-Navigation > a::attr(href)').getall()
-
-        elif 'thejakartapost.com' in response.url:
-            more_links = response.css('a::attr(href)').getall()
-
-        elif 'go.kompas.com' in response.url:
-            more_links = response.css('div.paging__item > a.paging__link::attr(href)').getall()
-
-        elif 'khmertimeskh.com' in response.url:
-            more_links = response.css('div#paging > a.next.page-numbers::attr(href)').getall()
-
-        elif 'english.cambodiadaily.com' in response.url:
-            more_links = response.css('div.page-nav > a::attr(href)').getall()
-
-        elif 'phnompenhpost.com' in response.url:
-            if SEARCH_ENTIRE_WEBSITE:
-                more_links = response.css('a::attr(href)').getall()
-            else:
-                # needs some javascript handling for clicking "Load more" button
-                more_links = response.css('p.page-Navigation > a::attr(href)').getall()
-
-        elif 'archive.org' in response.url:
-            more_links = response.css('a.format-summary:contains("FULL TEXT")::attr(href)').getall()
+        extractor = self.extractors.lookup(response.url)
 
+        if extractor is not None:
+            more_links = extractor.get_next_pages(response)
         else:
             more_links = None
 
@@ -830,52 +929,9 @@ class CovidNewsSpider(scrapy.Spider):
 
 
     def fix_url(self, url, default_url='https://www.example.com/'):
-        # print(f"Before fix_url(), url : {url}")
-
-        # Remove repeated protocols
-        url = re.sub(r'^http://link%20to%20microsite%20', '', url)
-        url = re.sub(r"https?://https?://", "https://", url)
-        url = re.sub(r"https?://\(https?:?//?", "https://", url)
-        url = re.sub(r"https?://ttps?//?", "https://", url)
-        url = re.sub(r'^http://%22https/', 'https:/', url)
-        url = re.sub(r'^https?https?://', 'https://', url)
-        url = re.sub(r'^https?://www.https?/', 'https://', url)
-        url = re.sub(r'^https?://www.straitsthttps?/', 'https://', url)
-
-        # Fix common typo in domain name
-        url = re.sub(r"^htps?://", "https://", url)
-        url = re.sub(r"^tps?://", "https://", url)
-        url = re.sub(r"^ps?://", "https://", url)
-        url = re.sub(r"^s?://", "https://", url)
-        url = re.sub(r"^.*https?://", "https://", url)
-        url = re.sub(r"^ttps?://", "https://", url)
-        url = re.sub(r"https://ww\.", "https://www.", url)
-        url = re.sub(r"https?://www\.\.", "https://www.", url)
-        url = re.sub(r'^https?://wwww', 'https://www', url)
-        url = re.sub(r"https?://taff\.straitstimes\.com/", "https://www.straitstimes.com/", url)
-        url = re.sub(r"https?://wwwf\.straitstimes\.com/", "https://www.straitstimes.com/", url)
-        url = re.sub(r"https?://wwwstraitstimes\.com/", "https://www.straitstimes.com/", url)
-        url = re.sub(r"https?://lifestyle\.inq@inquirer\.net", "https://lifestyle.inquirer.net", url)
-        url = re.sub(r"https?://usiness\.inquirer\.net", "https://business.inquirer.net", url)
-        url = re.sub(r"https?://ebudailynews\.inquirer\.net", "https://cebudailynews.inquirer.net", url)
-        url = re.sub(r"https?://globnalnation\.inquirer\.net", "https://globalnation.inquirer.net", url)
-        url = re.sub(r"https?://www\.bandera\.inquirer\.net", "https://bandera.inquirer.net", url)
-        url = re.sub(r"https?://www\.newsinfo\.inquirer\.net", "https://newsinfo.inquirer.net", url)
-        url = re.sub(r"https?://nwsinfo\.inquirer\.net", "https://newsinfo.inquirer.net", url)
-        url = re.sub(r"https?://www\.cebudailynews\.inquirer\.net", "https://cebudailynews.inquirer.net", url)
-        url = re.sub(r"https?://events\@thestar\.com\.my/", "https://events.thestar.com.my/", url)
-
-        if not url.startswith("http"):
-            # print(f"default_url : {default_url}")
-            url = urljoin(default_url, url)
-
-        # Removes any whitespace characters
-        url = url.strip()
-
-        # print(f"After fix_url(), url : {url}")
-
-        # If the URL is fine, return it as is
-        return url
+        # Repeated protocols, scheme typos, typo hosts and relative links, see covidnews.url_repair
+        # Memoized, since the same nav and footer href show up on every page
+        return self.url_repair.repair(url, default_url)
 
 
     def parse(self, response):
@@ -887,21 +943,22 @@ class CovidNewsSpider(scrapy.Spider):
         link = response.url.strip().lower()
         print("inside parse(), response.url = ", response.url)
 
+        if response.meta.get('fetch_kind') == URL_KIND_LISTING:
+            self.record_render_timing(response)
+
+        if self.url_frontier is not None:
+            self.url_frontier.add_listing(response.url)
+
         INTERNETARCHIVE_FULL_TEXT = \
             'https://archive.org/stream/' in response.url or \
             'https://archive.org/compress/' in response.url
 
         domain_name = self.extract_domain_name(link)
 
-        if not link or "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-            "play.google.com" in link or "apps.apple.com" in link or \
-            any(article_url in link for article_url in incomplete_articles) or \
-            any(file_extension in link for file_extension in excluded_file_extensions) or \
-            any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-            any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-            domain_name not in allowed_domain_names:
+        skip_reason = self.url_filter.check(link, domain_name)
+        if skip_reason:
             # Skip links
-            #print(f"skipped {link} inside parse() A")
+            #print(f"skipped {link} inside parse() A due to {skip_reason}")
             pass
 
         else:
@@ -916,6 +973,23 @@ class CovidNewsSpider(scrapy.Spider):
 
         print(f"Found {len(articles)} articles")
 
+        # How many section links away from the start urls, article pages carry the depth of their listing page
+        listing_depth = response.meta.get('listing_depth', 0)
+
+        # Listing pages only, parse() is also called back from get_article_content() with article pages
+        fetch_tier = response.meta.get('fetch_tier')
+
+        if self.fetch_tiers is not None and fetch_tier is not None and \
+            response.meta.get('fetch_kind') == URL_KIND_LISTING and self.extractors.lookup(response.url) is not None:
+            self.fetch_tiers.record(URL_KIND_LISTING, response.url, fetch_tier, len(articles) > 0)
+
+            if fetch_tier == TIER_HTTP and not articles:
+                # Probably rendered by javascript, try again with Splash
+                print(f"plain download of {response.url} has no articles, rendering it with Splash")
+                yield self.build_request(response.url, callback=self.parse, meta={'listing_depth': listing_depth},
+                                         kind=URL_KIND_LISTING, tier=TIER_SPLASH, dont_filter=True)
+                return
+
         if TEST_SPECIFIC and response.url in self.start_urls:
             yield from self.parse_article(response.css('*'), response)
 
@@ -937,6 +1011,17 @@ class CovidNewsSpider(scrapy.Spider):
         domain_name = self.extract_domain_name(response.url)
         domain_url = "https://www." + domain_name
 
+        # Hrefs of the pagination links, when next_pages are all the links of the page
+        extractor = self.extractors.lookup(response.url)
+        pagination_links = set()
+
+        if next_pages and self.search_entire_website and extractor is not None and extractor.pagination_selector:
+            pagination_links = {self.fix_url(link, domain_url).strip() for link in response.css(extractor.pagination_selector).getall()}
+
+        # Sampled once per page, the requests queued below are added to it
+        pending_requests = self.pending_requests() if next_pages else None
+        pagination_links_followed = 0
+
         next_pages_url = []
         for link in next_pages:
             # Fix wrong links that are already wrong at the source
@@ -953,405 +1038,77 @@ class CovidNewsSpider(scrapy.Spider):
             if next_page_url:
                 link = next_page_url.strip()
 
-                if "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-                    "play.google.com" in link or "apps.apple.com" in link or \
-                    any(article_url in link for article_url in incomplete_articles) or \
-                    any(file_extension in link for file_extension in excluded_file_extensions) or \
-                    any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-                    any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-                    domain_name not in allowed_domain_names:
+                skip_reason = self.url_filter.check(link, domain_name)
+                if skip_reason:
                     # Skip links
-                    #print(f"skipped {link} inside parse() B")
+                    #print(f"skipped {link} inside parse() B due to {skip_reason}")
                     continue
 
-                else:
-                    #print("response.url = ", response.url)
-                    #print("next_page_url = ", next_page_url)
-
-                    yield SplashRequest(
-                        #response.urljoin(next_page),
-                        url=next_page_url,
-                        callback=self.parse,
-                        #endpoint='render.html',  # for non-pure html with javascript
-                        endpoint='execute',  # for closing advertising overlay page to get to desired page
-                        args={'lua_source': self.js_script,
-                              'lua_source_isolated': False,  # for showing self.js_script print() output
-                              'adblock': True,
-                              'wait': 10,
-                              'resource_timeout': 10,
-                              'timeout': 60  # limit the total time the Lua script can run (optional)
-                             },
-                        splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
-                        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-                    )
-
-
-    def parse_articles(self, response):
-        print("inside parse_articles(), response.url = ", response.url)
-        if 'channelnewsasia' in response.url:
-            # Extract articles from CNA
-            return response.css('div.list-object')
-
-        elif 'straitstimes' in response.url:
-            # Extract articles from ST
-            #return response.css('div.container > div.grid.cards > div.card')
-            print("parse_articles() for straitstimes")
-            return response.css('div.card-body')
-            #return response.css('div.queryly_item_row')
-
-        elif 'philstar.com' in response.url:
-            print("parse_articles() for philstar.com")
-            return response.css(
-                    'div.carousel__item__title h2 a, \
-                    div.theContent div#news_main div.jscroll-inner div.news_column.latest div.tiles.late.ribbon-cont div.ribbon div.ribbon_content div.ribbon_title h2 a, \
-                    div.theContent div#news_main div.jscroll-inner div#home_columnists div#home_columnists_content div#home_columnists_actual.owl-carousel.owl-theme.owl-loaded.owl-drag div.owl-stage-outer div.owl-stage div.owl-item.active div.home_columnists_cell div.home_columnists_cell_details h3 a, \
-                    div.theContent div#news_main div.jscroll-inner div#inside_philstar table#inside_philstar_cells tbody tr td.inside_cell div.inside_cell_title_main h3 a, \
-                    div.theContent div#news_main div.jscroll-inner div#inside_philstar table#inside_philstar_cells tbody tr td.inside_cell ul li h3 a, \
-                    div.news_title h2 a, \
-                    div.news_title a'
-                    )
+                elif self.url_frontier is not None and not self.url_frontier.should_fetch_listing(link):
+                    # Already visited by a previous run, less than LISTING_PAGE_TTL ago
+                    #print(f"skipped {link} inside parse() B due to url_frontier")
+                    continue
 
-        elif 'inquirer.net' in response.url:
-            print("parse_articles() for inquirer.net")
-
-            if response.url == 'https://cebudailynews.inquirer.net/':
-
-                body = response.css('*').getall()
-
-                if body:
-                    body = [s.strip() for s in body]
-                    body = '\n'.join(body)
-                    body = body.strip()
-
-                    body = self.remove_media_credit(body)
-                    body = self.remove_footnote(body)
-
-
-                # Write the scraped html response to local file for debugging purpose
-                self.write_to_local_data(
-                                            link = response.url,
-                                            title = 'cebudailynews_inquirer_net_debug',
-                                            body = body,
-                                            date = '1 October 2020',
-                                            response = response,
-                                        )
-
-            return response.css('.flx-leftbox, .flx-m-box, #tr_boxs3, #fv-ed-box, #op-columns-box, .image-with-text, #buzz-box, #inqf-box, div[data-tb-region-item]:not(#fview-cap), div.items[data-tb-region-item], #cmr-bg, #cmr-box, #ncg-box, #cdn-col-box, #cdn-g-box, .list-head, #trend_title, #usa-add-gallery > a, #cdn-cat-wrap > a, #op-sec h3, #ch-ls-head')
-
-        elif 'mb.com.ph' in response.url:
-            print("parse_articles() for mb.com.ph")
-
-            if response.url == 'https://mb.com.ph/category/specials':
-
-                body = response.css('*').getall()
-
-                if body:
-                    body = [s.strip() for s in body]
-                    body = '\n'.join(body)
-                    body = body.strip()
-
-                    body = self.remove_media_credit(body)
-                    body = self.remove_footnote(body)
-
-
-                # Write the scraped html response to local file for debugging purpose
-                self.write_to_local_data(
-                                            link = response.url,
-                                            title = 'manila_bulletin_debug',
-                                            body = body,
-                                            date = '1 October 2020',
-                                            response = response,
-                                        )
-
-            return response.css('div.row.mb-16, div.row.mb-5, .custom-article-text, .mb-font-article-title, .mb-font-live-update-article-title, div.videoCube.trc_spotlight_item.origin-undefined')
-
-        elif 'nst.com.my' in response.url:
-            print("parse_articles() for nst.com.my")
-            return response.css(
-                    'div.row.mb-4 div.col-md-4.col-lg-3.order-2.order-sm-1.mb-4.mb-sm-0 div.mb-4 div.block.block-article-image-row-listing div.d-flex.flex-row.mb-3, \
-                    \
-                    div.block.block-breaking-news div.d-flex.mb-3, \
-                    div.block.block-breaking-news div.row div.col-12.col-sm.mb-4.mb-sm-0, \
-                    div.block.block-breaking-news div.row div.col.col-sm.align-items-center.article-listing div.d-flex.flex-column.h-100.justify-content-between a.d-flex.article.listing.mb-2 div.content.pl-2 div.field-title, \
-                    \
-                    div.most-popular.block div#__BVID__12.tabs div#__BVID__12__BV_tab_container_.tab-content.pt-2 div#__BVID__13.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
-                    div.most-popular.block div#__BVID__12.tabs div#__BVID__12__BV_tab_container_.tab-content.pt-2 div#__BVID__15.tab-pane.active div.ranked-listing div.ranked-item.d-flex.px-3.pb-2.mb-2.align-items-center.timeline, \
-                    div.most-popular.block div#__BVID__9.tabs div#__BVID__9__BV_tab_container_.tab-content.pt-2 div#__BVID__10.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
-                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__11.tab-pane.active div.ranked-listing div.ranked-item.d-flex.px-3.pb-2.mb-2.align-items-center.timeline, \
-                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__9.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-3, \
-                    div.most-popular.block div#__BVID__8.tabs div#__BVID__8__BV_tab_container_.tab-content.pt-2 div#__BVID__9.tab-pane.active div.timeline.pt-3 ul li.d-flex.pb-4, \
-                    \
-                    div.block.block-opinions div.row div.col-12.col-sm.mb-4.mb-sm-0, \
-                    div.owl-stage div.owl-item.cloned, \
-                    div.owl-stage div.owl-item.active, \
-                    div.owl-stage div.owl-item.cloned.active, \
-                    div.owl-stage div.owl-item, \
-                    \
-                    div.block.block-left-featured-right-listing div.row.no-gutter div.col-12.col-lg a, \
-                    div.block.block-left-featured-right-listing div.row.no-gutter div.col-12.col-lg div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
-                    div.col-12.col-lg.article-listing div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
-                    div.col-12.col-lg div.inner-wrapper.h-100.p-3.d-flex.flex-column.justify-content-between a.d-flex.article.listing.mb-2, \
-                    \
-                    div.article-listing div.article-teaser, \
-                    div#trending-block.block.my-4 div.block-content.d-block.position-relative a.d-flex.article.listing.mb-2.pb-2.border-bottom, \
-                    \
-                    div.block.block-single-listing, \
-                    div.collection-listing-latest div.latest-featured div.row, \
-                    div.collection-listing-latest div.latest-listing.mt-4 div.row div.col-12.col-sm.mb-3.mb-sm-0'
-            )
+                elif self.is_pruned_listing_link(link):
+                    # Mostly article pages reached as listing links when searching the entire website
+                    continue
 
-        elif 'thestar.com.my' in response.url:
-            print("parse_articles() for thestar.com.my")
-            return response.css(
-                    'div.content.main-desktop-headline, \
-                    div.content > u1 > li, \
-                    div.col-sm-3.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
-                    div.row.story-set div.col-xs-12.col-sm-3.mob-bot-20 div.col-wrap div.col-content h2, \
-                    div.col-sm-6.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
-                    ul#MoreNews-Second.story-set.col-sm-4.col-md-3 li.row.hidden-visual, \
-                    div.row.list-listing div.col-xs-7.col-sm-9 h2, \
-                    ul#justInListing.timeline.vTicker li.row div.col-xs-8.col-sm-10.col-md-9.tm-content-wrap div.timeline-content p a, \
-                    div.focus section.latest-news div.sub-section-list div.row.list-listing, \
-                    div.featuredDiv div.focus-story div.row div div.col-xs-12.col-sm-4.featuredContent div.content h2, \
-                    div.row ul.story-set.col-sm-3.story3 li.row.hidden-visual div.col-xs-7.left.col-sm-12 h2 a, \
-                    div.story-set-group.story2 div.col-sm-6.in-sec-story div.row div.col-xs-7.left.col-sm-12 a, \
-                    div#section1.story-set-group div.col-sm-3.in-sec-story div.row div.col-xs-7.left.col-sm-12 h2, \
-                    div#section2.sub-section-list div.row.list-listing div.col-xs-7.col-sm-9 h2, \
-                    div#story-recom-list.desc-wrap div.desc div.col-xs-7.col-sm-9.col-md-7.left, \
-                    div#divOpinionWidget section.side-combo-2 div.desc-wrap div.row.desc div.col-xs-9.col-sm-10.right p a, \
-                    div.focus-story.focus-lifestyle div.row div.col-xs-12.col-sm-4, \
-                    div.sub-section-list.story-set-lifestyle div.col-xs-12.col-sm-6.bot-20.lifemain div.row div.col-xs-12.left, \
-                    div.thumb__container.viewpoints__stories.row div.col-sm-6.thumb__item div.thumb.thumb--vp div.thumb__inner, \
-                    div.opinion-content div div.row.story-set div.col-xs-12.col-sm-4.bot-20 div.col-wrap div.col-content h2, \
-                    div#story-recom-list.desc-wrap div.desc, div.row.panel-content'
-            )
+                # Without SEARCH_ENTIRE_WEBSITE, next_pages only come from the pagination selectors of the outlet
+                if self.search_entire_website:
+                    link_class = self.crawl_policy.link_class(link, pagination_links)
+                else:
+                    link_class = LINK_CLASS_PAGINATION
 
-        elif 'bernama.com/en/' in response.url:
-            print("parse_articles() for bernama.com/en/")
-            return response.css(
-                'div#topstory.carousel.slide.mt-2 div.carousel-inner div.carousel-item div.carousel-caption h1.h3 a, \
-                div#skroll div.ji-timeline div.ji-container.ji-right div.ji-content h6, \
-                div#main.container-fluid.px-0 div.row div.col-lg-6 div#spcl2news.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div.row div.col-lg-12 div#spcl3news.row div.col-12.col-sm-12.col-md-3.col-lg-3.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-12 div#latestnews.owl-carousel.owl-theme.owl-loaded.owl-drag div.owl-stage-outer div.owl-stage div.owl-item.active div h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#generalnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#worldnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#businessnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#politicsnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#sportnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#featuresnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#main.container-fluid.px-0 div#twonewsonly.row div.col-lg-6 div#thoughtsnews.row div.col-12.col-sm-12.col-md-6.col-lg-6.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12 h6 a, \
-                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-sm-12.col-md-4.col-lg-4.mt-3.mt-md-0.mt-lg-0 h1.h3 a, \
-                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-sm-12.col-md-12.col-lg-12 div.row div.col-12.col-sm-12.col-md-3.col-lg-3.mb-3.mb-md-0.mb-lg-0 div.row div.col-7.col-md-12.col-lg-12.mb-3 h6 a, \
-                div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-8.col-lg-8 div.row div.p-2.pl-3 div.row div.col-7.col-sm-7.col-md-8.col-lg-8 h6 a'
-            )
+                child_depth = self.crawl_policy.child_depth(link_class, listing_depth)
 
-        elif 'malaysianow.com' in response.url:
-            print("parse_articles() for malaysianow.com")
-            return response.css(
-                'div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 div.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.group a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.border-t-2.border-gray-100.py-8 div.space-y-8 div ul.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:grid-cols-3.lg\:gap-x-8 li a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.items-stretch.space-y-8.lg\:flex.lg\:flex-1.lg\:space-x-6.lg\:space-y-0 div.w-full.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.space-y-8.sm\:grid.sm\:grid-cols-1.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.items-stretch.space-y-8.lg\:flex.lg\:flex-1.lg\:space-x-6.lg\:space-y-0 div.flex-1 div.space-y-12.sm\:-mt-8.sm\:space-y-0.sm\:divide-y.sm\:divide-gray-200.lg\:gap-x-8.lg\:space-y-0 div.sm\:py-8 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 div.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.group a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-8.pb-10.sm\:px-6 div.mx-auto.grid.gap-5.sm\:grid-cols-2.lg\:max-w-none.lg\:grid-cols-4 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1 div.mx-auto.grid.gap-5.sm\:grid-cols-2.lg\:max-w-none.lg\:grid-cols-3 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a, \
-                div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
-                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.hidden.space-y-8.lg\:sticky.lg\:top-40.lg\:block.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
-                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a, \
-                div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a'
-            )
+                skip_reason = self.crawl_policy.skip_reason(domain_name, link_class, child_depth, pending_requests, pagination_links_followed)
+                if skip_reason:
+                    #print(f"skipped {link} inside parse() B due to {skip_reason}")
+                    continue
 
-        elif 'freemalaysiatoday.com' in response.url:
-            print("parse_articles() for freemalaysiatoday.com")
-            return response.css(
-                'main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-sm-7.col-lg-5.order-1.order-sm-2.mb-4.mb-lg-0 article div.col-12 h1.sc-aXZVg.jiTbBU.fw-bold a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-lg-4.order-2.order-sm-3 div.row.align-items-stretch.gx-3 article.col-6.mb-4 blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6 div.featured.mb-5 article div.col-12 blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing article.col-12.col-sm-6.px-2.row.gx-2.mb-4.fs-12.align-items-stretch div.col blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-lg-4 aside.col-lg div.home-mostpopular-listing ol li div a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md-7.mb-4.mb-md-0 article.position-relative.h-md-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-4.px-sm-5 div.summary-title-wrapper.mb-4.mb-sm-3 blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md div.row.align-items-stretch.gx-3 div.sc-gFqAkR.KXNUP div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-prev article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-next article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-active article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-prev article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-active article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-next article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-7 article div.col-12 blockquote.sc-aXZVg.jiTbBU.fw-bold a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-5 div.row.gx-3 div.sc-ikkxIA.bklVyq div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-dAbbOL.delONt.col-12 div.row.gx-3.home-lifestyle-listing div.col-6.col-md-3.mb-4.mb-md-0 article.position-relative.h-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-3 div.summary-title-wrapper.pb-28-px blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.mb-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-feUZmu.beTCqT.col-12 div.row.gx-3 div.col-6.col-md-3 article blockquote a, \
-                main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-12.col-md-4.mostviewed-listing article.row.gx-3.mb-4.fs-12.align-items-stretch div.col blockquote a, \
-                main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-4 div aside.col-lg div.home-mostpopular-listing ol li div a, \
-                div#__next div.fixed-top.jumpslider.d-none.d-md-block div.fade.bg-light.alert-border.alert.alert-success.show div div div a.m__story, \
-                div#__next main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-8 section.sc-gEvEer.iBuEiq.p-4 section.sc-gEvEer.iBuEiq.pt-5.pb-3.px-0.fs-16 div.row.gx-3 article.col-6.col-sm-3.mb-3 blockquote a'
-            )
+                if pending_requests is not None:
+                    pending_requests += 1
 
-        elif 'vnanet.vn/en' in response.url:
-            return response.css(
-                'div.col-big-news.fl-left div.title-big-news h2 > a, \
-                div.list-box-rows.list-box-rows-2.scrollbar.divTopNews ul li.parentMenuItem a, \
-                li.act-cate-main div.sub-cate-main div.big-news-cate-main div.title-bg-grd.title-big-news-main > a, \
-                li.act-cate-main div.sub-cate-main div.list-box-rows.list-box-rows-4.cf ul li > a, \
-                div.list-box-rows.list-box-rows-5.scrollbar ul#divOtherNews li > a, \
-                div.ct-post-details div.feature-list-news ul li div.grp-panel > a, \
-                div.ct-post-details div.grp-list-news-2 ul li div.grp-panel > a, \
-                div.sidebar-rows.fix-sidebar-rows div#divServiceNews.list-news-dv ul li div.grp-panel > a, \
-                div.divTextView.newsListForm div.flex-container div.flex-item.meta-data-port a'
-            )
+                if link_class == LINK_CLASS_PAGINATION:
+                    pagination_links_followed += 1
 
-        elif 'vietnamnews.vn' in response.url:
-            return response.css(
-                'html body div.site-content div.l-grid div.l-content div#spotlight_slick.spotlight-slick.slick-initialized.slick-slider div.slick-list.draggable div.slick-track div.d-flex.slick-slide div.slick-meta h2 a, \
-                html body div.site-content div.l-grid div.l-content div.row.feature div.col article.story.story--focus div.story__meta h2 a, \
-                html body div.site-content div.l-grid div.l-content div.row.feature div.col article.story h2 a, \
-                html body div.site-content div.l-grid div.l-content div.highlight section.zone.zone--highlight div.row.zone__content article.col.story h2 a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content article.story.story--focus h2 a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
-                html body div.site-content div.l-grid div.sidebar section.aside.aside--latest div.tab-content div#latest.tab-pane.fade.show.active article.story h2 a, \
-                html body div.site-content div.l-grid div.sidebar div.event ul.event-list li a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--column div.zone__content div.row article.col.story h2 a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-text div.zone__content article.story.story--focus h2 a, \
-                html body div.site-content div.l-grid div.l-content section.zone.zone--cate.has-text div.zone__content div.row article.col.story h2 a, \
-                html body div.site-content div.area.area--dark div.l-grid section.zone.zone--opinion div.zone__content div.row div.col article.story div.story__meta h2 a, \
-                html body div.site-content div.l-grid.cate-col div.row div.col section.zone div.zone__content article.story h2 a, \
-                html body div.site-content div.l-grid div.l-content.category section.zone.zone--cate.has-thumb div.zone__content article.story.story--focus h2 a, \
-                html body div.site-content div.l-grid div.l-content.category section.zone.zone--cate.has-thumb div.zone__content div.focus-col article.story h2 a, \
-                html body div.site-content div.l-grid div.l-content.category div.d-flex div.timeline article.story h2 a'
-            )
+                #print("response.url = ", response.url)
+                #print("next_page_url = ", next_page_url)
 
-        elif 'en.vietnamplus.vn' in response.url:
-            return response.css(
-                'section.latest-news div.clearfix article.story--text h2 a, \
-                div.spotlight article.story.story--horizontal h2 a, \
-                div.highlight div.l-content div.focus article.story h2 a, \
-                div.highlight div.l-content div.feature.cols-3 article.story h2 a, \
-                div.l-content section.zone--timeline div.clearfix article.story h2 a, \
-                div.clearfix article.story.story--horizontal h2 a, \
-                div.clearfix ul.story--list li a, \
-                div.zone--region__list ul.story--list li a, \
-                div.clearfix article.story.story--large h2 a, \
-                div.clearfix div.right article.story.story--horizontal h2 a, \
-                div.l-content section.zone--cate div.feature.cols-3 article.story h2 a, \
-                div#wrapper-popular section.zone.zone--popular div.clearfix article.story h2 a, \
-                div.clearfix article.story.story--split h2 a, \
-                div.clearfix article.story--large h2 a, \
-                div.clearfix ul li article.story h2 a'
-            )
+                yield self.build_request(
+                    #response.urljoin(next_page),
+                    url=next_page_url,
+                    callback=self.parse,
+                    meta={'listing_depth': child_depth},
+                    kind=URL_KIND_LISTING,
+                    link_class=link_class
+                )
 
-        elif 'bangkokpost.com' in response.url:
-            return response.css(
-                'body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-11.ctrl-height > div.divnews-highlight > div > div.owl-stage-outer.owl-height > div > div.owl-item.active > div > div > figure > figcaption > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-11.ctrl-height > div.news--slide222 > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-4 > div > div.div-timeline--list > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight > div > div.row.no-gutters-sm > div.col-15.col-lg-4 > div > div.div-timeline--list > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div.news--slide > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
-                div.section-news > div.container > #news-tabContent > div > div > div > div.col-15.col-lg-9 > div > figure > figcaption > h3 > a, \
-                div.section-news > div.container > #news-tabContent > div > div > div > div.col-15.col-lg-6 > div > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div > div.col-15.col-lg-10 > div.row > div > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div > div.col-15.col-lg-10 > div.row > div > div > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-leaning > div > div.boxnews--container.learning--slide > div > div.owl-stage-outer > div > div > div > div > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div.topics--slide > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-9.col-xl-50 > div > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div.topics--slide > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-6.col-xl-50 > div > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.col-lg-10 > div > div > div.owl-stage-outer > div > div.owl-item.active > div > div > figure > figcaption > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.col-lg-5 > div > div.div-mostview--list > ul > li > h3 > a, \
-                div.news--slide > div#recommended > div.owl-stage-outer > div > div > div > div > h3 > a, \
-                body > div > div.divsection-container > section > section.section-page > div > div.row.topics-news > div > div > div > h3 > a, \
-                div > div > div > div.col-15.col-lg-6 > div > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div.container > div > div.col-15.col-lg-5 > div.articl--aside > div.div-recommended.mb-30 > div.div-recommended--list > ul > li > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div.container > div > div.col-15.col-lg-5 > div.articl--aside > div.box-topic--bg > div.row > div > div > ul > li > h3 > a, \
-                body > section.section-learning > section > div.div-learning-listdetail > div > div > div.col-15.col-md-15.col-lg-10 > div.row.lea-commu > div > article > div > div > h3 > a, \
-                li#primary-slider-slide01 > div > a, \
-                body > section.section-learning > section > div > div > div.col-15.col-md-15.col-lg-10 > div.section-learning--article > div > div > article > div > div > h3 > a, \
-                body > div > div.divsection-container > section.section-page > div > div > div > div > div > h3 > a, \
-                #trending-widget > div > div.news--slide > div > div > div > div > a, \
-                div > div.videoCube.trc_spotlight_item.origin-default.thumbnail_top.textItem.videoCube_2_child.trc_excludable > a, \
-                body > div > div.divsection-container > section.section-page > div > div > div > div.owl-stage-outer > div > div > div > div > div.col-15.col-lg-9.col-xl-50 > div > a, \
-                #alphabet-a > div.mt-5 > div.news--slide > div > div.owl-stage-outer > div > div > div > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div > div > div.div-section--main.mb-5 > div.news--list.border-bottom.mb-4.pb-3 > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div > div > div.div-section--main.mb-5 > div.news--list-noimg > ul > li > h3 > a, \
-                div > div.videoCube.trc_spotlight_item.origin-default.thumbnail_top.textItem.videoCube_1_child.trc-first-recommendation.trc-spotlight-first-recommendation.trc_excludable > a, \
-                body > div.divbody-container > div.divsection-container > section.section-highlight.news--highlight > div > div > div.col-15.boxnews--notshow-mobi.mt-md-5 > div > div > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div.row.page--link > div > div > div > h3 > a, \
-                body > div.divbody-container > div.divsection-container > section > div > div.subsect--latest > div.row.page--link > div > div > div > h3 > a, \
-                body > div.divbody-container.life-container > div.divsection-container > section > div > div.subsect--latest.divlife--latest > div.row.page--link > div > div > div > h3 > a, \
-                #content > div.content-right > ul > li > div > h3 > a, \
-                #content > div.content-right > ul > div > h3 > a'
-            )
 
-        elif 'thejakartapost.com' in response.url:
-            return response.css(
-                'body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__headline > div > div > div.tjp-homepage__headline-main.outlined > div > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__headline > div > div > div.tjp-homepage__headline-third.outlined > div > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--popular > div > div > div > div.tjp-grid.tjp-grid--1-2 > div > div > a, \
-                #swiper-wrapper-61071fce948872ee1 > div.swiper-slide.swiper-slide-active > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--popular > div > div > div > div.tjp-grid.tjp-grid--2 > div > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--opinion > div.tjp-grid.tjp-grid--2 > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--opinion > div.tjp-grid.tjp-grid--2 > div > div > div > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--indonesia > div.tjp-grid.tjp-grid--2 > div > div > div > a, \
-                body > div.tjp-wrapper > div.col-xs-12.tjpcontainer > div.container.borderGrid > div > div > div > div > div > div.tjp-homepage__section.tjp-homepage__section--indonesia > div.tjp-grid.tjp-grid--2 > div > div > div > div > a, \
-                body > div.col-xs-12.tjpcontainer > div > div > div > div.jpRow.mainNews.lineSection.channelTwoSided.subCanal > div.containerLeft.col-xs-12 > div > div.theLatest.mb-20 > div.columns.tjp-newsListing > div > div > div.latestDetail > a, \
-                body > div.col-xs-12.tjpcontainer > div > div > div > div.jpRow.mainNews.headLineChannel.channelTwoSided > div > div.smallHeadline.channel > div > div > a'
-            )
+    def is_pruned_listing_link(self, link):
+        # Whether the url path has a date outside the covid period of the country of the link, see covidnews.prefetch
+        prefetch_scorer = self.profile_for(link).prefetch_scorer
 
-        elif 'go.kompas.com' in response.url:
-            return response.css(
-                'body > div.wrap > div.container.clearfix > div.row.mt3.col-offset-fluid.clearfix > div.col-bs10-7 > div.latest--news.mt2.clearfix > div > div.article__list__title > h3 > a'
-            )
+        if prefetch_scorer is not None and prefetch_scorer.url_date_outside_period(link):
+            prefetch_scorer.record_pruned_listing(link)
+            return True
 
-        elif 'khmertimeskh.com' in response.url:
-            return response.css(
-                'div.item-content > h2.item-title > a'
-            )
+        return False
 
-        elif 'english.cambodiadaily.com' in response.url:
-            return response.css(
-                'div.td-module-meta-info > h3 > a'
-            )
 
-        elif 'phnompenhpost.com' in response.url:
-            return response.css(
-                'body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.main-content > div > div > div.main-content-text > a, \
-                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.article-news > div.article-thumbnail > ul > li > a, \
-                body > div.section-body.page-wrapper > div.category > div.categories-left > div > div > div.category-content > div.category-row > div.category-item > a, \
-                body > div.section-body.page-wrapper > div.category-bot > div > div.category-bot-content > div.category-bot-item-md > div.category-bot-md-text > a, \
-                body > div.section-body.page-wrapper > div.category-bot > div > div.category-bot-content > div.category-bot-item-sm > div > div > a, \
-                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.slideshow-news > div > div > div > span > a, \
-                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.latest-news > ul > li > a, \
-                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.article-news > div > ul > li > a, \
-                #item-list > div > div.more-text > a, \
-                body > div.section-body.page-wrapper > div.section-news-ads > div.news-content > div.category-mid > div > ul > li > div > a, \
-                body > div.section-body.page-wrapper > div.section-article > div.right-sidebar > div.latest-news > ul > li > a'
-            )
+    def parse_articles(self, response):
+        print("inside parse_articles(), response.url = ", response.url)
+        extractor = self.extractors.lookup(response.url)
 
-        elif 'archive.org' in response.url:
-            if 'https://archive.org/details/' in response.url:
-                # Extract article (only the FULL_TEXT download page) from the summary page
-                return response.css('a.format-summary.download-pill:contains("FULL TEXT")::attr(href)')
-            else:
-                print("Already downloaded and extracted the FULL_TEXT archive.org article")
-                # (be aware of compressed zip file format containing multiple djvu.txt.html webpage files,
-                # OR Microsoft Word OR Adobe PDF document)
-                return response.css('*')
+        if extractor is not None:
+            return extractor.parse_articles(response)
 
 
     def get_source(self, response):
-        if 'channelnewsasia' in response.url:
-            return 'CNA'
-        elif 'straitstimes' in response.url:
-            return 'ST'
-        elif 'inquirer.net' in response.url:
-            return 'INQ'
-        elif 'mb.com.ph' in response.url:
-            return 'MB'
-        elif 'archive.org' in response.url:
-            return 'archive'
+        extractor = self.extractors.lookup(response.url)
+
+        if extractor is not None:
+            return extractor.source
 
 
     def parse_article(self, article, response):
@@ -1359,202 +1116,10 @@ class CovidNewsSpider(scrapy.Spider):
         date = None
         link = None
 
-        if 'channelnewsasia' in response.url:
-            title = article.css('title::text').get() or \
-                    article.css('h1.entry-title::text').get() or \
-                    article.css('.h1.h1--page-title::text').get() or \
-                    article.css('div.quick-link[data-heading]::attr(data-heading)').get() or \
-                    article.css('div.quick-link::attr(data-heading)').get() or \
-                    article.css('meta[property="og:title"]::attr(content)').get() or \
-                    article.css('meta[name="twitter:title"]::attr(content)').get()
-            date = article.css('time.entry-date::text').get() or article.css('div.list-object__datetime-duration span::text').get()
+        extractor = self.extractors.lookup(response.url)
 
-            link = article.css('h1.entry-title a::attr(href)').get() or \
-                    article.css('h6.list-object__heading a::attr(href)').get() or \
-                    article.css('div.quick-link::attr(data-link_absolute)').get()
-
-        elif 'straitstimes' in response.url:
-            title = article.css('h5.card-title a::text').get() or \
-                    article.css('.node-header.h1::text').get()
-            date = article.css('time::text').get() or \
-                    article.css('time::attr(datetime)').get() or \
-                    article.css('.story-postdate::text').get()
-
-            link = article.css('a::attr(href)').get()
-
-        elif 'philstar.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'inquirer.net' in response.url:
-            title = article.css('.flx-m-head::text, .flx-l-head::text, #tr_boxs3 h2 a::text, #inqf-info h2::text, #fv-ed-box h2 a::text, #buzz-info h2::text, div.items[data-tb-region-item] h3 a::text, div[data-tb-region-item] h3 a::text, #cmr-info h1 a::text, #cmr-info h2 a::text, #cmr-info h2::text, #ncg-info h1 a::text, #cgb-head h1::text, #cdn-col-box h2 a::text, #cdn-cat-box h2::text, #cat-info h2::text, .list-head a::text, #trend_title a::text, #trend_title h2 a::text, h1.entry-title::text, #ch-ls-head h2 a::text, #op-sec h3 a::text').get()
-            date = article.css('.elementor-post-info__item--type-date::text').get() or \
-                    article.css('#tr_boxs3 h6 ::text').get() or \
-                    article.css('#cmr-info h3::text').get() or \
-                    article.css('#ch-ls-head #ch-postdate span:first-child::text').get() or \
-                    article.css('#cdn-col-box #col-post-date::text').get() or \
-                    article.css('#cat-info #cat-pt::text').get() or \
-                    article.css('#cdn-cat-box #cb-pt::text').get() or \
-                    article.css('#trend_title h3::text').get() or \
-                    article.css('div[data-tb-region-item] h4::text').get() or \
-                    article.css('div.items[data-tb-region-item] h4::text').get()
-
-            if date is None and article.css('#ncg-info #ncg-postdate::text').get() and not article.css('#ncg-info #ncg-postdate::text').get().isspace():
-                date = date or article.css('#ncg-info #ncg-postdate::text').get()
-
-            link = None  # just for initialization
-
-            # Get onclick url
-            onclick_url = response.css('#cmr-box::attr(onclick)').get()
-
-            # Extract url from onclick attribute
-            if onclick_url:
-                link = re.search(r"window.open\('(.*?)'", onclick_url).group(1)
-
-            if article.css('a::attr(href)').get() and not article.css('a::attr(href)').get().startswith("?utm_source=(direct)&utm_medium=gallery"):
-                link = article.css('a::attr(href)').get()
-
-            link = link or article.css('#cgb-head h1::attr(data-vr-contentbox-url)').get()
-
-
-        elif 'mb.com.ph' in response.url:
-            title = article.css('.mb-font-article-title a::text').get() or \
-                    article.css('div.mb-font-article-title a span::text').get() or \
-                    article.css('span.mb-font-live-update-article-title::attr(title)').get()
-            date = article.css('.mb-font-article-date::text').get()
-
-            link = article.css('a::attr(href)').get()
-
-        elif 'nst.com.my' in response.url:
-            title = article.css('h6.field-title::text').get()
-
-            if article.css('div.d-block.article-meta span.created-ago::text').get():
-                date = article.css('div.d-block.article-meta span.created-ago::text').get().split(' @ ')[0]
-
-            if date is None and article.css('div.article-meta > div::text').get():
-                date = article.css('div.article-meta > div::text').get().split(' @ ')[0]
-
-            link = article.css('a::attr(href)').get()
-
-        elif 'thestar.com.my' in response.url:
-            title = article.css('h2 a ::text').get() or \
-                    article.css('a ::text').get()
-
-            if article.css('span.timestamp ::text').get():
-                date = article.css('span.timestamp ::text').get().split(' | ')[0]
-
-            if date is None and article.css('label.timestamp ::text').get():
-                date = article.css('label.timestamp ::text').get().split(' | ')[0]
-
-            link = article.css('a::attr(href)').get()
-
-        elif 'bernama.com/en/' in response.url:
-            title = article.css('a ::text').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'malaysianow.com' in response.url:
-            title = article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 a div.group.space-y-4 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-10.pb-8.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 div.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.group a div.space-y-3 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.border-t-2.border-gray-100.py-8 div.space-y-8 div ul.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:grid-cols-3.lg\:gap-x-8 li a.group div.group.grid.grid-cols-3.items-start.gap-6.space-y-0 div.col-span-2.flex.h-full.flex-col.justify-center.space-y-1.align-middle h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.items-stretch.space-y-8.lg\:flex.lg\:flex-1.lg\:space-x-6.lg\:space-y-0 div.w-full.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.space-y-8.sm\:grid.sm\:grid-cols-1.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.items-stretch.space-y-8.lg\:flex.lg\:flex-1.lg\:space-x-6.lg\:space-y-0 div.flex-1 div.space-y-12.sm\:-mt-8.sm\:space-y-0.sm\:divide-y.sm\:divide-gray-200.lg\:gap-x-8.lg\:space-y-0 div.sm\:py-8 a div.group.space-y-4.sm\:grid.sm\:grid-cols-5.sm\:items-start.sm\:gap-6.sm\:space-y-0 div.sm\:col-span-3 div.space-y-4 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 a div.group.space-y-4 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-8.px-4.sm\:px-6 div.space-y-8.lg\:grid.lg\:grid-cols-4.lg\:gap-8.lg\:space-y-0 div.lg\:col-span-2 div.space-y-8.sm\:grid.sm\:grid-cols-2.sm\:gap-x-6.sm\:gap-y-8.sm\:space-y-0.lg\:gap-x-6.lg\:gap-y-6 div.group a div.space-y-3 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.px-4.pt-8.pb-10.sm\:px-6 div.mx-auto.grid.gap-5.sm\:grid-cols-2.lg\:max-w-none.lg\:grid-cols-4 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a.mt-2.block p.font-georgia.text-xl.leading-6.text-gray-900.transition.duration-200.group-hover\:text-brand-red-900 ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1 div.mx-auto.grid.gap-5.sm\:grid-cols-2.lg\:max-w-none.lg\:grid-cols-3 div.group.flex.flex-col.overflow-hidden.rounded-md.border-2.border-gray-100 div.flex.flex-1.flex-col.justify-between.bg-white.p-6 div.flex-1 a.mt-2.block div.space-y-1 p ::text').get() or \
-                    article.css('div#__next main div.bg-white div.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text').get() or \
-                    article.css('div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.hidden.space-y-8.lg\:sticky.lg\:top-40.lg\:block.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text') or \
-                    article.css('div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-4 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.flex-1.space-y-6 div.space-y-6 div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.grid.grid-cols-3.items-start.gap-6.space-y-0 div.col-span-2 div.space-y-1 div.space-y-1.font-georgia.text-xl.font-medium.leading-6.transition.duration-200.group-hover\:text-brand-red-900 h3 ::text') or \
-                    article.css('div#__next main div.bg-white article.mx-auto.max-w-7xl.py-10.px-4.sm\:px-6 div.items-stretch.space-y-6.lg\:flex.lg\:flex-1.lg\:space-y-0.lg\:space-x-6 div.space-y-8.lg\:sticky.lg\:top-40.lg\:h-full.lg\:w-\[300px\] div.rounded-md.border-2.border-gray-100.p-6 div.space-y-4 div.divide-y.divide-gray-200 div.group.py-4 a div.space-y-3 div.space-y-1 h3 ::text')
-
-
-            date = article.css('time ::text').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'freemalaysiatoday.com' in response.url:
-            title = article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-sm-7.col-lg-5.order-1.order-sm-2.mb-4.mb-lg-0 article div.col-12 h1.sc-aXZVg.jiTbBU.fw-bold a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-3 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-12.col-lg-4.order-2.order-sm-3 div.row.align-items-stretch.gx-3 article.col-6.mb-4 blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6 div.featured.mb-5 article div.col-12 blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-lg-8 div.sc-fPXMVe.lmAJDv.col-12 div.home-topnews-listing.row.gx-3 div.row.g-1.home-lifestyle-listing.gallery-listing article.col-12.col-sm-6.px-2.row.gx-2.mb-4.fs-12.align-items-stretch div.col blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.iBuEiq div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-lg-4 aside.col-lg div.home-mostpopular-listing ol li div a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md-7.mb-4.mb-md-0 article.position-relative.h-md-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-4.px-sm-5 div.summary-title-wrapper.mb-4.mb-sm-3 blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-md div.row.align-items-stretch.gx-3 div.sc-gFqAkR.KXNUP div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-prev article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-next article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-active article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-prev article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-active article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row.mb-4 div.col-12.col-lg-8 div div.position-relative div.swiper.swiper-initialized.swiper-horizontal.swiper-pointer-events div.swiper-wrapper div.swiper-slide.swiper-slide-duplicate.swiper-slide-duplicate-next article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-7 article div.col-12 blockquote.sc-aXZVg.jiTbBU.fw-bold a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.home-beritautama-listing.row.gx-3 div.col-12.col-md-5 div.row.gx-3 div.sc-ikkxIA.bklVyq div.row.g-1.home-lifestyle-listing.gallery-listing div.col-6.mb-4 article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-dAbbOL.delONt.col-12 div.row.gx-3.home-lifestyle-listing div.col-6.col-md-3.mb-4.mb-md-0 article.position-relative.h-100 div.sc-jEACwC.eyfswQ.summary-wrapper.position-absolute.bottom-0.w-100.px-3 div.summary-title-wrapper.pb-28-px blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq section.sc-gEvEer.iBuEiq.mb-5 div.sc-eqUAAy.fgprtA.container-xxl div.sc-feUZmu.beTCqT.col-12 div.row.gx-3 div.col-6.col-md-3 article blockquote a ::text').get() or \
-                    article.css('main.sc-dLMFU.dEogEu.d-flex.flex-column.flex-grow-1 div.sc-fHjqPf.cqruwq div.sc-gEvEer.BiNyN.py-5 div.sc-eqUAAy.fgprtA.container-xxl div.row section.col-12.col-md-4.mostviewed-listing article.row.gx-3.mb-4.fs-12.align-items-stretch div.col blockquote a ::text').get() or \
-                    article.css('main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-4 div aside.col-lg div.home-mostpopular-listing ol li div a ::text').get() or \
-                    article.css('div#__next div.fixed-top.jumpslider.d-none.d-md-block div.fade.bg-light.alert-border.alert.alert-success.show div div div a.m__story b ::text').get() or \
-                    article.css('div#__next main.sc-hzhJZQ.gqYvvz.d-flex.flex-column.flex-grow-1 div.sc-gEvEer.iBuEiq.flex-grow-1 div.sc-eqUAAy.fgprtA.container-xxl div.row div.col-md-8 section.sc-gEvEer.iBuEiq.p-4 section.sc-gEvEer.iBuEiq.pt-5.pb-3.px-0.fs-16 div.row.gx-3 article.col-6.col-sm-3.mb-3 blockquote a ::text').get()
-
-            date = article.css('time ::text').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'vnanet.vn/en/' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'vietnamnews.vn' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'en.vietnamplus.vn' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'bangkokpost.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'thejakartapost.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'go.kompas.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'khmertimeskh.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'english.cambodiadaily.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'phnompenhpost.com' in response.url:
-            title = article.css('a ::text').get()
-            date = article.css('div.article__date-published').get()
-            link = article.css('a::attr(href)').get()
-
-        elif 'archive.org' in response.url:
-            title = article.css('title::text').get()
-            date = article.xpath('//meta[@name="date"]/@content').get()
-
-            link = response.css('a.format-summary.download-pill:contains("FULL TEXT")::attr(href)').get()
-
-        else:
-            title = None
-            date = None
-            link = None
+        if extractor is not None:
+            title, date, link = extractor.parse_article(article, response)
 
         if title:
             title = title.strip()  # to remove unnecessary whitespace or newlines characters
@@ -1574,15 +1139,10 @@ class CovidNewsSpider(scrapy.Spider):
 
         print(f"inside parse_article(), parent_url = {response.url} , article_url = {link} , title = {title}, date = {date}")
 
-        if not link or "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-            "play.google.com" in link or "apps.apple.com" in link or \
-            any(article_url in link for article_url in incomplete_articles) or \
-            any(file_extension in link for file_extension in excluded_file_extensions) or \
-            any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-            any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-            domain_name not in allowed_domain_names:
+        skip_reason = self.url_filter.check(link, domain_name)
+        if skip_reason:
             # skipping urls
-            #print(f"skipped {link} inside parse_article()")
+            #print(f"skipped {link} inside parse_article() due to {skip_reason}")
             yield None
 
         else:
@@ -1593,425 +1153,115 @@ class CovidNewsSpider(scrapy.Spider):
                 yield None
 
             else:
-                #print("departing to get_article_content()")
-
-                yield SplashRequest(
-                    url=article_url,
-                    callback=self.get_article_content,
-                    meta={'title': title, 'date': date, 'article_url': article_url},  # Pass additional data here
-                    #endpoint='render.html',  # for non-pure html with javascript
-                    endpoint='execute',  # for closing advertising overlay page to get to desired page
-                    args={'lua_source': self.js_script,
-                          'lua_source_isolated': False,  # for showing self.js_script print() output
-                          'adblock': True,
-                          'wait': 10,
-                          'resource_timeout': 10,
-                          'timeout': 60  # limit the total time the Lua script can run (optional)
-                         },
-                    splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
-                    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-                )
+                yield self.article_request(article_url, title, date, response)
 
 
-    def remove_media_credit(self, text):
-        text = re.sub(r"\([^()]*first of two parts[^()]*\)", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"\([^()]*Second of two parts[^()]*\)", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"\([^()]*pic[^()]*\)", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"\(Image: .+?\)", "", text, flags=re.DOTALL)
-        text = re.sub(r"\(Photo.+?\)", "", text, flags=re.DOTALL)
-        text = re.sub(r".+?Photo from.+?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".+?Screenshot from.+?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".+?FIle photo.+?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r"\(AP Photo.+?\)", "", text, flags=re.DOTALL)
-        text = re.sub(r"\(File photo: .+?\)", "", text, flags=re.DOTALL)
-        text = re.sub(r"File photo of .+?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r"FILE-.+?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?file photo.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?File photo.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?FILE PHOTO.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?PHOTO:.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?PVL PHOTO.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?UAAP PHOTO.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?INQUIRER PHOTO.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?\/INQUIRER\.net.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?PHOTO FROM.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?REUTERS\/.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r".*?CONTRIBUTED PHOTO.*?\n", "", text, flags=re.DOTALL)
-        text = re.sub(r"FILE PHOTO-.+?", "", text, flags=re.DOTALL)
-        text = re.sub(r"FILE PHOTO: .+?File Photo", "", text, flags=re.DOTALL)
-
-        text = re.sub(r"WATCH THE LIVESTREAM HERE:", "", text, flags=re.DOTALL)
-        text = re.sub(r"Watch the full speech:", "", text, flags=re.DOTALL)
-        return text
+    def article_request(self, article_url, title, date, response):
+        # Request for get_article_content(), None when the article was already processed or cannot be relevant,
+        # response is the listing page, sitemap or feed the article was found in
+        profile = self.profile_for(article_url)
 
+        if self.incremental_recrawl and profile.article_sink.is_fresh(article_url):
+            # Already written by a previous run
+            #print(f"skipped {article_url} inside parse_article() due to article_sink")
+            return None
 
-    def remove_footnote(self, text, window_size=3, previous_search_footnote_phrase=None):
-        # cleans up some strange character
-        text = text.replace('\xa0', ' ')
-        text = text.replace('<200b>', ' ')
-
-        # splits into multiple tokens using newline characters
-        lines = text.split('\n')
-        lines = [l.strip() for l in lines]
-
-        # list of phrases to search for
-        search_phrases = [
-            "join st's telegram channel",
-            "join st's whatsapp channel",
-            "download our app",
-            "read this story in",
-            "is an editor at",
-            "is a journalist at",
-            "is a journalist based in",
-            "is a senior journalist at",
-            "is associate fellow",
-            "is a phd candidate",
-            "is a doctoral candidate",
-            "is Research Fellow",
-            "is Associate Professor",
-            "is an associate professor",
-            "is Professor",
-            "is a lecturer",
-            "is a senior lecturer",
-            "is Dean of",
-            "is the Dean of",
-            "Senior Research Associate",
-            "Note:",
-            "Editor's note",
-            "Editor’s Note:",
-            "Editorial note:",
-            "Correction note:",
-            "Clarification note:",
-            "Terence Fernandez is a",
-            "Brian Martin is the managing editor of The Star",
-            "About the author:",
-            "(Author:",
-            "(Author :",
-            "(Authors:",
-            "(Authors :",
-            "(Reporter:",
-            "(Reporter :",
-            "(Reporters:",
-            "(Reporters :",
-            "(Writer:",
-            "(Writer :",
-            "(Writers:",
-            "(Writers :",
-            "(Editor:",
-            "(Editor :",
-            "(Editors:",
-            "(Editors :",
-            "(Writer & Editor:",
-            "(Writer & Editor :",
-            "(Writers & Editors:",
-            "(Writers & Editors :",
-            "(Author/Editor:",
-            "(Author/Editor :",
-            "(Authors/Editors:",
-            "(Authors/Editors :",
-            "The article was edited",
-            "This article was first published",
-            "This story was produced",
-            "The story has been updated",
-            "This story has been updated",
-            "This article has been updated",
-            "this article originally appear",
-            "This story came from",
-            "© The New York Times",
-            "© 2023 the new york times",
-            "© The Financial Times",
-            "© 2021 The Financial Times",
-            "© 2022 The Financial Times",
-            "© 2023 The Financial Times",
-            "©2020 Bloomberg",
-            "©2021 Bloomberg",
-            "©2022 Bloomberg",
-            "©2020 Project Syndicate",
-            "©2021 Project Syndicate",
-            "©2022 project syndicate",
-            "©1995-2022 Project Syndicate",
-            "©Project Syndicate",
-            "Project Syndicate",
-            "©2022",
-            "© 2022",
-            "©2021",
-            "© 2021",
-            "©2020",
-            "© 2020",
-            "© 2016 - 2024 PT. Bina Media Tenggara",
-            "©CNN",
-            "TSB",
-            "lzb",
-            "/lzb",
-            "[atm]",
-            "/atm",
-            "Sources: Reuters",
-            "(Source: AP)",
-            "(Reporting by",
-            "(by Xinhua writer",
-            "(Additional reporting by",
-            "Additional reporting by",
-            "Edited by",  # Comment this out for manual scraping due to truncated words for "accrEdited by"
-            "Produced by:",
-            "Brought to you by",
-            "WITH REPORT FROM", "—REPORTS FROM",
-            "—With a report from", "—WITH REPORTS FROM",
-            "— By YEE XIANG YUN", "— By M. SIVANANTHA SHARMA", "— By FARID WAHAB", "— By ANDY CHUA",
-            "— By REBECCA RAJAENDRAM",
-            "— By GRACE CHEN", "— By PAUL GABRIEL", "— By JEREMY TAN", "— By IMRAN HILMY", "— By SANDHYA MENON",
-            "—Jerome",
-            "–Jaime Laude",
-            "—Julie",
-            "–Helen Flores",
-            "–Elizabeth Marcelo",
-            "—MA. APRIL MIER-MANJARES",
-            "—Jovic",
-            "—JOANNA",
-            "—JUN A. MALIG",
-            "—DONA",
-            "—Nikka",
-            "–Rudy Santos",
-            "—Leila B. Salaverria",
-            "—NESTLE SEMILLA",
-            "—NESTOR",
-            "—Patricia",
-            "—Tina",
-            "— Bella Perez-Rubio",
-            "— KHIRTHNADHEVI KUMAR",
-            "— Christian Deiparine",
-            "— Kaycee Valmonte with Agence France-Presse",
-            "- Jakarta Post",
-            "— Jakarta Post",
-            "– AP",
-            "- AFP",
-            "– AFP",
-            "— AFP",
-            "– dpa",
-            "- Reuters",
-            "— Reuters",
-            "– Reuters",
-            "- Bloomberg",
-            "– Bloomberg",
-            "— Bloomberg",
-            "- Bernama",
-            "– Bernama",
-            "— Bernama",
-            "-- Bernama",
-            "- Xinhua",
-            "— VNS", "VNS Copyrights 2012",
-            "-VNA", "./. VNA", "./.  VNA", "./.   VNA", "./.    VNA",
-            "- The Straits Times/ANN",
-            "– The Straits Times (Singapore)/Asia News Network",
-            "- The Nation Thailand/ANN",
-            "— The Nation Thailand/ANN",
-            "- Philippines Daily Inquirer/ANN",
-            "— Vietnam News",
-            "- Vietnam News/ANN",
-            "- Phnom Penh Post/ANN",
-            "– South China Morning Post",
-            "– Thomson Reuters Foundation",
-            "– Los Angeles Times/Tribune News Service",
-            "– Hartford Courant/Tribune News Service",
-            "– Bangkok Post, Thailand/Tribune News Service",
-            "– Khaleej Times, Dubai/Tribune News Service",
-            "C. Nika – AKP",
-            "C. Nika -AKP",
-            "Pheng Somany – AKP",
-            "Pheng Somany -AKP",
-            "Chea Vannak – AKP",
-            "Chea Vannak -AKP",
-            "Chea Vannak/AKP/KT",
-            "AKP-Lim Nary",
-            "bhf.org",
-            "Gavi.org",
-            "burs/",
-            "burs-",
-            "bangkok post/",
-            "CHINA DAILY/ANN",
-            "Khmer Times/Coventry Telegraph",
-            "Email karnjanak@bangkokpost.co.th",
-            "CONTACT: BANGKOK POST BUILDING",
-            "MCI (P)",
-            "[ac]",
-            "-- More to follow --",
-            "Click below to watch",
-            "Click here for more",
-            "Click here to read more",
-            "View More",
-            "READ:",
-            "READ MORE:",
-            "Read next",
-            "READ NEXT:",
-            "READ MORE HERE",
-            "Read more from",
-            "Read more stories",
-            "READ FULL STORY:",
-            "Read more Global Nation stories",
-            "More from South China Morning Post:",
-            ". Learn more about",
-            "For more news like this",
-            "For more information about",
-            "For the latest news from",
-            "Watch the full news",
-            "RELATED:",
-            "RELATED STORIES",
-            "RELATED STORY",
-            "RELATED VIDEO",
-            "TOPIC:",
-            "Reference:",
-            "Source:",
-            "Visit https://spoti.fi",
-            "catch the olympics games",
-            "cna women is a section on cna",
-            "Write to us at",
-            "Sign up for our daily",
-            "Subscribe now to",
-            ". Subscribe to",
-            "Already a subscriber?",
-            "Download the app and",
-            "We use cookies",
-            "Tags / Keywords:",
-            "By registering, you agree with",
-            "All letter writers must provide full name and address",
-            "All letter writers must provide a full name and address",
-            "To be updated with all the latest news and analyses daily.",
-            "For more news about the novel coronavirus click here",
-            "Follow INQUIRER.net",
-            "The Inquirer Foundation",
-            "The Cambodia Daily is",
-            "Philstar.com is one of the most ",
-            "Khmer Times is now available",
-            "ADVT",
-            "Best viewed on",
-            "Report it to us",
-            "COPYRIGHT ©",
-            "copyright© mediacorp 2023"
-        ]
-
-        # Initialize an empty buffer
-        buffer = []
-        """
-        all_buffer = []
-
-        for i, line in enumerate(lines):
-            all_buffer.append(line)
-            all_buffer_string = ' '.join(all_buffer).lower()
-        #print(f"inside remove_footnote(), all_buffer_string = {all_buffer_string}")
-        """
-
-        if previous_search_footnote_phrase:
-            search_phrases_in_lowercase = []
-            for search_phrase in search_phrases:
-                search_phrases_in_lowercase.append(search_phrase.lower())
-
-        for i, line in enumerate(lines):
-            # add line to buffer
-            buffer.append(line)
-
-            # ensure buffer doesn't exceed window size
-            if len(buffer) > window_size:
-                buffer.pop(0)
-
-            #print(f"inside remove_footnote(), buffer = {buffer}, i = {i}")
-
-            # Check if phrases are in the buffer
-            buffer_string = ' '.join(buffer).lower()
-            buffer_string_2 = ''.join(buffer).lower()
-            #print(f"inside remove_footnote(), buffer_string = {buffer_string}")
-
-            for phrase in search_phrases:
-                phrase = phrase.lower()
-
-                if previous_search_footnote_phrase:
-                    previous_search_footnote_phrase_index = search_phrases_in_lowercase.index(previous_search_footnote_phrase)
-                    current_search_footnote_phrase_index = search_phrases_in_lowercase.index(phrase)
-
-                    if current_search_footnote_phrase_index < previous_search_footnote_phrase_index:
-                        continue
+        elif self.url_frontier is not None and not FORCE_REFRESH and \
+            self.url_frontier.is_known_article(article_url, ARTICLE_MAX_AGE):
+            # Already processed by a previous run, but not necessarily written since it could be irrelevant
+            #print(f"skipped {article_url} inside parse_article() due to url_frontier")
+            return None
 
-                if phrase in buffer_string or phrase in buffer_string_2:
-                    # Find the position of the phrase in the buffer string
-                    if phrase in buffer_string:
-                        phrase_start = buffer_string.find(phrase)
-                    elif phrase in buffer_string_2:
-                        phrase_start = buffer_string_2.find(phrase)
-
-                    phrase_end = phrase_start + len(phrase)
-                    #print(f"inside remove_footnote(), phrase = {phrase}, phrase_start = {phrase_start}, phrase_end = {phrase_end}")
-
-                    # Determine which lines those positions correspond to in the buffer
-                    line_lengths = [len(line) + 1 for line in buffer]  # +1 for '\n'
-                    line_start_positions = [sum(line_lengths[:i]) for i in range(len(buffer))]
-                    line_end_positions = [sum(line_lengths[:i+1]) for i in range(len(buffer))]
-                    #print(f"inside remove_footnote(), line_lengths = {line_lengths}, line_start_positions = {line_start_positions}, line_end_positions = {line_end_positions}")
-
-                    # Remove all lines that are part of the phrase
-                    for start, end in list(zip(line_start_positions, line_end_positions)):
-                        #print(f"inside remove_footnote(), start = {start}, end = {end}")
-
-                        if start <= phrase_start < end or start < phrase_end <= end:
-                            phrase_is_located_at_this_buffer_index = line_start_positions.index(start)
-
-                            if buffer:  # Check if buffer is not empty before popping
-                                orig_buf_len = len(buffer)
-                                #print(f"inside remove_footnote(), before pop(), buffer = {buffer}")
-                                #print(f"inside remove_footnote(), before pop(), orig_buf_len = {orig_buf_len}, phrase_is_located_at_this_buffer_index = {phrase_is_located_at_this_buffer_index}")
-                                # pop() for 'line_with_the_footnote_phrase' only removes 1 single element, but not the subsequent elements
-                                line_with_the_footnote_phrase = buffer.pop(phrase_is_located_at_this_buffer_index)
-
-                                # removes subsequent element in 'buffer'
-                                for ws_i in range(phrase_is_located_at_this_buffer_index, len(buffer)):
-                                    #print(f"inside remove_footnote(), before pop(), len(buffer) = {len(buffer)}, phrase_is_located_at_this_buffer_index = {phrase_is_located_at_this_buffer_index}, buffer = {buffer}")
-                                    if phrase_is_located_at_this_buffer_index > 0:
-                                        removed_string_item = buffer.pop(ws_i)
-                                        #print(f"inside remove_footnote(), ws_i = {ws_i}, removed_string_item = {removed_string_item}")
-                                    else:
-                                        #removed_string_item = buffer.pop(len(buffer)-ws_i-1)
-                                        buffer = []
-
-                                #print(f"inside remove_footnote(), after pop(), buffer = {buffer}")
-
-                                # Replace line in the original text with the modified line
-                                #print(f"inside remove_footnote(), line_with_the_footnote_phrase = {line_with_the_footnote_phrase}")
-                                line_without_the_footnote_phrase = line_with_the_footnote_phrase[:phrase_start-start]
-                                #print(f"inside remove_footnote(), line_without_the_footnote_phrase = {line_without_the_footnote_phrase}")
+        verdict = None
 
-                            else:
-                                break
+        if profile.prefetch_scorer is not None:
+            extractor = self.extractors.lookup(article_url)
+            date_formats = extractor.date_formats if extractor is not None else ()
+            verdict, reason = profile.prefetch_scorer.assess(article_url, title, date, date_formats, fetch_time(response))
 
-                            footnote_is_spread_across_multiple_buffer_items = \
-                                (len(phrase) > end - start) or \
-                                (phrase_end > end)
+        if verdict == PREFETCH_PRUNE:
+            return None
 
-                            #print(f"footnote_is_spread_across_multiple_buffer_items = {footnote_is_spread_across_multiple_buffer_items}, len({phrase}) = {len(phrase)}")
+        #print("departing to get_article_content()")
 
-                            # Remove the exact line containing footnote phrase as well as all other subsequent lines
-                            if phrase_is_located_at_this_buffer_index == 0:
-                                #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i-orig_buf_len+1}:] = {lines[i-orig_buf_len+1:]}")
-                                lines[i-orig_buf_len+1:] = ''
-                                #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i-orig_buf_len+1}:] = {lines[i-orig_buf_len+1:]}")
-                            else:
-                                if not footnote_is_spread_across_multiple_buffer_items:
-                                    #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i}:] = {lines[i:]}")
-                                    lines[i:] = ''
-                                    #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i}:] = {lines[i:]}")
-                                else:
-                                    #print(f"inside remove_footnote(), before cleaning the subsequent text, lines[{i-len(buffer)}:] = {lines[i-len(buffer):]}")
-                                    lines[i-len(buffer):] = ''
-                                    #print(f"inside remove_footnote(), after cleaning the subsequent text, lines[{i-len(buffer)}:] = {lines[i-len(buffer):]}")
+        return self.build_request(
+            url=article_url,
+            callback=self.get_article_content,
+            meta={'title': title, 'date': date, 'article_url': article_url,  # Pass additional data here
+                  'listing_depth': response.meta.get('listing_depth', 0), 'country': profile.name},
+            link_class=LINK_CLASS_AMBIGUOUS_ARTICLE if verdict == PREFETCH_AMBIGUOUS else None
+        )
+
+
+    def discovery_requests(self, start_url):
+        # robots.txt for the sitemaps, and the homepage <head> for the feeds, both without Splash
+        parts = urlparse(start_url)
+        home_url = f"{parts.scheme}://{parts.netloc}/"
+
+        yield scrapy.Request(urljoin(home_url, '/robots.txt'), callback=self.parse_robots, headers=REQUEST_HEADERS,
+                             priority=PRIORITY_PAGINATION)
+        yield scrapy.Request(home_url, callback=self.parse_feed_links, headers=REQUEST_HEADERS, priority=PRIORITY_PAGINATION)
+
+        for feed_url in DOMAIN_FEED_URLS.get(self.extract_domain_name(start_url), ()):
+            yield scrapy.Request(feed_url, callback=self.parse_feed, headers=REQUEST_HEADERS, priority=PRIORITY_PAGINATION)
+
+
+    def parse_robots(self, response):
+        discovery = self.profile_for(response.url).discovery
+
+        for sitemap_url in robots_sitemaps(response):
+            if discovery.keep_sitemap(sitemap_url, None):
+                yield scrapy.Request(sitemap_url, callback=self.parse_sitemap, headers=REQUEST_HEADERS, priority=PRIORITY_PAGINATION)
+
+
+    def parse_feed_links(self, response):
+        for feed_url in feed_links(response):
+            yield scrapy.Request(feed_url, callback=self.parse_feed, headers=REQUEST_HEADERS, priority=PRIORITY_PAGINATION)
 
-                            # Combines lines that have no footnote phrase
-                            lines.append(line_without_the_footnote_phrase)
 
-                            # Join the lines back into a single string
-                            cleaned_text = "\n".join(lines)
-                            #print(f"inside remove_footnote(), cleaned_text = {cleaned_text}")
+    def parse_sitemap(self, response):
+        body = sitemap_body(response)
+        if body is None:
+            print(f"unreadable sitemap {response.url}")
+            return
+
+        discovery = self.profile_for(response.url).discovery
+        is_index, entries = discovery.entries(body)
+        print(f"sitemap {response.url} has {len(entries)} entries")
+
+        for loc, lastmod in entries:
+            if is_index:
+                if discovery.keep_sitemap(loc, lastmod):
+                    yield scrapy.Request(loc, callback=self.parse_sitemap, headers=REQUEST_HEADERS, priority=PRIORITY_PAGINATION)
+
+            elif discovery.keep_url(loc, lastmod) and not self.url_filter.check(loc, self.extract_domain_name(loc)):
+                # No card data, get_article_content() reads title and date from the article page
+                request = self.article_request(loc, None, None, response)
+                if request is not None:
+                    yield request
+
+
+    def parse_feed(self, response):
+        entries = feed_entries(response.body)
+        discovery = self.profile_for(response.url).discovery
+        discovery.record_feed(len(entries))
+
+        for link, title, date in entries:
+            if discovery.keep_url(link, None) and not self.url_filter.check(link, self.extract_domain_name(link)):
+                request = self.article_request(link, title, date, response)
+                if request is not None:
+                    yield request
+
+
+    def remove_media_credit(self, text):
+        # Photo captions and media credits, one pass over the lines, see covidnews.text_cleanup
+        return remove_media_credit(text)
 
-                            # to make sure ALL footnote phrases are removed completely
-                            return self.remove_footnote(cleaned_text, window_size=3, previous_search_footnote_phrase=phrase)
 
-        # return the original text if no footnote was found
-        return text
+    def remove_footnote(self, text, window_size=3, previous_search_footnote_phrase=None):
+        # Removes the footnote (author bio, copyright, app promotion ...) and everything after it,
+        # phrases and their priority are in covidnews.footnotes.FOOTNOTE_PHRASES
+        return remove_footnote(text, window_size, previous_search_footnote_phrase)
 
 
     def is_a_valid_date(self, date_string):
@@ -2036,6 +1286,8 @@ class CovidNewsSpider(scrapy.Spider):
         date = response.meta['date']
         article_url = response.meta['article_url']
 
+        self.record_render_timing(response)
+
         link = response.url.strip()
         domain_name = self.extract_domain_name(link)
 
@@ -2045,334 +1297,21 @@ class CovidNewsSpider(scrapy.Spider):
         else:
             url_had_redirected = False
 
-        if not link or "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-            "play.google.com" in link or "apps.apple.com" in link or \
-            any(article_url in link for article_url in incomplete_articles) or \
-            any(file_extension in link for file_extension in excluded_file_extensions) or \
-            any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-            any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-            domain_name not in allowed_domain_names:
+        skip_reason = self.url_filter.check(link, domain_name)
+        if skip_reason:
             # skipping urls
-            #print(f"skipped {link} inside get_article_content()")
+            #print(f"skipped {link} inside get_article_content() due to {skip_reason}")
             yield None
 
         else:
-            if 'channelnewsasia' in response.url:
-                body = response.xpath('//blockquote//p//text() | //p[not(@*) and not(ancestor::figcaption)]/descendant-or-self::node()/text() | //ul/li[not(@*)]/span[not(@*)]/span[not(@*)]/text()').getall()
-                if date is None:
-                    date = response.css('.article-publish::text').get() or \
-                            response.css('.article-publish span::text').get()
-
-            elif 'straitstimes' in response.url:
-                #body = response.css('p ::text, h2:not(.visually-hidden) ::text').getall()
-                body = response.xpath('//p[not(ancestor::blockquote[contains(@class, "instagram-media")]) and not(ancestor::div[contains(@class, "fb-post")])]//text() | //h2[not(contains(@class, "visually-hidden"))]/text()').getall()
-
-                if date is None:
-                    print("straitstimes date is None !!!")
-                    date = response.css('.group-story-changedate .story-changeddate::text').get() or \
-                            response.css('.group-story-postdate .story-postdate::text').get() or \
-                            response.css('div.story-postdate::text').get() or \
-                            response.css('.byline::text').get() or \
-                            response.css('.st-byline::text').get() or \
-                            response.css('time::text').get() or \
-                            response.css('time::attr(datetime)').get() or \
-                            response.css('.lb24-default-list-item-date::text').get() or \
-                            response.css('time[itemprop="datePublished"]::attr(datetime)').get()
-
-                    if response.css('.byline::text').get() is not None and 'PUBLISHED: ' in date:
-                        date = date.split('PUBLISHED: ')[-1]
-
-                    if response.css('.st-byline::text').get() is not None and 'Published: ' in date:
-                        date = date.split('Published: ')[-1]
-
-            elif 'philstar.com' in response.url:
-                print("get_article_content for philstar")
-                body = response.xpath('//p[not(ancestor::div[@class="twitter-tweet"])]//text()').getall()
-
-                if title is None:
-                    title = response.css('div.article__title h1 ::text').get()
-
-                if date is None and response.css('div.article__date-published ::text').get():
-                    date = response.css('div.article__date-published ::text').get().split(' | ')[0]
-
-            elif 'inquirer.net' in response.url:
-                print("get_article_content for inquirer")
-                if title is None:
-                    title = response.css('h1.entry-title::text, h1[class="elementor-heading-title elementor-size-default"]::text, div[id="landing-headline"] h1::text, div[class="single-post-banner-inner"] h1::text').get()
-
-                #body = response.css('p:not(.footertext):not(.headertext):not(.wp-caption-text) ::text').getall()
-                #body = response.xpath('//p[not(.//strong) and not(.//b) and not(contains(@class, "wp-caption-text")) and not(contains(@class, "footertext")) and not(contains(@class, "headertext")) and not(ancestor::div[@class="qni-cookmsg"]) and not(ancestor::blockquote[@class="twitter-tweet"]) and not(./iframe)]//text() | //li[not(*)]/text() | //p//text()[contains(.,"ADVT")] | //p//text()[contains(.,"READ MORE")]').getall()
-
-
-                """
-                The following logic using BeautifulSoup is trying to work around the limitation of
-                response.xpath('//p[not(.//strong) and not(.//b)]//text()').getall() , where this xpath() will
-                exclude html such as:   <p>relevant_text<strong>irrelevant_text</strong>relevant_text</p>
-                """
-
-                # Get HTML content
-                html_content = response.xpath('//body').get()
-
-                # Parse HTML content with BeautifulSoup
-                soup = BeautifulSoup(html_content, 'lxml')
-
-                # Find all <strong> and <b> tags
-                tags = soup.find_all(['strong', 'b'])
-
-                # Remove each tag
-                for tag in tags:
-                    tag.decompose()
-
-                # Get the modified HTML
-                html_content = str(soup)
-                #print(f"html_content after removing <strong> and <b> tags = {html_content}")
-
-                # Convert the resulting text into a Selector object
-                response_without_strong_and_b_tags = Selector(text=html_content)
-
-                # Extract the rest of the data
-                body = response_without_strong_and_b_tags.xpath('//p[not(contains(@class, "wp-caption-text")) and not(contains(@class, "footertext")) and not(contains(@class, "headertext")) and not(ancestor::div[@class="qni-cookmsg"]) and not(ancestor::blockquote[@class="twitter-tweet"]) and not(./iframe)]//text() | //li[not(*)]/text() | //p//text()[contains(.,"ADVT")] | //p//text()[contains(.,"READ MORE")]').getall()
-                #print(f"body after removing <strong> and <b> tags = {body}")
-
-
-                # Get the text of the <li> tags without any child tags
-                li_texts = response.xpath('//li[not(*)]/text()').getall()
-                #print(f"li_texts = {li_texts}")
-
-                # Replace <li> texts with comma separated
-                for i, text in enumerate(body):
-                    for j, t in enumerate(li_texts):
-                        #print(f"text = {text}, t = {t}")
-                        if text in t and j < len(li_texts) - 1:
-                            # replace the matching part of the text with t (which has a comma added)
-                            body[i] = text.replace(t, t + ',')
-
-                        if text in t and j == len(li_texts) - 1:
-                            # replace the matching part of the text with t (which has a fullstop added)
-                            body[i] = text.replace(t, t + '.')
-
-                if date is None:
-                    print("inquirer.net date is None !!!")
-
-                    # sometimes there could a meaningless <span> with a single text character
-                    if response.css('div#m-pd2 > span:nth-child(2)::text').get() and len(response.css('div#m-pd2 > span:nth-child(2)::text').get()) > 1:
-                        date = response.css('div#m-pd2 > span:nth-child(2)::text').get()
-                    if ((date and not self.is_a_valid_date(date)) or date is None) and response.css('div#m-pd2 > span:nth-child(3)::text').get() and len(response.css('div#m-pd2 > span:nth-child(3)::text').get()) > 1:
-                        date = response.css('div#m-pd2 > span:nth-child(3)::text').get()
-
-                    date = date or \
-                            response.css('div.art-byline span:last-child::text').get() or \
-                            response.css('ul.blog-meta-list > li:nth-child(3) a::text').get() or \
-                            response.css('li[itemprop="datePublished"] span::text').get() or \
-                            response.css('div[id="art_plat"]::attr(data-timezone)').get() or \
-                            response.css('#spl-byline span:last-child::text').get()
-
-                    if date is None and response.css('div[id="art_plat"]::text').getall():
-                        date = date or \
-                                response.css('div[id="art_plat"]::text').getall()[-1].replace("Updated as of:", "")
-
-                    if response.css('div.bpdate::text').getall():
-                        date = date or \
-                                response.css('div.bpdate::text').getall()[-1]
-
-            elif 'mb.com.ph' in response.url:
-                body = response.css('p ::text').getall()
-                if date is None:
-                    print("mb.com.ph date is None !!!")
-                    date = response.css('.mb-font-article-date::text').get()
-
-            elif 'nst.com.my' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('h1.page-title.mb-2 span.d-inline-block.mr-1::text').get()
-
-                if date is None and response.css('div.article-meta > div::text').get():
-                    date = response.css('div.article-meta > div::text').get().split(' @ ')[0]
-
-            elif 'thestar.com.my' in response.url:
-                #body = response.css('p:not(.caption):not(.date) ::text').getall()
-                body = response.xpath('//p[not(contains(@class, "caption")) and not(contains(@class, "date")) and not(contains(@class, "reactions__desc")) and not(contains(@class, "footer-bottom")) and not(contains(., "Do you have question")) and not(ancestor::div[@class="plan-temp_desc relative"]) and not(ancestor::div[@class="klci"]) and not(ancestor::div[@class="sponsored-panel"]) and not(ancestor::div[@class="for-side api-widget"]) and not(.//span[contains(@class, "inline-caption")]) and not(contains(., "ALSO READ:"))]//text() | //li[not(*)]/text()').getall()
-
-                # Get the text of the <li> tags without any child tags
-                li_texts = response.xpath('//li[not(*)]/text()').getall()
-                #print(f"li_texts = {li_texts}")
+            if self.raw_store is not None:
+                # Before extraction, so that a page breaking the extractor can be re-extracted once it is fixed
+                self.raw_store.put(response.url, response.body, response.meta, fetch_time(response), response.encoding)
 
-                # Replace <li> texts with comma separated
-                for i, text in enumerate(body):
-                    for j, t in enumerate(li_texts):
-                        #print(f"text = {text}, t = {t}")
-                        if text in t and j < len(li_texts) - 1:
-                            # replace the matching part of the text with t (which has a comma added)
-                            body[i] = text.replace(t, t + ',')
-
-                        #if text in t and j == len(li_texts) - 1:
-                            # replace the matching part of the text with t (which has a fullstop added)
-                            #body[i] = text.replace(t, t + '.')
-
-                if title is None:
-                    title = response.css('.headline.story-pg h1::text').get()
-
-                if date is None:
-                    date = response.css('p.date::text').get()
-
-            elif 'bernama.com/en/' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-12.col-lg-8 h1.h2::text').get()
-
-                date = response.css('div#body-row.row.oku_font div.col.pt-3 div.container-fluid.px-0 div.row div.col-12.col-sm-12.col-md-12.col-lg-8 div.row div.col-6.mt-3 div.text-right::text').get()
-
-            elif 'malaysianow.com' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('h1 ::text').get()
-
-                if date is None:
-                    date = response.css('time ::text').get()
-
-            elif 'freemalaysiatoday.com' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('h1 ::text').get()
-
-                if date is None:
-                    print("date is None for freemalaysiatoday")
-                    date = response.css('time ::text').get()
-                    print("date is still None for freemalaysiatoday")
-
-            elif 'vnanet.vn/en/' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('div.details__header h1::text').get()
-
-                date = response.css('time::text').get()
-
-                if date is None:
-                    print("date is None for vnanet")
-
-            elif 'vietnamnews.vn' in response.url:
-                body = response.css('p ::text').getall()
-
-                if title is None:
-                    title = response.css('div.detail__header h1.headline::text').get()
-
-                date = response.css('div.datetime::text').get()
-
-                if date is None:
-                    print("date is None for vietnamnews.vn")
-
-            elif 'en.vietnamplus.vn' in response.url:
-                body = response.xpath('//p//text() | //div[contains(@class, "content") and contains(@class, "article-body")]//text()[not(ancestor::div[contains(@class, "article-photo")])]').getall()
-
-                if title is None:
-                    title = response.css('div.details__header h1.details__headline.cms-title::text').get()
-
-                date = response.css('time::text').get()
-
-                if date is None:
-                    print("date is None for vietnamplus")
-
-            elif 'bangkokpost.com' in response.url:
-                print("get_article_content for bangkokpost")
-
-                body = response.xpath('//p[not(contains(@class, "Footnote")) and not(contains(@class, "footnote")) and not(ancestor::div[@class="footer"]) and not(ancestor::div[@class="article-info"]) and not(ancestor::div[@class="article-info--col"]) and not(ancestor::div[@class="article--columnist-history"]) and not(ancestor::div[@class="articlePhotoCenter"]) and not(ancestor::div[@class="embed-responsive-content"]) and not(ancestor::div[@class="PostbagName"])]//text() | //article/div[@class="articl-content"]/ul/li//text() | //article/div[@class="article-content"]/ul/li//text() | //article/div[@class="article-content"]/h2//text()').getall()
-
-                if title is None:
-                    title = response.css('div.article-headline > h1::text').get()
-
-                original_date_str = response.css('div.article-info--col:nth-child(1) > p:nth-child(1)::text').get() or \
-                                    response.css('div.article-info > div.row > div > p::text').get() or \
-                                    response.css('div.postbag-info-date > a#calendar > span::text').get() or \
-                                    response.css('div.article-news > article > div.article-info.has-columnnist > div:nth-child(1) > div > div:nth-child(2) > p::text').get()
-
-                if original_date_str is None:
-                    print("original_date_str is None for bangkokpost")
-
-                # Original date string
-                # original_date_str = "PUBLISHED : 12 Mar 2024 at 12:42"
-
-                # Preprocess the string to remove unnecessary parts
-                date = original_date_str.split("PUBLISHED :")[-1].split("published :")[-1].split(" at ")[0].strip()
-
-            elif 'thejakartapost.com' in response.url:
-                body = response.xpath('//p[not(ancestor::div[@class="tjp-newsletter-box"]) and not(ancestor::div[@class="on-ie-underversion9"]) and not(ancestor::div[@class="social-login col-sm-12 columns"])]//text() | //div[@class="tjp-opening"]/h1/text()').getall()
-
-                if title is None:
-                    title = response.css('div.tjp-single__head-item.tjp-single__head-item--detail > h1::text').get()
-
-                date = response.css('div.tjp-meta > div > div.tjp-meta__content-list > div:nth-child(2)::text').get()
-
-                if date is None:
-                    print("date is None for thejakartapost")
-
-            elif 'go.kompas.com' in response.url:
-                body = response.xpath('//p[not(contains(., "Also Read:")) and not(contains(., "Also read:"))]//text() | //div[@class="read__content"]//h3//text() | //div[@class="read__content"]//li//text()').getall()
-
-                if title is None:
-                    title = response.css('body > div.wrap > div.container.clearfix > div > div > h1::text').get()
-
-                date = response.css('div.read__time::text').get()
-
-                if date is None:
-                    print("date is None for go.kompas")
-
-            elif 'khmertimeskh.com' in response.url:
-                body = response.xpath('//p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][not(position()=last()) and not(position()=last()-1)]//text() | \
-                                       //p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][position()=last() or position()=last()-1]/text() | \
-                                       //p[ancestor::div[@class="entry-content"] and not(ancestor::div[@class="entry-navigation"]) and not(ancestor::div[@class="cpwp-wrap-text-stage"]) and not(contains(., "Also Read:")) and not(contains(., "Also read:")) and not(span[@style="color: #ffffff;" and normalize-space(text())="x"])][position()=last() or position()=last()-1]/*[not(self::em)]/text() | \
-                                       //li[ancestor::div[@class="entry-content"] and not(ancestor::ul[@class="rp4wp-posts-list"]) and not(ancestor::ul[@class="entry-fields"])]//text()').getall()
-
-                if title is None:
-                    title = response.css('h2.entry-title::text').get()
-
-                date = response.css('time.entry-time::text').get()
-
-                if date is None:
-                    print("date is None for khmertimeskh")
-
-            elif 'english.cambodiadaily.com' in response.url:
-                body = response.xpath('//p[not(contains(., "Also Read:")) and not(contains(., "Also read:"))]//text()').getall()
-
-                if title is None:
-                    title = response.css('h1.tdb-title-text::text').get()
-
-                date = response.css('time.entry-date.updated.td-module-date::text').get()
-
-                if date is None:
-                    print("date is None for cambodiadaily")
-
-            elif 'phnompenhpost.com' in response.url:
-                body = response.xpath('//p[not(contains(., "Publication date")) and not(contains(., "Reporter :")) and not(ancestor::div[@class="img-captions"]) and not(ancestor::div[@class="mustwatch-text"])]//text()').getall()
-
-                if title is None:
-                    title = response.css('div.section-article-header > h2::text').get()
-
-                # XPath to find the <p> containing 'Publication date' and then extract the date
-                date = response.xpath('//p[contains(text(), "Publication date")]/text()').getall()
-                print(f"date => {date}")
-
-                if date:
-                    # we only want the text after 'Publication date'
-                    date = date[-1].strip()
-                    print(f"date =>> {date}")
-
-                    # Extracting the date part before the '|' inside '12 February 2023 | 12:12 ICT'
-                    date = date.split('|')[0].strip()  # This will result in '12 February 2023'
-                    print(f"date =>>> {date}")
-
-                else:
-                    print("date is None for phnompenhpost.com")
-
-            elif 'archive.org' in response.url:
-                body = response.css('div.article p::text').getall() or \
-                       response.css('div.text-long').getall() or \
-                       response.css('main#maincontent > div.container.container-ia > pre::text').getall()
+            extractor = self.extractors.lookup(response.url)
 
+            if extractor is not None:
+                title, date, body = extractor.get_article_content(response, title, date)
             else:
                 body = None
 
@@ -2384,6 +1323,24 @@ class CovidNewsSpider(scrapy.Spider):
                 date = ''.join(c for c in date if c.isprintable())  # to remove erroneous non-ASCII printable character
                 date = date.strip()  # to remove unnecessary whitespace or newlines characters
 
+            fetch_tier = response.meta.get('fetch_tier')
+
+            if self.fetch_tiers is not None and fetch_tier is not None:
+                extraction_succeeded = bool(title and body and date)
+                self.fetch_tiers.record(URL_KIND_ARTICLE, article_url, fetch_tier, extraction_succeeded)
+
+                if fetch_tier == TIER_HTTP and not extraction_succeeded:
+                    # Probably rendered by javascript, try again with Splash, with what parse_article() had found
+                    print(f"plain download of {article_url} misses title, body or date, rendering it with Splash")
+                    yield self.build_request(
+                        url=article_url,
+                        callback=self.get_article_content,
+                        meta={key: response.meta[key] for key in ('title', 'date', 'article_url', 'body', 'listing_depth') if key in response.meta},
+                        tier=TIER_SPLASH,
+                        dont_filter=True
+                    )
+                    return
+
             #print(f"inside get_article_content(), article_url = {link} , title = {title}, date = {date}, body = {body}")
 
             if body == []:
@@ -2402,45 +1359,37 @@ class CovidNewsSpider(scrapy.Spider):
 
                 link = new_article_url
 
-                if not link or "javascript" in link or "mailto" in link or "whatsapp://" in link or \
-                    "play.google.com" in link or "apps.apple.com" in link or \
-                    any(article_url in link for article_url in incomplete_articles) or \
-                    any(file_extension in link for file_extension in excluded_file_extensions) or \
-                    any(subdomain_name in link for subdomain_name in irrelevant_subdomain_names) or \
-                    any(subdomain_name in link for subdomain_name in inaccessible_subdomain_names) or \
-                    domain_name not in allowed_domain_names:
+                skip_reason = self.url_filter.check(link, domain_name)
+                if skip_reason:
                     # skipping urls
-                    #print(f"skipped {link} inside get_article_content()")
+                    #print(f"skipped {link} inside get_article_content() due to {skip_reason}")
                     yield None
 
                 else:
-                    yield SplashRequest(
+                    yield self.build_request(
                          url=new_article_url,
                          callback=self.get_article_content,
                          meta={'title': title, 'date': date, 'article_url': new_article_url, 'body': body},  # Pass additional data here
-                         #endpoint='render.html',  # for non-pure html with javascript
-                         endpoint='execute',  # for closing advertising overlay page to get to desired page
-                         args={'lua_source': self.js_script,
-                               'lua_source_isolated': False,  # for showing self.js_script print() output
-                               'adblock': True,
-                               'wait': 10,
-                               'resource_timeout': 10,
-                               'timeout': 60  # limit the total time the Lua script can run (optional)
-                              },
-                         splash_headers={'X-Splash-Render-HTML': 1},  # for non-pure html with javascript
-                         headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
                     )
 
             # This is an early sign that the current webpage is containing multiple articles
             # url_had_redirected is not an absolute necessary condition that warrants the re-execution of parse()
+            # Some outlets have articles list even in the actual article, see Extractor.reparse_listings_in_article_page
             if self.parse_articles(response) is not None and \
-                (domain_name != 'khmertimeskh.com' and domain_name != 'phnompenhpost.com' and domain_name != "vietnamnews.vn" and domain_name != "en.vietnamplus.vn" and domain_name != "bangkokpost.com"):
-                # these domains have articles list even in the actual article, but we do not want to deal with the list now during article data writing phase
+                self.extractors.lookup(response.url).reparse_listings_in_article_page:
                 print(f"going back to parse() for {link}")
                 yield from self.parse(response)
 
             else:
-                self.write_to_local_data(response, link, title, body, date)
+                # None when the article was not even looked at, e.g. empty body
+                derived_fields = self.write_to_local_data(response, link, title, body, date)
+
+                # A 202 or a page missing its title, body or date (not rendered yet, blocked ...) is fetched again next run
+                if self.url_frontier is not None and derived_fields is not None and title and body and date:
+                    # Both the requested and the redirected url, parse_article() only knows the former
+                    self.url_frontier.add_article(article_url)
+                    if link and link != article_url:
+                        self.url_frontier.add_article(link)
 
                 '''
                 # for the purpose of debugging js_script
@@ -2461,69 +1410,46 @@ class CovidNewsSpider(scrapy.Spider):
                         f.write(base64.b64decode(png))
                 '''
 
+                self.crawl_policy.record_article()
+
+                profile = self.profile_for(link or response.url, response.meta)
+                self.inc_country_stat(profile, 'items')
+
                 yield {
                     'title': title,
                     'link': link,
                     'date': date,
                     'body': body,
                     #'excerpt': article.css('p::text').get(),
-                    'source': self.get_source(response)
+                    'source': self.get_source(response),
+                    'country': profile.name,
+                    **(derived_fields or {})
                 }
 
 
+    def is_within_covid_period(self, published_timestamp, url=None):
+        # In the covid period of the country of the url
+        return self.profile_for(url).is_within_covid_period(published_timestamp)
+
+
     def write_to_local_data(self, response, link=None, title=None, body=None, date=None):
         # The HTTP 202 status code generally means that the request has been received but not yet acted upon.
         if response.status == 202:
             print("response.status == 202")
             return None
 
-        if "month ago" in date.lower() or "months ago" in date.lower() or \
-            "week ago" in date.lower() or "weeks ago" in date.lower() or \
-            "day ago" in date.lower() or "days ago" in date.lower() or \
-            "h ago" in date.lower() or "m ago" in date.lower() or "s ago" in date.lower() or \
-            "hour ago" in date.lower() or "hours ago" in date.lower() or \
-            "minute ago" in date.lower() or "minutes ago" in date.lower() or \
-            "min ago" in date.lower() or "mins ago" in date.lower() or \
-            "second ago" in date.lower() or "seconds ago" in date.lower() or \
-            "sec ago" in date.lower() or "secs ago" in date.lower():
-            published_year = 2023
-        else:
-            date = parse(date)
-            published_year = date.year
-
-
-        if TEST_SPECIFIC:
-            date_is_within_covid_period = published_year >= 2019
-        else:
-            if search_country == 'singapore':
-                # Jan 2020 till Jan 2022
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2021))
-
-            elif search_country == 'philippines':
-                # https://en.wikipedia.org/wiki/COVID-19_community_quarantines_in_the_Philippines
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2022))
+        extractor = self.extractors.lookup(response.url)
+        date_formats = extractor.date_formats if extractor is not None else ()
 
-            elif search_country == 'malaysia':
-                # https://en.wikipedia.org/wiki/Malaysian_movement_control_order
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2022))
+        # Local time and covid period of the country of the article
+        profile = self.profile_for(link or response.url, response.meta)
 
-            elif search_country == 'vietnam':
-                # https://en.wikipedia.org/wiki/Timeline_of_the_COVID-19_pandemic_in_Vietnam
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2022))
+        # UTC timestamp, relative dates like '5 hours ago' are counted from the time the page was fetched
+        published_timestamp = profile.date_normalizer.timestamp(date, date_formats, fetch_time(response))
 
-            elif search_country == 'thailand':
-                # https://en.wikipedia.org/wiki/Timeline_of_the_COVID-19_pandemic_in_Thailand
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2022))
+        date_is_within_covid_period = profile.is_within_covid_period(published_timestamp)
 
-            elif search_country == 'indonesia':
-                # https://en.wikipedia.org/wiki/COVID-19_pandemic_in_Indonesia
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2023))
-
-            elif search_country == 'cambodia':
-                # https://en.wikipedia.org/wiki/COVID-19_pandemic_in_Cambodia#Timeline
-                date_is_within_covid_period = ((published_year >= 2020) and (published_year <= 2023))
-
-        print(f"date = {date}, and published_year = {published_year}, and date_is_within_covid_period = {date_is_within_covid_period}")
+        print(f"date = {date}, and published_timestamp = {published_timestamp}, and date_is_within_covid_period = {date_is_within_covid_period}")
 
         # we had already retried to re-fetch the new_article_url inside get_article_content(), so if body is still an empty list,
         # this means there is either no new_article_url or the newly redirected page also had no body paragraph text
@@ -2540,29 +1466,48 @@ class CovidNewsSpider(scrapy.Spider):
 
         print(f"inside write_to_local_data(), article_url = {link} , title = {title}, date = {date}, body = {body}")
 
-        if (((title != None and any(keyword in title.lower() for keyword in search_keywords)) or \
-            (body != None and any(keyword in body.lower() for keyword in search_keywords))) and \
-            (date_is_within_covid_period)) or \
+        # Keyword hits per search keyword and the publication timestamp, exported as item fields for downstream ranking
+        title_keyword_counts = self.keyword_matcher.count(title)
+        body_keyword_counts = self.keyword_matcher.count(body)
+
+        # The body after remove_media_credit() and remove_footnote(), the item 'body' stays the extracted paragraph list,
+        # `scrapy reextract` and the SQLite index have no sink and use this one
+        derived_fields = {
+            'clean_body': body,
+            'published_timestamp': published_timestamp,
+            'title_keyword_counts': title_keyword_counts,
+            'body_keyword_counts': body_keyword_counts,
+            'keyword_hit_count': sum(title_keyword_counts.values()) + sum(body_keyword_counts.values()),
+        }
+
+        if DETECT_NEAR_DUPLICATES and body:
+            # hex, 64-bit unsigned integers do not fit every downstream store
+            fingerprint = simhash(body)
+            derived_fields['simhash'] = f"{fingerprint:016x}"
+            derived_fields['duplicate_of'] = None
+
+        if (derived_fields['keyword_hit_count'] > 0 and date_is_within_covid_period) or \
             (TEST_SPECIFIC and link in self.start_urls):
-            # Create a unique filename for each URL by removing the 'http://', replacing '/' with '_', and adding '.html'
-            file_parent_directory = ''
-            original_filename = file_parent_directory + link.replace('http://', '').replace('/', '_') + '.html'
-            print("filename = ", original_filename)
-
-            # Solution to OSError: [Errno 63] File name too long : Truncate the filename
-            filename_max_length = 255  # Adjust based on the filesystem's limits
-            if len(original_filename) > filename_max_length:
-                filename = original_filename[:filename_max_length]
-            else:
-                filename = original_filename
+            if self.near_duplicates is not None and body and word_count(body) >= MIN_WORDS:
+                derived_fields['duplicate_of'] = self.near_duplicates.check(link, fingerprint)
+
+            article_sink = profile.article_sink
+
+            if article_sink is None:
+                return derived_fields
+
+            if COLLAPSE_NEAR_DUPLICATES and derived_fields.get('duplicate_of'):
+                print(f"{link} is a near-duplicate of {derived_fields['duplicate_of']}, not writing it")
+                return derived_fields
 
-            # Write the entire body of the response to a file
-            with open(filename, 'wb') as f:
-                if len(original_filename) > filename_max_length:
-                    f.write(original_filename.encode('utf-8'))
-                    f.write('\n'.encode('utf-8'))
+            if self.incremental_recrawl and body is not None and article_sink.is_unchanged(link, body):
+                # Re-rendered because of FORCE_REFRESH or ARTICLE_MAX_AGE, but nothing changed since, it is fresh again
+                print(f"{link} is unchanged, not rewriting it")
+                article_sink.touch(link)
+                return derived_fields
 
-                f.write(body.encode('utf-8'))
+            article_sink.write(link, title, date, body, derived_fields)
+            self.inc_country_stat(profile, 'articles_written')
 
-        return None
+        return derived_fields
 
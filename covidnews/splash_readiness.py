@@ -0,0 +1,197 @@
+# Readiness-driven Splash rendering
+#
+# Both js_script variants used to wait a fixed 7 seconds after splash:go(), and the
+# phnompenhpost one 5 more seconds after every 'load more' click, whatever the speed of
+# the site. READINESS_LUA_SCRIPT polls the page every poll_interval seconds instead, and
+# returns as soon as one of these holds :
+#   - ready_selector matches (listing_selector of the outlet for listing pages,
+#     Extractor.ready_selector for article pages)
+#   - the network is idle (at most max_pending_requests in flight) and the DOM size did
+#     not change for stable_polls polls in a row
+# with max_wait seconds as hard cap. DOMAIN_READINESS_OVERRIDES tunes these per domain.
+#
+# The script also returns its own timing next to the html (response.data['timing']),
+# RenderTimings collects them so the real render latency per domain is printed when
+# the spider closes.
+
+from collections import Counter, defaultdict
+
+from covidnews.frontier import URL_KIND_LISTING
+
+
+READINESS_LUA_SCRIPT = """
+    function main(splash, args)
+        local poll_interval = args.poll_interval or 0.25
+        local max_wait = args.max_wait or 10
+        local stable_polls = args.stable_polls or 3
+        local max_pending_requests = args.max_pending_requests or 2
+
+        -- requests still in flight, for the network idle signal
+        local pending_requests = 0
+        splash:on_request(function(request)
+            pending_requests = pending_requests + 1
+        end)
+        splash:on_response(function(response)
+            pending_requests = pending_requests - 1
+        end)
+
+        local function select(selector)
+            -- an invalid selector must not kill the render
+            local ok, element = pcall(splash.select, splash, selector)
+            if ok then
+                return element
+            end
+            return nil
+        end
+
+        local function dom_size()
+            return splash:evaljs("document.body ? document.body.innerHTML.length : 0")
+        end
+
+        local function milliseconds_since_navigation()
+            return splash:evaljs("Date.now() - performance.timing.navigationStart")
+        end
+
+        -- Polls until the page looks ready, returns why it stopped and how long it waited
+        local function wait_until_ready(max_seconds)
+            local waited = 0
+            local stable = 0
+            local last_size = -1
+
+            while waited < max_seconds do
+                if args.ready_selector and select(args.ready_selector) then
+                    return "selector", waited
+                end
+
+                local size = dom_size()
+                if size == last_size then
+                    stable = stable + 1
+                else
+                    stable = 0
+                end
+                last_size = size
+
+                if stable >= stable_polls and pending_requests <= max_pending_requests then
+                    return "idle", waited
+                end
+
+                splash:wait(poll_interval)
+                waited = waited + poll_interval
+            end
+
+            return "timeout", waited
+        end
+
+        -- Go to page
+        splash:go(args.url)
+
+        local load_ms = splash:evaljs("performance.timing.loadEventEnd - performance.timing.navigationStart")
+        local ready_reason, waited = wait_until_ready(max_wait)
+
+        -- Keep clicking the "load more" button until it is gone or disabled
+        local load_more_clicks = 0
+        if args.load_more_selector then
+            while load_more_clicks < (args.max_load_more_clicks or 20) do
+                local button = select(args.load_more_selector)
+                if not button or button:hasAttribute("disabled") then
+                    break
+                end
+
+                local size_before_click = dom_size()
+                button:mouse_click()
+                load_more_clicks = load_more_clicks + 1
+
+                -- until the new items are appended, then until the page settles again
+                local load_more_waited = 0
+                while dom_size() == size_before_click and load_more_waited < (args.load_more_wait or 5) do
+                    splash:wait(poll_interval)
+                    load_more_waited = load_more_waited + poll_interval
+                end
+                local _, settle_waited = wait_until_ready(args.load_more_wait or 5)
+                waited = waited + load_more_waited + settle_waited
+            end
+        end
+
+        -- Print url
+        print("splash:url() = ", splash:url(), " ready by ", ready_reason, " after ", waited, "s")
+
+        local result = {
+            url = splash:url(),
+            html = splash:html(),
+            timing = {
+                load_ms = load_ms,
+                ready_ms = milliseconds_since_navigation(),
+                waited = waited,
+                ready_reason = ready_reason,
+                load_more_clicks = load_more_clicks,
+            },
+        }
+
+        -- for visual debugging purpose
+        if args.png then
+            splash:set_viewport_full()
+            result.png = splash:png()
+        end
+
+        return result
+    end
+    """
+
+# Splash args read by READINESS_LUA_SCRIPT, before the per-domain overrides
+DEFAULT_READINESS = {
+    'poll_interval': 0.25,
+    'max_wait': 10,
+    'stable_polls': 3,
+    'max_pending_requests': 2,
+}
+
+# Registered domain -> Splash args replacing DEFAULT_READINESS
+DOMAIN_READINESS_OVERRIDES = {
+    # listing pages only show all their articles after clicking "load more" again and again
+    'phnompenhpost.com': {'load_more_selector': '#load-more-button', 'load_more_wait': 5},
+}
+
+# Printed per domain by RenderTimings.summary()
+TIMING_PERCENTILES = (50, 90, 99)
+
+
+def readiness_args(extractor, kind, domain_name):
+    # Splash args for a listing or article page of the given outlet
+    args = dict(DEFAULT_READINESS)
+
+    if extractor is not None:
+        ready_selector = extractor.listing_selector if kind == URL_KIND_LISTING else extractor.ready_selector
+        if ready_selector:
+            args['ready_selector'] = ' '.join(ready_selector.split())
+
+    args.update(DOMAIN_READINESS_OVERRIDES.get(domain_name, {}))
+    return args
+
+
+def percentile(sorted_values, percent):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index]
+
+
+class RenderTimings:
+    # domain -> list of Splash ready_ms, and how each render became ready
+
+    def __init__(self):
+        self.ready_ms = defaultdict(list)
+        self.ready_reasons = defaultdict(Counter)
+
+    def record(self, domain_name, timing):
+        if timing.get('ready_ms') is not None:
+            self.ready_ms[domain_name].append(timing['ready_ms'])
+        self.ready_reasons[domain_name][timing.get('ready_reason')] += 1
+
+    def summary(self):
+        lines = []
+
+        for domain_name in sorted(self.ready_ms):
+            values = sorted(self.ready_ms[domain_name])
+            percentiles = ', '.join(f"p{percent} {percentile(values, percent) / 1000:.1f}s" for percent in TIMING_PERCENTILES)
+            reasons = ', '.join(f"{reason} {count}" for reason, count in self.ready_reasons[domain_name].most_common())
+            lines.append(f"{domain_name} : {len(values)} renders, {percentiles}, max {values[-1] / 1000:.1f}s ({reasons})")
+
+        return '\n'.join(lines)
@@ -0,0 +1,75 @@
+# Caption and media credit stripping behind CovidNewsSpider.remove_media_credit()
+#
+# remove_media_credit() used to apply about 27 re.sub() in sequence, each copying the
+# whole body. The `.+?Photo from.+?\n` / `.*?file photo.*?\n` ones ran with re.DOTALL,
+# so every start position scanned to the end of the body : quadratic on long bodies
+# without newline (archive.org full texts), and they also swallowed every paragraph
+# before the caption line.
+#
+# The cleanup is now a single pass over the lines of the body. Each line gets the
+# inline removals (parenthesized captions, livestream prompts), then is dropped if it
+# still contains a credit marker. Every pattern below is anchored on a literal and
+# never crosses a line, so the work per line is bounded by the length of that line.
+#
+# Like the original `...\n` patterns, the last line (no trailing newline) is never
+# dropped, which matters for archive.org full texts that are often one single line.
+
+import re
+
+
+# Parenthesized captions and inline prompts, removed from inside the line
+INLINE_CREDIT_PATTERN = re.compile(
+    # "(... first of two parts ...)", "(... pic ...)" in any case, not crossing another parenthesis
+    r"\([^()]*(?i:first of two parts|second of two parts|pic)[^()]*\)"
+    # "(Image: ...)", "(Photo...)", "(AP Photo...)", "(File photo: ...)" up to the first closing parenthesis
+    r"|\((?:Image: |Photo|AP Photo|File photo: ).[^)]*\)"
+    r"|WATCH THE LIVESTREAM HERE:"
+    r"|Watch the full speech:"
+)
+
+# Lines containing one of these are photo captions or credits, and are dropped entirely
+CREDIT_LINE_MARKERS = [
+    "Photo from",
+    "Screenshot from",
+    "FIle photo",
+    "file photo",
+    "File photo",
+    "FILE PHOTO",
+    "FILE-",
+    "PHOTO:",
+    "PVL PHOTO",
+    "UAAP PHOTO",
+    "INQUIRER PHOTO",
+    "/INQUIRER.net",
+    "PHOTO FROM",
+    "REUTERS/",
+    "CONTRIBUTED PHOTO",
+]
+
+CREDIT_LINE_PATTERN = re.compile('|'.join(re.escape(marker) for marker in CREDIT_LINE_MARKERS))
+
+# Only reached by the last line, any other line with "FILE PHOTO" is dropped above
+FILE_PHOTO_PATTERN = re.compile(r"FILE PHOTO-.|FILE PHOTO: .+?File Photo")
+
+# Cheap per-line test before running INLINE_CREDIT_PATTERN, every inline pattern starts with one of these
+INLINE_CREDIT_FIRST_CHARS = ('(', 'WATCH', 'Watch')
+
+
+def remove_media_credit(text):
+    lines = []
+    raw_lines = text.split('\n')
+    last_index = len(raw_lines) - 1
+
+    for index, line in enumerate(raw_lines):
+        if any(first_chars in line for first_chars in INLINE_CREDIT_FIRST_CHARS):
+            line = INLINE_CREDIT_PATTERN.sub('', line)
+
+        if index != last_index and CREDIT_LINE_PATTERN.search(line):
+            continue
+
+        if "FILE PHOTO" in line:
+            line = FILE_PHOTO_PATTERN.sub('', line)
+
+        lines.append(line)
+
+    return '\n'.join(lines)
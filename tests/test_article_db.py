@@ -0,0 +1,59 @@
+# covidnews.article_db with items shaped like the ones get_article_content() yields
+
+import pytest
+
+pytest.importorskip('w3lib')
+
+from covidnews.article_db import connect, search, upsert_items
+
+
+def spider_item(link, body, **fields):
+    # body is the list of paragraphs of Extractor.get_body(), clean_body the text written by write_to_local_data()
+    return {
+        'title': 'Vaccination centres extend opening hours',
+        'link': link,
+        'date': '12 May 2021',
+        'body': body,
+        'source': 'CNA',
+        'country': 'singapore',
+        'published_timestamp': 1620777600,
+        'title_keyword_counts': {'vaccination': 1},
+        'body_keyword_counts': {'vaccine': 2},
+        'keyword_hit_count': 3,
+        'simhash': '00ff00ff00ff00ff',
+        'duplicate_of': None,
+        **fields
+    }
+
+
+def test_upsert_items_with_a_list_body(tmp_path):
+    db = connect(str(tmp_path / 'articles.sqlite3'))
+
+    upsert_items(db, [
+        spider_item('https://www.channelnewsasia.com/singapore/vaccination-centres-1', ['  Booster shots ', 'for all adults. ']),
+        spider_item('https://www.channelnewsasia.com/singapore/vaccination-centres-2', None),
+    ])
+
+    rows = db.execute("SELECT link, body FROM articles ORDER BY link").fetchall()
+    assert rows == [
+        ('https://www.channelnewsasia.com/singapore/vaccination-centres-1', 'Booster shots\nfor all adults.'),
+        ('https://www.channelnewsasia.com/singapore/vaccination-centres-2', None),
+    ]
+    assert [row[0] for row in search(db, 'booster')] == ['https://www.channelnewsasia.com/singapore/vaccination-centres-1']
+
+
+def test_captions_and_footnotes_are_not_indexed(tmp_path):
+    db = connect(str(tmp_path / 'articles.sqlite3'))
+    paragraphs = ['Booster shots for all adults.', 'Queue at a clinic. Photo from the Ministry of Health',
+                  'Download our app for the latest news.']
+
+    upsert_items(db, [
+        spider_item('https://www.channelnewsasia.com/singapore/vaccination-centres-1', paragraphs,
+                    clean_body='Booster shots for all adults.\n'),
+        # no clean_body, e.g. an item saved by an older run, cleaned by article_db itself
+        spider_item('https://www.channelnewsasia.com/singapore/vaccination-centres-2', paragraphs),
+    ])
+
+    assert len(search(db, 'booster')) == 2
+    assert search(db, 'ministry') == []
+    assert search(db, 'app') == []
@@ -0,0 +1,49 @@
+# covidnews.countries, `-a countries=...` selection of the profiles in countries.yaml
+
+import pytest
+
+pytest.importorskip('yaml')
+
+from covidnews.countries import load_profiles, select_profiles
+
+
+@pytest.fixture(scope='module')
+def profiles():
+    return load_profiles()
+
+
+def names(selected):
+    return [profile.name for profile in selected]
+
+
+@pytest.mark.parametrize('countries, expected', [
+    ('sg,my', ['singapore', 'malaysia']),
+    (' SG , my ,', ['singapore', 'malaysia']),
+    ('malaysia,sg,my', ['malaysia', 'singapore']),
+    (['ph', 'vietnam'], ['philippines', 'vietnam']),
+    ('kh', ['cambodia']),
+])
+def test_select_profiles(profiles, countries, expected):
+    assert names(select_profiles(profiles, countries)) == expected
+
+
+def test_select_all(profiles):
+    assert names(select_profiles(profiles, 'all')) == list(profiles)
+    assert len(profiles) == 7
+
+
+@pytest.mark.parametrize('countries', ['sg,xx', 'japan', ['my', 'singapur']])
+def test_unknown_country(profiles, countries):
+    with pytest.raises(ValueError, match='unknown country'):
+        select_profiles(profiles, countries)
+
+
+def test_allowed_domains_belong_to_one_country(profiles):
+    # every url is routed to its country by its allowed domain name
+    domains = [domain for profile in profiles.values() for domain in profile.allowed_domains]
+    assert len(domains) == len(set(domains))
+
+
+def test_path_style_allowed_domains(profiles):
+    assert 'bernama.com/en/' in profiles['malaysia'].allowed_domains
+    assert 'vnanet.vn/en/' in profiles['vietnam'].allowed_domains
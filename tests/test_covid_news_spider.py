@@ -0,0 +1,74 @@
+# CovidNewsSpider.get_article_content() on pages built here, nothing is downloaded
+
+import pytest
+
+pytest.importorskip('scrapy')
+
+from scrapy import Request
+from scrapy.http import HtmlResponse
+
+from covidnews.frontier import UrlFrontier
+from covidnews.spiders.covid_news_spider import CovidNewsSpider
+
+
+ARTICLE_URL = 'https://www.phnompenhpost.com/national/vaccination-centres-extend-opening-hours'
+
+TITLE = b'<div class="section-article-header"><h2>Vaccination centres extend opening hours</h2></div>'
+DATE = b'<p>Publication date<br>12 May 2021 | 12:12 ICT</p>'
+BODY = b'<p>More than two million people have received both doses of the covid vaccine.</p>'
+
+
+def article_response(page, status=200):
+    request = Request(ARTICLE_URL, meta={'title': None, 'date': None, 'article_url': ARTICLE_URL})
+    return HtmlResponse(ARTICLE_URL, status=status, body=b'<html><body>' + page + b'</body></html>', encoding='utf-8', request=request)
+
+
+@pytest.fixture
+def spider(tmp_path):
+    spider = CovidNewsSpider(offline=True, countries='kh')
+    spider.url_frontier = UrlFrontier(str(tmp_path / 'url_frontier'), 3600)
+    yield spider
+    spider.url_frontier.close()
+
+
+@pytest.mark.parametrize('page, status', [
+    (TITLE + DATE + BODY, 202),  # not processed yet by the outlet
+    (TITLE + BODY, 200),         # no date, e.g. a page that needs rendering
+    (DATE + BODY, 200),          # no title
+], ids=['status-202', 'no-date', 'no-title'])
+def test_articles_not_looked_at_are_fetched_again(spider, page, status):
+    list(spider.get_article_content(article_response(page, status)))
+
+    assert not spider.url_frontier.is_known_article(ARTICLE_URL)
+
+
+def test_extracted_articles_are_known(spider):
+    items = [result for result in spider.get_article_content(article_response(TITLE + DATE + BODY)) if isinstance(result, dict)]
+
+    assert [item['date'] for item in items] == ['12 May 2021']
+    assert spider.url_frontier.is_known_article(ARTICLE_URL)
+
+
+@pytest.mark.parametrize('url, country', [
+    ('https://www.bernama.com/en/general/news_covid-19.php?id=2012345', 'malaysia'),
+    ('https://vnanet.vn/en/tin-tuc/xa-hoi/covid-19-vaccination-drive-5123.html', 'vietnam'),
+    ('https://www.straitstimes.com/singapore/health/vaccination-centres', 'singapore'),
+    ('https://www.thestar.com.my/news/nation/2021/05/12/vaccination-centres', 'malaysia'),
+    # outside every allowed domain, the first country
+    ('https://web.archive.org/web/2021/https://vnanet.vn/en/tin-tuc/5123.html', 'singapore'),
+])
+def test_profile_for(url, country):
+    spider = CovidNewsSpider(offline=True, countries='sg,my,vn')
+
+    assert spider.profile_for(url).name == country
+
+
+def test_profile_for_prefers_the_request_country():
+    spider = CovidNewsSpider(offline=True, countries='sg,my,vn')
+
+    assert spider.profile_for('https://web.archive.org/web/2021/https://vnanet.vn/en/', {'country': 'vietnam'}).name == 'vietnam'
+
+
+def test_unknown_country_argument():
+    with pytest.raises(ValueError, match='unknown country'):
+        CovidNewsSpider(offline=True, countries='sg,xx')
@@ -0,0 +1,56 @@
+# covidnews.crawl_policy.CrawlPolicy, link classes, depth budget, pagination cap and backpressure
+
+import pytest
+
+from covidnews.crawl_policy import LINK_CLASS_PAGINATION, LINK_CLASS_SECTION, CrawlPolicy
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.rappler.com/nation/?page=3',
+    'https://www.straitstimes.com/search?searchkey=covid&p=12',
+    'https://www.khmertimeskh.com/category/national/page/4/',
+    'https://www.thestar.com.my/news/nation/page4',
+    'https://www.bangkokpost.com/search?q=covid&start=40',
+])
+def test_pagination_links(url):
+    assert CrawlPolicy().link_class(url) == LINK_CLASS_PAGINATION
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.rappler.com/nation/',
+    'https://www.rappler.com/pages/about-us',
+    'https://www.straitstimes.com/singapore?ref=header',
+])
+def test_section_links(url):
+    assert CrawlPolicy().link_class(url) == LINK_CLASS_SECTION
+
+
+def test_pagination_selector_links():
+    assert CrawlPolicy().link_class('https://www.phnompenhpost.com/national?more', {'https://www.phnompenhpost.com/national?more'}) == LINK_CLASS_PAGINATION
+
+
+def test_depth_budget_only_limits_section_links():
+    policy = CrawlPolicy(max_listing_depth=2, domain_max_listing_depths={'rappler.com': 4})
+
+    assert policy.skip_reason('inquirer.net', LINK_CLASS_SECTION, 2, 0) is None
+    assert policy.skip_reason('inquirer.net', LINK_CLASS_SECTION, 3, 0) == 'depth_budget'
+    assert policy.skip_reason('rappler.com', LINK_CLASS_SECTION, 4, 0) is None
+    assert policy.skip_reason('inquirer.net', LINK_CLASS_PAGINATION, 10, 0) is None
+
+
+def test_pagination_links_per_page_are_capped():
+    policy = CrawlPolicy(max_pagination_links=3)
+
+    assert [policy.skip_reason('inquirer.net', LINK_CLASS_PAGINATION, 0, 0, followed) for followed in range(5)] == \
+        [None, None, None, 'pagination_cap', 'pagination_cap']
+    assert policy.dropped['pagination_cap'] == 2
+
+
+@pytest.mark.parametrize('link_class', [LINK_CLASS_SECTION, LINK_CLASS_PAGINATION])
+def test_backpressure(link_class):
+    policy = CrawlPolicy(max_pending_requests=100)
+
+    assert policy.skip_reason('inquirer.net', link_class, 0, 99) is None
+    assert policy.skip_reason('inquirer.net', link_class, 0, 100) == 'backpressure'
+    # no running engine, e.g. `scrapy reextract`
+    assert policy.skip_reason('inquirer.net', link_class, 0, None) is None
@@ -0,0 +1,88 @@
+# covidnews.dedup, SimHash fingerprints and the banded NearDuplicateIndex
+
+from covidnews.dedup import (
+    MAX_HAMMING_DISTANCE, SIMHASH_BITS, NearDuplicateIndex, from_signed, hamming_distance, simhash, to_signed, word_count
+)
+
+
+ARTICLE = """SINGAPORE: Vaccination centres across the island will extend their opening hours from Monday as the country steps up its booster programme, the Ministry of Health said on Wednesday. The centres will open from 8am to 10pm daily, two hours longer than before, to cope with the rising number of people who are due for their third dose. More than two million people have received both doses of a covid vaccine so far, and about half a million have already had their booster shot. Walk-in appointments will be available for seniors aged 60 and above, who can bring along a family member to be vaccinated at the same time. The ministry urged those who are eligible to book their appointments early, as slots in the evening are expected to fill up quickly. Mobile vaccination teams will also visit community centres in the coming weeks to reach residents who have difficulty travelling. The number of daily cases has risen over the past fortnight, with most of the infections detected among unvaccinated people, said the ministry. Hospitals remain under pressure, and the authorities have asked people with mild symptoms to recover at home rather than visit emergency departments. The current measures, including the limit of five people per group for dining in, will be reviewed at the end of the month, the multi-ministry task force said."""
+
+# The same story republished by a wire service, with a dateline, a date and a credit line added
+REPUBLISHED = ARTICLE.replace("SINGAPORE: ", "SINGAPORE (Reuters) - ").replace("on Wednesday", "on Wednesday (Nov 3)") + \
+    " Additional reporting by Reuters."
+
+UNRELATED = """KUALA LUMPUR: The national football team will play two friendly matches in Dubai next month as part of its preparations for the regional championship, the football association announced on Tuesday. The head coach named a squad of 28 players, including four uncapped youngsters from the under-23 side who impressed during the recent qualifiers. Training camp will begin on the first of the month at the national stadium, before the team flies out a week later. The association said the matches against two Gulf sides would give the players valuable experience against stronger opposition ahead of the tournament. Tickets for the home matches of the championship will go on sale online next week, with prices unchanged from the previous edition. The captain, who missed the last two matches with a hamstring injury, has returned to full training and is expected to lead the side. Supporters have been asked to buy tickets only through the official platform to avoid scams, after several fake websites were reported to the police. The team finished third at the last edition and the coach said the target this time was to reach the final and compete for the title."""
+
+
+def flip_bits(fingerprint, bits):
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def test_simhash():
+    assert word_count(ARTICLE) >= 200
+    assert simhash(ARTICLE) == simhash(ARTICLE)
+    assert 0 <= simhash(ARTICLE) < 1 << SIMHASH_BITS
+
+    assert hamming_distance(simhash(ARTICLE), simhash(REPUBLISHED)) <= MAX_HAMMING_DISTANCE
+    assert hamming_distance(simhash(ARTICLE), simhash(UNRELATED)) > MAX_HAMMING_DISTANCE
+
+
+def test_check_finds_near_duplicates():
+    index = NearDuplicateIndex()
+
+    assert index.check('https://www.channelnewsasia.com/singapore/vaccination-centres', simhash(ARTICLE)) is None
+    assert index.check('https://www.straitstimes.com/singapore/vaccination-centres', simhash(REPUBLISHED)) == \
+        'https://www.channelnewsasia.com/singapore/vaccination-centres'
+    assert index.check('https://www.thestar.com.my/sport/football/friendlies', simhash(UNRELATED)) is None
+
+    # the near-duplicate is not indexed, the article itself is not its own duplicate
+    assert len(index.fingerprints) == 2
+    assert index.find(simhash(ARTICLE), exclude_url='https://www.channelnewsasia.com/singapore/vaccination-centres') is None
+    assert index.duplicates_found == 1
+
+
+def test_bands_cover_every_bit():
+    index = NearDuplicateIndex()
+    fingerprint = simhash(ARTICLE)
+
+    assert len(index.band_slices) == MAX_HAMMING_DISTANCE + 1
+    assert sum(mask.bit_length() for _, mask in index.band_slices) == SIMHASH_BITS
+
+    recombined = 0
+    for (shift, _), value in zip(index.band_slices, index.band_values(fingerprint)):
+        recombined |= value << shift
+    assert recombined == fingerprint
+
+
+def test_find_up_to_max_distance():
+    index = NearDuplicateIndex()
+    fingerprint = simhash(ARTICLE)
+    index.add('https://www.channelnewsasia.com/singapore/vaccination-centres', fingerprint)
+
+    # one flipped bit in each band but the last one, and then in the last one as well
+    first_bits = [shift for shift, _ in index.band_slices]
+    assert index.find(flip_bits(fingerprint, first_bits[:MAX_HAMMING_DISTANCE])) == 'https://www.channelnewsasia.com/singapore/vaccination-centres'
+    assert index.find(flip_bits(fingerprint, first_bits)) is None
+
+
+def test_signed_round_trip():
+    for fingerprint in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+        assert -(1 << 63) <= to_signed(fingerprint) < 1 << 63
+        assert from_signed(to_signed(fingerprint)) == fingerprint
+
+
+def test_reload_from_sqlite(tmp_path):
+    # the sign bit set, stored as a negative sqlite integer
+    fingerprint = simhash(ARTICLE) | 1 << 63
+
+    index = NearDuplicateIndex(str(tmp_path))
+    assert index.check('https://www.channelnewsasia.com/singapore/vaccination-centres', fingerprint) is None
+    index.close()
+
+    reloaded = NearDuplicateIndex(str(tmp_path))
+    assert reloaded.fingerprints == {'https://www.channelnewsasia.com/singapore/vaccination-centres': fingerprint}
+    assert reloaded.check('https://www.straitstimes.com/singapore/vaccination-centres', flip_bits(fingerprint, [0, 20])) == \
+        'https://www.channelnewsasia.com/singapore/vaccination-centres'
+    reloaded.close()
@@ -0,0 +1,40 @@
+# Sitemap filtering of covidnews.discovery
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip('scrapy')
+pytest.importorskip('feedparser')
+pytest.importorskip('dateutil')
+
+from covidnews.dates import DateNormalizer
+from covidnews.discovery import SitemapDiscovery
+
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.thestar.com.my/news/nation/2019/06/02/before-the-pandemic</loc></url>
+  <url><loc>https://www.thestar.com.my/news/nation/2021/02/30/impossible-date</loc></url>
+  <url><loc>https://www.thestar.com.my/news/nation/2021/03/01/movement-control-order</loc><lastmod>2021-03-01</lastmod></url>
+  <url><loc>https://www.thestar.com.my/news/nation/undated-story</loc></url>
+</urlset>
+"""
+
+
+def test_sitemap_urls_outside_the_covid_period_are_skipped():
+    discovery = SitemapDiscovery(DateNormalizer('malaysia'),
+                                 int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()),
+                                 int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp()))
+
+    is_index, entries = discovery.entries(SITEMAP)
+    kept = [loc for loc, lastmod in entries if discovery.keep_url(loc, lastmod)]
+
+    assert not is_index
+    # an impossible day in the url is no url date, the entry is kept and the rest of the sitemap still goes through
+    assert kept == [
+        'https://www.thestar.com.my/news/nation/2021/02/30/impossible-date',
+        'https://www.thestar.com.my/news/nation/2021/03/01/movement-control-order',
+        'https://www.thestar.com.my/news/nation/undated-story',
+    ]
+    assert discovery.counts['skipped_urls'] == 1
@@ -0,0 +1,15 @@
+# covidnews.footnotes against the original remove_footnote() of benchmarks/legacy.py, over the saved corpus
+
+from benchmarks.bench_footnotes import load_corpus, mismatches
+from covidnews.footnotes import remove_footnote
+
+
+def test_same_output_as_the_original_over_the_corpus():
+    corpus, divergences = load_corpus()
+    assert mismatches(corpus, divergences) == []
+
+
+def test_phrase_matched_without_anything_to_cut_keeps_the_article():
+    # the original ended in RecursionError here
+    text = "Body text.\nphilstar.com is one of the most\n\nrest"
+    assert remove_footnote(text) == "Body text.\nphilstar.com is one of the most\n"
@@ -0,0 +1,87 @@
+# Failures of the Mongo pipeline, covidnews.pipelines, with a stand-in client
+
+import pytest
+
+pytest.importorskip('scrapy')
+pytest.importorskip('pymongo')
+
+from pymongo.errors import AutoReconnect, BulkWriteError, OperationFailure
+from scrapy.utils.test import get_crawler
+
+from covidnews.pipelines import MONGO_COLLECTION, MongoPipeline
+
+
+class Collection:
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.batches = []
+
+    def bulk_write(self, operations, ordered):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.batches.append(operations)
+
+
+class Client:
+
+    def __init__(self, errors=()):
+        self.collection = Collection(errors)
+        self.closed = False
+
+    def __getitem__(self, database):
+        return {MONGO_COLLECTION: self.collection}
+
+    def close(self):
+        self.closed = True
+
+
+def mongo_pipeline(client):
+    crawler = get_crawler()
+    crawler.stats.open_spider(None)
+    pipeline = MongoPipeline(lambda: client, max_retries=1, stats=crawler.stats)
+    pipeline.open_store()
+    return pipeline, crawler.stats
+
+
+ITEMS = [{'link': 'https://www.channelnewsasia.com/singapore/booster-shots', 'title': 'Booster shots'}]
+
+
+def test_bulk_write_error_is_counted_and_not_raised():
+    error = BulkWriteError({'writeErrors': [{'index': 0, 'errmsg': 'document too large'}], 'nUpserted': 0, 'nMatched': 0})
+    pipeline, stats = mongo_pipeline(Client([error]))
+
+    pipeline.write_batch(ITEMS)
+
+    assert pipeline.failed_batches == 1
+    assert stats.get_value('mongo/failed_batches') == 1
+    assert stats.get_value('mongo/batches') is None
+
+
+def test_operation_failure_is_counted_and_not_raised():
+    pipeline, stats = mongo_pipeline(Client([OperationFailure('not authorized')]))
+
+    pipeline.write_batch(ITEMS)
+
+    assert stats.get_value('mongo/failed_batches') == 1
+
+
+def test_connection_errors_are_retried(monkeypatch):
+    monkeypatch.setattr('covidnews.pipelines.time.sleep', lambda seconds: None)
+    client = Client([AutoReconnect('primary stepped down')])
+    pipeline, stats = mongo_pipeline(client)
+
+    pipeline.write_batch(ITEMS)
+
+    assert stats.get_value('mongo/retries') == 1
+    assert stats.get_value('mongo/items_upserted') == 1
+    assert len(client.collection.batches) == 1
+
+
+def test_close_store_closes_the_client():
+    client = Client()
+    pipeline, _ = mongo_pipeline(client)
+
+    pipeline.close_store()
+
+    assert client.closed
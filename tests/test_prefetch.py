@@ -0,0 +1,43 @@
+# Dates in article and listing urls, covidnews.prefetch
+
+from datetime import datetime, timezone
+
+import pytest
+
+from covidnews.prefetch import url_path_date
+
+
+def test_url_path_date_of_a_day():
+    start, end = url_path_date('https://www.thestar.com.my/news/nation/2021/02/28/covid-19-cases', timezone.utc)
+    assert start == int(datetime(2021, 2, 28, tzinfo=timezone.utc).timestamp())
+    assert end - start == 24 * 60 * 60
+
+
+def test_url_path_date_of_a_month():
+    start, end = url_path_date('https://www.philstar.com/headlines/2020/12/', timezone.utc)
+    assert (start, end) == (int(datetime(2020, 12, 1, tzinfo=timezone.utc).timestamp()),
+                            int(datetime(2021, 1, 1, tzinfo=timezone.utc).timestamp()))
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.thestar.com.my/news/nation/2021/02/30/covid-19-cases',
+    'https://www.philstar.com/headlines/2022/04/31/',
+])
+def test_url_path_date_of_an_impossible_day(url):
+    assert url_path_date(url, timezone.utc) is None
+
+
+def test_prefetch_scorer_with_an_impossible_url_date():
+    pytest.importorskip('dateutil')
+
+    from covidnews.dates import DateNormalizer
+    from covidnews.prefetch import PREFETCH_LIKELY, PrefetchScorer
+    from covidnews.relevance import KeywordMatcher
+
+    scorer = PrefetchScorer(KeywordMatcher(['covid']), DateNormalizer('malaysia'),
+                            int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()),
+                            int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp()))
+
+    url = 'https://www.thestar.com.my/news/nation/2021/02/30/covid-19-cases'
+    assert not scorer.url_date_outside_period(url)
+    assert scorer.assess(url, 'Covid-19 cases', None)[0] == PREFETCH_LIKELY
@@ -0,0 +1,49 @@
+# `scrapy reextract` over a raw page store, without the Pool of the command
+
+import json
+
+import pytest
+
+pytest.importorskip('scrapy')
+
+from covidnews.commands import reextract
+from covidnews.raw_store import RawPageStore
+from covidnews.spiders.covid_news_spider import CovidNewsSpider
+
+
+ARTICLE_URL = 'https://www.phnompenhpost.com/national/vaccination-centres-extend-opening-hours'
+
+ARTICLE_PAGE = b"""<html><body>
+<div class="section-article-header"><h2>Vaccination centres extend opening hours</h2></div>
+<p>Publication date<br>12 May 2021 | 12:12 ICT</p>
+<p>Vaccination centres will open until 10pm from Monday, the health ministry said.</p>
+<p>People queueing at a vaccination centre. Photo from the Ministry of Health</p>
+<p>More than two million people have received both doses of the covid vaccine.</p>
+<p>Download our app or subscribe to our Telegram channel for the latest updates.</p>
+<p>Copyright 2021 Post Media.</p>
+</body></html>"""
+
+
+def test_reextract_writes_the_cleaned_body(tmp_path, monkeypatch):
+    store = RawPageStore(str(tmp_path / 'raw_pages'))
+    store.put(ARTICLE_URL, ARTICLE_PAGE, {'title': None, 'date': None, 'article_url': ARTICLE_URL},
+              fetched_at=1620820800, encoding='utf-8')
+
+    monkeypatch.setattr(reextract, 'worker_spider', CovidNewsSpider(offline=True, countries='kh'))
+    monkeypatch.setattr(reextract, 'worker_stores', {})
+
+    pages = [dict(page, store=store.directory) for page in RawPageStore(store.directory).pages()]
+    url, relevant_items, num_items, error = reextract.reextract_page(pages[0])
+
+    assert (url, num_items, error) == (ARTICLE_URL, 1, None)
+    assert len(relevant_items) == 1
+
+    # what Command.run() writes for the item
+    output = json.loads(json.dumps(reextract.output_item(relevant_items[0]), ensure_ascii=False))
+
+    assert 'clean_body' not in output
+    assert output['body'].splitlines() == [
+        "Vaccination centres will open until 10pm from Monday, the health ministry said.",
+        "More than two million people have received both doses of the covid vaccine.",
+    ]
+    assert output['keyword_hit_count'] > 0
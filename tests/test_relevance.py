@@ -0,0 +1,43 @@
+# covidnews.relevance.KeywordMatcher with the search keywords of the spider
+
+import pytest
+
+from covidnews.relevance import KeywordMatcher
+
+
+SEARCH_KEYWORDS = ['covid', 'pandemic', 'vaccine', 'coronavirus', 'vaccination', 'SARS-CoV-2']
+
+
+@pytest.fixture(params=[False, True], ids=['exact', 'stemming'])
+def matcher(request):
+    return KeywordMatcher(SEARCH_KEYWORDS, use_stemming=request.param)
+
+
+@pytest.mark.parametrize('text', [
+    'New vaccines arrive',
+    'Lessons of pandemics past',
+    'Vaccinations rise in the north',
+    'Two coronaviruses compared',
+    'COVID-19 cases fall',
+    'COVID19 cases fall',
+    "Singapore's covid rules",
+    'Variant of SARS-CoV-2 detected',
+])
+def test_relevant(matcher, text):
+    assert matcher.is_relevant(text)
+
+
+@pytest.mark.parametrize('text', [
+    'A covidiot at the mall',
+    'Precovid travel habits',
+    'Market update',
+    None,
+])
+def test_not_relevant(matcher, text):
+    assert not matcher.is_relevant(text)
+
+
+def test_plurals_are_counted_as_their_keyword():
+    counts = KeywordMatcher(SEARCH_KEYWORDS).count('Vaccines and vaccinations : covid-19 vaccine drive, not a covidiot')
+
+    assert counts == {'covid': 1, 'pandemic': 0, 'vaccine': 2, 'coronavirus': 0, 'vaccination': 1, 'SARS-CoV-2': 0}
@@ -0,0 +1,126 @@
+# Messages between the shards of `scrapy shardcrawl`, covidnews.sharding
+
+import json
+
+import pytest
+
+pytest.importorskip('scrapy')
+pytest.importorskip('scrapy_splash')
+
+import scrapy
+from scrapy.utils.test import get_crawler
+from scrapy_splash import SplashRequest
+from twisted.internet.error import CannotListenError
+from twisted.internet.testing import StringTransport
+
+from covidnews import sharding
+from covidnews.sharding import ShardProtocol, ShardRouter, decode_request, encode_message, encode_request, merge_stats
+
+
+class ShardSpider(scrapy.Spider):
+    name = 'shard_spider'
+
+    def parse(self, response):
+        pass
+
+
+class Router:
+    token = 'run-token'
+    shard = 1
+
+    def __init__(self):
+        self.messages = []
+
+    def message_received(self, message):
+        self.messages.append(message)
+
+
+def connected_protocol(router):
+    protocol = ShardProtocol()
+    protocol.factory = type('Factory', (), {'router': router, 'connection_made': lambda self, protocol: None})()
+    protocol.makeConnection(StringTransport())
+    return protocol
+
+
+def receive(protocol, message):
+    data = message if isinstance(message, bytes) else encode_message(message)
+    protocol.dataReceived(len(data).to_bytes(4, 'big') + data)
+
+
+def test_splash_request_survives_the_json_hand_over():
+    spider = ShardSpider()
+    request = SplashRequest('https://www.straitstimes.com/singapore/health/booster-shots', callback=spider.parse,
+                            meta={'country': 'singapore', 'fetch_tier': 'splash', 'listing_depth': 2},
+                            endpoint='execute', args={'lua_source': 'function main(splash) end', 'wait': 10},
+                            headers={'User-Agent': 'Mozilla/5.0'}, priority=200)
+
+    received = decode_request(json.loads(encode_message(['request', encode_request(request, spider)]))[1], spider)
+
+    assert type(received) is SplashRequest
+    assert received.url == request.url
+    assert received.callback == spider.parse
+    assert received.priority == 200
+    assert received.headers[b'User-Agent'] == b'Mozilla/5.0'
+    assert received.meta['country'] == 'singapore'
+    assert received.meta['splash']['args']['lua_source'] == 'function main(splash) end'
+
+
+def test_connection_without_the_token_is_closed():
+    router = Router()
+    protocol = connected_protocol(router)
+
+    receive(protocol, ['request', {'url': 'https://example.com/'}])
+
+    assert protocol.transport.disconnecting
+    assert router.messages == []
+
+
+def test_pickles_are_not_loaded():
+    router = Router()
+    protocol = connected_protocol(router)
+
+    receive(protocol, b'\x80\x04\x95\x05\x00\x00\x00\x00\x00\x00\x00\x8c\x01a\x94.')
+
+    assert protocol.transport.disconnecting
+    assert router.messages == []
+
+
+def test_messages_after_the_token_are_received():
+    router = Router()
+    protocol = connected_protocol(router)
+
+    receive(protocol, ['hello', 'run-token'])
+    receive(protocol, ['status', 0, True, 3, 2])
+
+    assert not protocol.transport.disconnecting
+    assert router.messages == [['status', 0, True, 3, 2]]
+
+
+def test_shard_closes_when_its_port_is_taken(monkeypatch):
+    crawler = get_crawler(ShardSpider)
+    crawler.spider = spider = ShardSpider(shard=0, shards=2)
+    crawler.engine = type('Engine', (), {'close_spider': lambda self, spider, reason: None})()
+    router = ShardRouter.from_crawler(crawler)
+
+    def listen_tcp(port, factory, interface):
+        raise CannotListenError(interface, port, OSError('Address already in use'))
+
+    scheduled = []
+    monkeypatch.setattr(sharding.reactor, 'listenTCP', listen_tcp)
+    monkeypatch.setattr(sharding.reactor, 'callLater', lambda delay, function, *args: scheduled.append((function, args)))
+
+    router.spider_opened(spider)
+
+    assert scheduled == [(crawler.engine.close_spider, (spider, 'shard_port_unavailable'))]
+    assert list(router.route([scrapy.Request('https://www.straitstimes.com/')], spider)) == []
+
+
+def test_merge_stats():
+    merged = merge_stats([
+        {'item_scraped_count': 3, 'start_time': '2026-10-17 10:00:01', 'finish_reason': 'finished', 'elapsed_time_seconds': 10.0},
+        {'item_scraped_count': 4, 'start_time': '2026-10-17 10:00:00', 'finish_reason': 'shutdown', 'elapsed_time_seconds': 12.0},
+        {'item_scraped_count': 1, 'finish_reason': 'finished'},
+    ])
+
+    assert merged == {'item_scraped_count': 8, 'start_time': '2026-10-17 10:00:00',
+                      'finish_reason': 'finished, shutdown', 'elapsed_time_seconds': 12.0}
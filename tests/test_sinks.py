@@ -0,0 +1,46 @@
+# Incremental recrawl answers of the article sinks, covidnews.sinks
+
+import json
+
+from covidnews.article_index import MANIFEST_FILENAME, ArticleIndex
+from covidnews.sinks import FilePerArticleSink, SegmentSink
+
+
+LINK = 'https://www.straitstimes.com/singapore/health/booster-shots'
+
+
+def test_segment_sink_touch_keeps_an_unchanged_article_fresh(tmp_path):
+    sink = SegmentSink(str(tmp_path), max_age=60)
+    sink.write(LINK, 'Booster shots', None, 'Booster shots for all adults.')
+    sink.db.execute("UPDATE articles SET written_at = 0")
+    sink.close()
+
+    sink = SegmentSink(str(tmp_path), max_age=60)
+    assert not sink.is_fresh(LINK)
+    assert sink.is_unchanged(LINK, 'Booster shots for all adults.')
+
+    sink.touch(LINK)
+    sink.close()
+
+    sink = SegmentSink(str(tmp_path), max_age=60)
+    assert sink.is_fresh(LINK)
+    sink.close()
+
+
+def test_article_index_touch_keeps_an_unchanged_article_fresh(tmp_path):
+    directory = str(tmp_path) + '/'
+    sink = FilePerArticleSink(directory, ArticleIndex(directory, max_age=60))
+    sink.write(LINK, 'Booster shots', None, 'Booster shots for all adults.')
+
+    # written long ago
+    manifest = tmp_path / MANIFEST_FILENAME
+    manifest.write_text(json.dumps(dict(json.loads(manifest.read_text()), written_at=0)) + '\n')
+
+    index = ArticleIndex(directory, max_age=60)
+    assert not index.is_fresh(LINK)
+    assert index.is_unchanged(LINK, 'Booster shots for all adults.')
+
+    index.touch(LINK)
+
+    # the manifest keeps the new write time for the next run
+    assert ArticleIndex(directory, max_age=60).is_fresh(LINK)